@@ -9,6 +9,28 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from mathalgo2.algorithm.graph.all_pairs import distance_matrix
+from mathalgo2.algorithm.graph.analytics import (
+    connected_components,
+    minimum_spanning_tree,
+    strongly_connected_components,
+    topological_sort,
+)
+from mathalgo2.algorithm.graph.centrality import (
+    betweenness_centrality,
+    closeness_centrality,
+    degree_centrality,
+    pagerank,
+)
+from mathalgo2.algorithm.graph.csr import CSRGraph
+from mathalgo2.algorithm.graph.io import load_graph
+from mathalgo2.algorithm.graph.landmarks import LandmarkIndex
+from mathalgo2.algorithm.graph.parallel import delta_stepping as parallel_delta_stepping
+from mathalgo2.algorithm.graph.parallel import parallel_bfs
+from mathalgo2.algorithm.graph.paths import astar as csr_astar
+from mathalgo2.algorithm.graph.paths import dijkstra as csr_dijkstra
+from mathalgo2.algorithm.graph.paths import shortest_path as csr_shortest_path
+from mathalgo2.algorithm.graph.traversal import bfs_levels as csr_bfs_levels
 from mathalgo2.Logger import Logger, logging
 
 """
@@ -18,11 +40,13 @@
 
 ## 主要功能
 - 深度優先搜尋 (DFS)
-- 廣度優先搜尋 (BFS)
+- 廣度優先搜尋 (BFS) 與分層 BFS
 - 最短路徑算法 (Dijkstra)
-- 最小生成樹 [待實現]
-- 拓撲排序 [待實現]
-- 強連通分量 [待實現]
+- 啟發式最短路徑 (A*)
+- 連通分量與強連通分量
+- 拓撲排序
+- 最小生成樹 (Kruskal / Prim)
+- PageRank 與中心性指標
 
 每個演算法都提供:
 - 基本功能實作
@@ -70,9 +94,13 @@ class GraphAlgo(Algorithm):
 
     實作各種圖論演算法並提供視覺化功能。
 
+    由 CSRGraph 建立時以 CSR 作為主要儲存，graph 與 weights 字典只在第一次
+    存取時才建立；在此之前 dfs、bfs、dijkstra 與 astar 不含回調和視覺化的
+    呼叫都直接在 CSR 上執行。
+
     Attributes:
         graph (Dict[Any, List[Any]]): 圖的鄰接表表示
-        weights (Dict[Tuple[Any, Any], float]): 邊的權重
+        weights (Dict[Tuple[Any, Any], float]): 邊的權重，未列出的邊權重為 1.0
         colors (Dict[Any, str]): 節點顏色映射，用於視覺化
         pos (Dict): 節點位置映射，用於視覺化
         fig (Figure): matplotlib 圖形物件
@@ -84,22 +112,35 @@ class GraphAlgo(Algorithm):
 
     def __init__(
         self,
-        graph: Dict[Any, List[Any]],
+        graph: Union[Dict[Any, List[Any]], CSRGraph],
         weights: Dict[Tuple[Any, Any], float] = None,
         animation_speed: float = 0.5,
     ):
         """初始化圖論演算法類別
 
         Args:
-            graph: 以鄰接表形式表示的圖，key為節點，value為相鄰節點列表
-            weights: 邊的權重字典，key為(u,v)表示邊，value為權重
+            graph: 以鄰接表形式表示的圖，key為節點，value為相鄰節點列表；
+                也可以是 CSRGraph，此時權重取自 CSR，weights 必須為 None
+            weights: 邊的權重字典，key為(u,v)表示邊，value為權重；未列出的邊權重為1.0
             animation_speed: 視覺化動畫速度，預設0.5秒
+
+        Raises:
+            ValueError: 以 CSRGraph 建立又指定 weights 時
         """
         super().__init__()
-        self.graph = graph
-        self.weights = (
-            weights if weights else {(u, v): 1.0 for u in graph for v in graph[u]}
-        )
+        if isinstance(graph, CSRGraph):
+            if weights:
+                raise ValueError("以 CSRGraph 建立時權重取自 CSR，不能另外指定 weights")
+            # 字典視圖延遲到第一次存取 graph 或 weights 時才建立
+            self._graph = None
+            self._weights = None
+            self._csr = graph
+            num_nodes = graph.num_nodes
+        else:
+            self._graph = graph
+            self._weights = weights if weights else {}
+            self._csr = None  # CSR 表示的快取，由 to_csr() 建立
+            num_nodes = len(graph)
         self.colors = {}  # 節點顏色映射
         self.pos = None  # 節點位置映射
         self.fig = None
@@ -123,7 +164,80 @@ def __init__(
             "path": "yellow",
         }
 
-        self.logger.info(f"初始化圖論類別，節點數: {len(graph)}")
+        self.logger.info(f"初始化圖論類別，節點數: {num_nodes}")
+
+    @property
+    def graph(self) -> Dict[Any, List[Any]]:
+        """鄰接表；以 CSR 建立時在第一次存取才由 CSR 轉換"""
+        if self._graph is None:
+            self._materialize()
+        return self._graph
+
+    @graph.setter
+    def graph(self, graph: Dict[Any, List[Any]]):
+        if self._graph is None:
+            self._materialize()
+        self._graph = graph
+
+    @property
+    def weights(self) -> Dict[Tuple[Any, Any], float]:
+        """邊的權重字典；以 CSR 建立時在第一次存取才由 CSR 轉換"""
+        if self._weights is None:
+            self._materialize()
+        return self._weights
+
+    @weights.setter
+    def weights(self, weights: Dict[Tuple[Any, Any], float]):
+        if self._weights is None:
+            self._materialize()
+        self._weights = weights
+
+    def _materialize(self):
+        """由 CSR 建立 graph 與 weights 字典視圖"""
+        self._graph, self._weights = self._csr.to_dict()
+        self.logger.info(f"由CSR建立鄰接表，節點數: {len(self._graph)}")
+
+    def _csr_only(self, callback: Optional[Callable[[Any], None]] = None) -> bool:
+        """是否可以直接在 CSR 上執行: 尚未建立字典視圖，且沒有回調與視覺化"""
+        return self._graph is None and callback is None and self.fig is None
+
+    def _has_node(self, node: Any) -> bool:
+        """節點是否在圖中，字典視圖尚未建立時查詢 CSR"""
+        if self._graph is not None:
+            return node in self._graph
+        try:
+            self._csr.node_id(node)
+        except KeyError:
+            return False
+        return True
+
+    @classmethod
+    def from_csr(cls, csr: CSRGraph, animation_speed: float = 0.5) -> "GraphAlgo":
+        """由 CSR 圖建立 GraphAlgo，以該 CSR 作為主要儲存
+
+        不會轉換為字典；graph 與 weights 在第一次存取時才建立。
+
+        Args:
+            csr: CSR 圖
+            animation_speed: 視覺化動畫速度
+
+        Returns:
+            GraphAlgo: 新的圖論演算法實例
+        """
+        return cls(csr, animation_speed=animation_speed)
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path], **kwargs) -> "GraphAlgo":
+        """從邊列表、Matrix Market 或二進位圖檔案載入
+
+        Args:
+            path: 檔案路徑，格式依副檔名判斷（見 graph.io.load_graph）
+            **kwargs: 傳給載入函數的參數
+
+        Returns:
+            GraphAlgo: 新的圖論演算法實例
+        """
+        return cls.from_csr(load_graph(path, **kwargs))
 
     def _validate_start_node(self, start: Any):
         """驗證起始節點是否有效
@@ -134,10 +248,31 @@ def _validate_start_node(self, start: Any):
         Raises:
             KeyError: 當起始節點不在圖中時
         """
-        if start not in self.graph:
+        if not self._has_node(start):
             self.logger.error(f"起始節點 {start} 不在圖中")
             raise KeyError(f"節點 {start} 不存在")
 
+    def to_csr(self, refresh: bool = False) -> CSRGraph:
+        """將圖轉換為 CSR 表示
+
+        CSR 表示以整數編號與 NumPy 陣列儲存鄰接關係與權重，
+        供 mathalgo2.algorithm.graph 中不含視覺化的演算法使用。
+        結果會被快取，修改 graph 或 weights 後需以 refresh=True 重新建立；
+        由 CSR 建立且尚未存取字典視圖時，CSR 即為唯一的資料，不需要重建。
+
+        Args:
+            refresh: 是否忽略快取重新建立
+
+        Returns:
+            CSRGraph: 圖的 CSR 表示
+        """
+        if self._csr is None or (refresh and self._graph is not None):
+            self._csr = CSRGraph.from_dict(self.graph, self.weights)
+            self.logger.info(
+                f"建立CSR表示，節點數: {self._csr.num_nodes}，邊數: {self._csr.num_edges}"
+            )
+        return self._csr
+
     def _init_visualization(self, algorithm_name: str):
         """初始化視覺化設定
 
@@ -176,6 +311,17 @@ def dijkstra(
             self._validate_start_node(start)
             self.logger.info(f"開始Dijkstra算法，起始節點: {start}")
 
+            if self._csr_only():
+                csr = self._csr
+                targets = None if end is None else [csr.node_id(end)]
+                dist, pred = csr_dijkstra(csr, csr.node_id(start), targets)
+                labels = csr.to_labels(range(csr.num_nodes))
+                self.logger.info("Dijkstra算法完成")
+                return dict(zip(labels, dist.tolist())), {
+                    label: None if p < 0 else labels[p]
+                    for label, p in zip(labels, pred.tolist())
+                }
+
             distances = {node: float("infinity") for node in self.graph}
             distances[start] = 0
             predecessors = {node: None for node in self.graph}
@@ -244,12 +390,191 @@ def get_shortest_path(self, start: Any, end: Any) -> Tuple[List[Any], float]:
 
         return path, distances[end]
 
+    def astar(
+        self,
+        start: Any,
+        end: Any,
+        heuristic: Union[Callable[[Any, Any], float], LandmarkIndex, None] = None,
+    ) -> Tuple[List[Any], float]:
+        """A* 最短路徑演算法
+
+        原理: 以 g(n) + h(n) 作為優先權擴展節點，h(n) 為節點到終點距離的估計。
+        當 h 可採納且一致時，找到的路徑即為最短路徑，且擴展的節點比 Dijkstra 少。
+        時間複雜度: 最差 O((V + E)logV)，實際取決於啟發函數的品質
+
+        Args:
+            start: 起始節點
+            end: 目標節點
+            heuristic: 啟發函數 heuristic(node, end) -> float，或由 to_csr()
+                建立的 LandmarkIndex（使用 ALT 下界）；None 時退化為 Dijkstra
+
+        Returns:
+            (path, distance): 最短路徑列表和總距離，不可達時為 ([], inf)
+
+        Raises:
+            KeyError: 當起始或目標節點不在圖中時
+        """
+        try:
+            self._validate_start_node(start)
+            if not self._has_node(end):
+                raise KeyError(f"節點 {end} 不存在")
+            self.logger.info(f"開始A*算法，起始節點: {start}，目標節點: {end}")
+
+            if self._csr_only():
+                return self._csr_astar(start, end, heuristic)
+
+            if isinstance(heuristic, LandmarkIndex):
+                csr = self.to_csr()
+                heuristic.check_graph(csr)
+                bound = heuristic.heuristic(csr.node_id(end))
+                h = lambda node, target: bound(csr.node_id(node))  # noqa: E731
+            else:
+                h = heuristic or (lambda node, target: 0.0)
+
+            distances = {start: 0.0}
+            predecessors = {start: None}
+            pq = [(h(start, end), 0.0, start)]
+            visited = set()
+
+            while pq:
+                _, current_distance, current = heapq.heappop(pq)
+
+                if current in visited:
+                    continue
+
+                visited.add(current)
+                self.colors[current] = self.node_colors["visiting"]
+
+                if self.fig is not None:
+                    self._update_graph_plot()
+
+                if current == end:
+                    break
+
+                for neighbor in self.graph[current]:
+                    if neighbor in visited:
+                        continue
+
+                    weight = self.weights.get((current, neighbor))
+                    if weight is None:
+                        weight = self.weights.get((neighbor, current), 1.0)
+                    distance = current_distance + weight
+
+                    if distance < distances.get(neighbor, float("infinity")):
+                        distances[neighbor] = distance
+                        predecessors[neighbor] = current
+                        heapq.heappush(
+                            pq, (distance + h(neighbor, end), distance, neighbor)
+                        )
+
+                self.colors[current] = self.node_colors["visited"]
+
+            self.logger.info(f"A*算法完成，擴展節點數: {len(visited)}")
+
+            if end not in visited:
+                return [], float("infinity")
+
+            path = []
+            current = end
+            while current is not None:
+                path.append(current)
+                current = predecessors[current]
+            path.reverse()
+            return path, distances[end]
+
+        except Exception as e:
+            self.logger.exception(f"A*算法執行出錯: {str(e)}")
+            raise
+
+    def _csr_astar(
+        self,
+        start: Any,
+        end: Any,
+        heuristic: Union[Callable[[Any, Any], float], LandmarkIndex, None],
+    ) -> Tuple[List[Any], float]:
+        """在 CSR 上執行 A*，啟發函數轉換為以節點編號為參數"""
+        csr = self._csr
+        target = csr.node_id(end)
+        if isinstance(heuristic, LandmarkIndex):
+            heuristic.check_graph(csr)
+            h = heuristic.heuristic(target)
+        elif heuristic is not None:
+            h = lambda node: heuristic(csr.node_label(node), end)  # noqa: E731
+        else:
+            h = None
+        stats: Dict[str, int] = {}
+        distance, path = csr_astar(csr, csr.node_id(start), target, h, stats)
+        self.logger.info(f"A*算法完成，擴展節點數: {stats.get('settled', 0)}")
+        if not len(path):
+            return [], float("infinity")
+        return csr.to_labels(path.tolist()), distance
+
+    def fast_shortest_path(
+        self, start: Any, end: Any, bidirectional: bool = False
+    ) -> Tuple[List[Any], float]:
+        """不含視覺化的點對點最短路徑
+
+        在 to_csr() 建立的 CSR 表示上以整數編號與陣列距離執行 Dijkstra，
+        不寫入 colors、不檢查 fig，並在確定終點距離後立即停止。
+        bidirectional=True 時改用雙向 Dijkstra。
+
+        Args:
+            start: 起始節點
+            end: 目標節點
+            bidirectional: 是否使用雙向搜尋
+
+        Returns:
+            (path, distance): 最短路徑列表和總距離，不可達時為 ([], inf)
+
+        Raises:
+            KeyError: 當起始或目標節點不在圖中時
+        """
+        self._validate_start_node(start)
+        csr = self.to_csr()
+        distance, path = csr_shortest_path(
+            csr, csr.node_id(start), csr.node_id(end), bidirectional=bidirectional
+        )
+        return csr.to_labels(path), distance
+
+    def distance_table(
+        self,
+        sources: List[Any],
+        targets: Optional[List[Any]] = None,
+        workers: Optional[int] = None,
+    ) -> np.ndarray:
+        """批次計算多對多最短距離表
+
+        取代對每組節點重複呼叫 get_shortest_path：每個來源只執行一次
+        Dijkstra，並由進程池在共享記憶體中的 CSR 陣列上並行計算。
+
+        Args:
+            sources: 來源節點列表
+            targets: 目標節點列表，預設為所有節點（依 to_csr().labels 的順序）
+            workers: 進程數，None 表示使用所有 CPU 核心，0 表示不使用進程池
+
+        Returns:
+            np.ndarray: 形狀為 (len(sources), len(targets)) 的距離矩陣，不可達為 inf
+
+        Raises:
+            KeyError: 當節點不在圖中時
+        """
+        csr = self.to_csr()
+        source_ids = [csr.node_id(node) for node in sources]
+        target_ids = None if targets is None else [csr.node_id(n) for n in targets]
+        self.logger.info(
+            f"開始計算距離表，來源數: {len(source_ids)}，"
+            f"目標數: {csr.num_nodes if targets is None else len(target_ids)}"
+        )
+        return distance_matrix(csr, source_ids, target_ids, workers=workers)
+
     def dfs(
         self, start: Any, callback: Optional[Callable[[Any], None]] = None
     ) -> List[Any]:
         """深度優先搜尋演算法
 
         原理: 從起始節點開始，盡可能深地搜尋圖的分支
+        以顯式堆疊保存 (節點, 鄰居迭代器)，訪問順序與遞迴版本相同，
+        但不受 Python 遞迴深度限制。
         時間複雜度: O(V + E) - V為節點數，E為邊數
         空間複雜度: O(V) - 需要額外空間存儲訪問狀態
 
@@ -264,13 +589,17 @@ def dfs(
             self._validate_start_node(start)
             self.logger.info(f"開始DFS搜尋，起始節點: {start}")
 
+            if self._csr_only(callback):
+                result = self._csr.dfs(start)
+                self.logger.info(f"DFS搜尋完成，訪問節點數: {len(result)}")
+                return result
+
             visited = set()
             result = []
 
-            def _dfs_helper(vertex: Any):
+            def _visit(vertex: Any):
                 visited.add(vertex)
                 result.append(vertex)
-                self.logger.debug(f"訪問節點: {vertex}")
                 self.colors[vertex] = self.node_colors["visiting"]
 
                 if callback:
@@ -279,15 +608,21 @@ def _dfs_helper(vertex: Any):
                 if self.fig is not None:
                     self._update_graph_plot()
 
-                for neighbor in self.graph[vertex]:
+            _visit(start)
+            stack = [(start, iter(self.graph[start]))]
+            while stack:
+                vertex, neighbors = stack[-1]
+                for neighbor in neighbors:
                     if neighbor not in visited:
-                        self.logger.debug(f"從 {vertex} 訪問鄰居節點 {neighbor}")
-                        _dfs_helper(neighbor)
-
-                self.colors[vertex] = self.node_colors["visited"]
-
-            _dfs_helper(start)
-            self.logger.info(f"DFS搜尋完成，訪問順序: {result}")
+                        _visit(neighbor)
+                        stack.append((neighbor, iter(self.graph[neighbor])))
+                        break
+                else:
+                    # 所有鄰居都已處理，回溯
+                    stack.pop()
+                    self.colors[vertex] = self.node_colors["visited"]
+
+            self.logger.info(f"DFS搜尋完成，訪問節點數: {len(result)}")
             return result
 
         except Exception as e:
@@ -313,6 +648,7 @@ def bfs(
         時間複雜度: O(V + E)
         - V: 節點數，每個節點都需要訪問一次
         - E: 邊數，每條邊都需要檢查一次
+        - 迴圈內不做逐節點的日誌格式化，只在開始與結束時輸出摘要
 
         空間複雜度: O(V)
         - 需要額外空間存儲訪問狀態集合(visited)
@@ -340,38 +676,27 @@ def bfs(
             self._validate_start_node(start)
             perf_start = datetime.now()
             self.logger.info(f"開始BFS搜尋，起始節點: {start}")
-            self.logger.debug(f"圖的結構: {self.graph}")
+
+            if self._csr_only(callback):
+                result = self._csr.bfs(start)
+                self.logger.info(f"BFS搜尋完成，訪問節點數: {len(result)}")
+                return result
 
             visited = {start}  # 使用集合記錄已訪問的節點，保證O(1)的查詢時間
             result = []  # 存儲訪問順序的列表
             queue = deque([start])  # 使用雙端佇列實現FIFO，支援O(1)的頭尾操作
 
-            self.logger.debug("初始化完成:")
-            self.logger.debug(f"- 已訪問節點集合: {visited}")
-            self.logger.debug(f"- 初始佇列狀態: {list(queue)}")
-            self.logger.debug(f"- 訪問順序列表: {result}")
-
             # 主要搜尋迴圈 - 當佇列非空時持續執行
-            iteration = 0
             while queue:
-                iteration += 1
-                self.logger.debug(f"\n=== 迭代 {iteration} 開始 ===")
-
                 # 從佇列前端取出當前要訪問的節點
                 vertex = queue.popleft()
                 result.append(vertex)
-                self.logger.debug(f"從佇列取出節點: {vertex}")
-                self.logger.debug(f"當前佇列狀態: {list(queue)}")
 
                 # 更新節點視覺化狀態為正在訪問
                 self.colors[vertex] = self.node_colors["visiting"]
-                self.logger.debug(
-                    f"將節點 {vertex} 標記為正在訪問狀態 (顏色: {self.node_colors['visiting']})"
-                )
 
                 # 如果提供了回調函數，執行自定義處理
                 if callback:
-                    self.logger.debug(f"對節點 {vertex} 執行使用者提供的回調函數")
                     try:
                         callback(vertex)
                     except Exception as e:
@@ -380,29 +705,16 @@ def bfs(
 
                 # 更新視覺化顯示
                 if self.fig is not None:
-                    self.logger.debug("更新圖形視覺化顯示")
                     self._update_graph_plot()
 
                 # 處理當前節點的所有相鄰節點
-                neighbors = self.graph[vertex]
-                self.logger.debug(f"節點 {vertex} 的相鄰節點列表: {neighbors}")
-
-                for neighbor in neighbors:
+                for neighbor in self.graph[vertex]:
                     if neighbor not in visited:
                         visited.add(neighbor)
                         queue.append(neighbor)
-                        self.logger.debug(f"發現未訪問的相鄰節點 {neighbor}:")
-                        self.logger.debug(f"- 加入已訪問集合: {visited}")
-                        self.logger.debug(f"- 加入佇列: {list(queue)}")
-                    else:
-                        self.logger.debug(f"相鄰節點 {neighbor} 已被訪問，跳過")
 
                 # 更新節點視覺化狀態為已訪問
                 self.colors[vertex] = self.node_colors["visited"]
-                self.logger.debug(
-                    f"將節點 {vertex} 標記為已訪問狀態 (顏色: {self.node_colors['visited']})"
-                )
-                self.logger.debug(f"=== 迭代 {iteration} 結束 ===\n")
 
             # 搜尋完成，輸出統計信息
             perf_end = datetime.now()
@@ -410,8 +722,6 @@ def bfs(
             self.logger.info(f"BFS搜尋完成:")
             self.logger.info(f"- 執行時間: {duration:.3f} 秒")
             self.logger.info(f"- 訪問節點數: {len(result)}")
-            self.logger.info(f"- 訪問順序: {result}")
-            self.logger.debug(f"- 最終已訪問集合: {visited}")
 
             return result
 
@@ -419,6 +729,184 @@ def bfs(
             self.logger.exception(f"BFS搜尋執行出錯: {str(e)}")
             raise
 
+    def bfs_levels(self, start: Any, workers: Optional[int] = 0) -> Dict[Any, int]:
+        """逐層同步的 BFS，返回每個可達節點的層數（與起點的邊數距離）
+
+        在 CSR 表示上以整層前緣陣列向量化擴展，不經過視覺化與回調，
+        適合大型圖。workers 不為 0 時改用多進程的方向最佳化 BFS。
+
+        Args:
+            start: 起始節點
+            workers: 進程數，0 表示單進程，None 表示使用所有 CPU 核心
+
+        Returns:
+            Dict[Any, int]: 可達節點對應的層數，起點為 0
+
+        Raises:
+            KeyError: 當起始節點不在圖中時
+        """
+        self._validate_start_node(start)
+        csr = self.to_csr()
+        if workers == 0:
+            depth = csr_bfs_levels(csr, csr.node_id(start))
+        else:
+            depth = parallel_bfs(csr, csr.node_id(start), workers=workers)
+        reached = np.flatnonzero(depth >= 0)
+        self.logger.info(f"BFS分層完成，可達節點數: {len(reached)}，最大層數: {depth.max()}")
+        return dict(zip(csr.to_labels(reached), depth[reached].tolist()))
+
+    def delta_stepping(
+        self, start: Any, delta: Optional[float] = None, workers: Optional[int] = 0
+    ) -> Dict[Any, float]:
+        """多進程的 Δ-stepping 單源最短路徑，適合大型加權圖
+
+        Args:
+            start: 起始節點
+            delta: 桶寬，None 時自動選擇
+            workers: 進程數，0 表示單進程，None 表示使用所有 CPU 核心
+
+        Returns:
+            Dict[Any, float]: 可達節點到起點的最短距離
+
+        Raises:
+            KeyError: 當起始節點不在圖中時
+        """
+        self._validate_start_node(start)
+        csr = self.to_csr()
+        dist = parallel_delta_stepping(csr, csr.node_id(start), delta, workers)
+        reached = np.flatnonzero(np.isfinite(dist))
+        self.logger.info(f"Δ-stepping完成，可達節點數: {len(reached)}")
+        return dict(zip(csr.to_labels(reached), dist[reached].tolist()))
+
+    def _group_labels(self, csr: CSRGraph, labels: np.ndarray) -> List[List[Any]]:
+        """依分量編號把節點標籤分組，組內保持節點編號順序"""
+        order = np.argsort(labels, kind="stable")
+        boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+        return [csr.to_labels(group) for group in np.split(order, boundaries)]
+
+    def connected_components(self) -> List[List[Any]]:
+        """連通分量（有向邊視為無向邊）
+
+        Returns:
+            List[List[Any]]: 每個分量的節點列表
+        """
+        csr = self.to_csr()
+        components = self._group_labels(csr, connected_components(csr))
+        self.logger.info(f"連通分量計算完成，分量數: {len(components)}")
+        return components
+
+    def strongly_connected_components(self) -> List[List[Any]]:
+        """Tarjan 強連通分量
+
+        Returns:
+            List[List[Any]]: 每個強連通分量的節點列表，依縮點後的逆拓撲順序排列
+        """
+        csr = self.to_csr()
+        components = self._group_labels(csr, strongly_connected_components(csr))
+        self.logger.info(f"強連通分量計算完成，分量數: {len(components)}")
+        return components
+
+    def topological_sort(self) -> List[Any]:
+        """Kahn 拓撲排序
+
+        Returns:
+            List[Any]: 拓撲順序的節點列表
+
+        Raises:
+            ValueError: 圖中存在環時
+        """
+        try:
+            csr = self.to_csr()
+            order = csr.to_labels(topological_sort(csr))
+            self.logger.info(f"拓撲排序完成，節點數: {len(order)}")
+            return order
+        except ValueError as e:
+            self.logger.error(f"拓撲排序失敗: {str(e)}")
+            raise
+
+    def minimum_spanning_tree(
+        self, method: str = "kruskal"
+    ) -> Tuple[List[Tuple[Any, Any, float]], float]:
+        """最小生成樹（圖不連通時為最小生成森林），邊視為無向邊
+
+        Args:
+            method: "kruskal" 或 "prim"
+
+        Returns:
+            (edges, total_weight): 生成樹的邊 (u, v, weight) 列表與總權重
+        """
+        csr = self.to_csr()
+        src, dst, weights = minimum_spanning_tree(csr, method)
+        edges = list(zip(csr.to_labels(src), csr.to_labels(dst), weights.tolist()))
+        total = float(weights.sum())
+        self.logger.info(f"最小生成樹計算完成，邊數: {len(edges)}，總權重: {total}")
+        return edges, total
+
+    def pagerank(
+        self,
+        damping: float = 0.85,
+        personalization: Optional[Dict[Any, float]] = None,
+        tol: float = 1e-6,
+        max_iter: int = 100,
+    ) -> Dict[Any, float]:
+        """PageRank 節點重要性（稀疏冪迭代）
+
+        Args:
+            damping: 阻尼係數
+            personalization: 節點對應的個人化權重，未列出的節點為 0
+            tol: 收斂容差
+            max_iter: 最大迭代次數
+
+        Returns:
+            Dict[Any, float]: 每個節點的 PageRank 分數
+
+        Raises:
+            RuntimeError: 未在 max_iter 次迭代內收斂時
+        """
+        csr = self.to_csr()
+        vector = None
+        if personalization is not None:
+            vector = np.zeros(csr.num_nodes)
+            for node, value in personalization.items():
+                vector[csr.node_id(node)] = value
+        ranks = pagerank(csr, damping, vector, tol=tol, max_iter=max_iter)
+        self.logger.info(f"PageRank計算完成，節點數: {csr.num_nodes}")
+        return dict(zip(csr.to_labels(range(csr.num_nodes)), ranks.tolist()))
+
+    def centrality(
+        self,
+        measure: str = "degree",
+        k: Optional[int] = None,
+        seed: Optional[int] = None,
+        workers: Optional[int] = 0,
+    ) -> Dict[Any, float]:
+        """節點中心性
+
+        Args:
+            measure: "degree"、"closeness" 或 "betweenness"
+            k: 介數中心性抽樣的來源數，None 表示精確計算
+            seed: 抽樣的隨機種子
+            workers: 介數中心性與有權接近中心性的進程數，0 表示在目前進程中計算
+
+        Returns:
+            Dict[Any, float]: 每個節點的中心性
+
+        Raises:
+            ValueError: 不支援的中心性指標
+        """
+        csr = self.to_csr()
+        if measure == "degree":
+            values = degree_centrality(csr)
+        elif measure == "closeness":
+            values = closeness_centrality(csr, workers=workers)
+        elif measure == "betweenness":
+            values = betweenness_centrality(csr, k=k, seed=seed, workers=workers)
+        else:
+            self.logger.error(f"不支援的中心性指標: {measure}")
+            raise ValueError(f"不支援的中心性指標: {measure}")
+        self.logger.info(f"{measure}中心性計算完成，節點數: {csr.num_nodes}")
+        return dict(zip(csr.to_labels(range(csr.num_nodes)), values.tolist()))
+
     def visualize(
         self,
         algorithm: str = "dfs",
@@ -439,7 +927,7 @@ def visualize(
             self._init_visualization(algorithm.upper())
 
             if start is None:
-                start = list(self.graph.keys())[0]
+                start = next(iter(self.graph))
 
             if algorithm.lower() == "dfs":
                 self.dfs(start, callback)
@@ -1,10 +1,172 @@
-from typing import Any, Dict, List, Optional, Type
+import numbers
+import sys
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Type, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
 
 from mathalgo2.Logger import Logger, logging
 
+# 批次查詢的目標數超過此值時先排序目標，讓二分搜尋沿著 keys 單向前進，
+# 大幅減少快取未命中
+_SORT_TARGETS_MIN = 4096
+
+
+def exponential_search(source: Sequence[Any], target: Any) -> Optional[int]:
+    """指數搜尋，適用於長度未知或無界的已排序來源
+
+    以 1, 2, 4, ... 的位置探測，直到越過目標或來源結尾（索引時拋出 IndexError），
+    再於最後一段區間內二分搜尋。不需要 len()，只需支援整數索引，
+    因此可用於惰性展開的串流或 mmap 類的來源。
+
+    時間複雜度: O(log i)，i 為目標所在的位置
+
+    Args:
+        source: 升序排列、支援整數索引的來源
+        target: 要搜尋的目標值
+
+    Returns:
+        Optional[int]: 目標值第一次出現的索引，如果未找到則返回None
+    """
+    try:
+        if source[0] == target:
+            return 0
+    except IndexError:
+        return None
+
+    bound = 1
+    while True:
+        try:
+            value = source[bound]
+        except IndexError:
+            break
+        if value >= target:
+            break
+        bound *= 2
+
+    # 第一次出現只可能落在 (bound / 2, bound]，以下界二分搜尋找出最左的位置；
+    # 越過結尾的位置視為大於目標
+    left, right = bound // 2 + 1, bound + 1
+    while left < right:
+        mid = (left + right) // 2
+        try:
+            below = source[mid] < target
+        except IndexError:
+            below = False
+        if below:
+            left = mid + 1
+        else:
+            right = mid
+    try:
+        return left if source[left] == target else None
+    except IndexError:
+        return None
+
+
+# auto 策略: 數組長度不超過此值時一律線性搜尋
+_AUTO_LINEAR_MAX = 32
+# auto 策略: 取樣點與均勻分布直線的最大偏差（相對於值域）低於此值時視為均勻
+_AUTO_UNIFORM_TOLERANCE = 0.05
+
+
+class SortedIndex:
+    """靜態有序數組的批次搜尋索引
+
+    建立時排序一次（或驗證輸入已排序），鍵值以 NumPy 陣列保存，
+    所有查詢都以 np.searchsorted 向量化處理，可一次查詢整批目標，
+    不經過逐元素的 Python 迴圈，也不建立視覺化或寫入日誌。
+
+    查詢接受純量或陣列：純量返回純量，陣列返回同形狀的陣列。
+
+    Attributes:
+        keys (np.ndarray): 升序排列的鍵值
+        order (np.ndarray): keys[i] 在原始輸入中的索引
+    """
+
+    def __init__(self, arr: Union[List[Any], np.ndarray], presorted: bool = False):
+        """建立索引
+
+        Args:
+            arr: 鍵值序列
+            presorted: 輸入是否已升序排列；True 時只驗證不排序
+
+        Raises:
+            ValueError: 當 presorted=True 但輸入未排序，或輸入不是一維時
+        """
+        keys = np.asarray(arr)
+        if keys.ndim != 1:
+            raise ValueError("只支援一維的鍵值序列")
+        if presorted:
+            if len(keys) > 1 and not np.all(keys[:-1] <= keys[1:]):
+                raise ValueError("輸入未按升序排列")
+            self.keys = keys
+            self.order = np.arange(len(keys))
+        else:
+            self.order = np.argsort(keys, kind="stable")
+            self.keys = keys[self.order]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _search(self, targets: Any, side: str) -> Union[int, np.ndarray]:
+        """np.searchsorted；大批次時先排序目標再把結果放回原順序"""
+        targets = np.asarray(targets)
+        if targets.ndim != 1 or len(targets) < _SORT_TARGETS_MIN:
+            return np.searchsorted(self.keys, targets, side=side)
+        order = np.argsort(targets)
+        positions = np.empty(len(targets), dtype=np.int64)
+        positions[order] = np.searchsorted(self.keys, targets[order], side=side)
+        return positions
+
+    def bisect_left(self, targets: Any) -> Union[int, np.ndarray]:
+        """每個目標在 keys 中的最左插入位置"""
+        return self._search(targets, "left")
+
+    def bisect_right(self, targets: Any) -> Union[int, np.ndarray]:
+        """每個目標在 keys 中的最右插入位置"""
+        return self._search(targets, "right")
+
+    def _matches(self, targets: Any):
+        """最左插入位置，以及該位置是否為完全相等的鍵值"""
+        targets = np.asarray(targets)
+        positions = self._search(targets, "left")
+        if len(self.keys) == 0:
+            return positions, np.zeros(np.shape(positions), dtype=bool)
+        clipped = np.minimum(positions, len(self.keys) - 1)
+        return positions, (positions < len(self.keys)) & (self.keys[clipped] == targets)
+
+    def contains(self, targets: Any) -> Union[bool, np.ndarray]:
+        """每個目標是否存在於索引中"""
+        return self._matches(targets)[1]
+
+    def lookup(self, targets: Any) -> Union[Optional[int], np.ndarray]:
+        """查詢目標在原始輸入中的索引
+
+        有重複鍵值時返回原始位置最小的一個。
+
+        Args:
+            targets: 單一目標或目標陣列
+
+        Returns:
+            純量目標返回索引或 None；陣列目標返回索引陣列，找不到的位置為 -1
+        """
+        positions, found = self._matches(targets)
+        if len(self.keys) == 0:
+            indices = np.full(np.shape(positions), -1, dtype=np.int64)
+        else:
+            clipped = np.minimum(positions, len(self.keys) - 1)
+            indices = np.where(found, self.order[clipped], -1)
+        if np.ndim(indices) == 0:
+            return int(indices) if found else None
+        return indices
+
+    def range_count(self, lo: Any, hi: Any) -> Union[int, np.ndarray]:
+        """鍵值落在 [lo, hi) 的元素數，lo 與 hi 可為等長陣列"""
+        counts = self._search(hi, "left") - self._search(lo, "left")
+        return np.maximum(counts, 0)
+
 
 class Searching:
     """搜尋算法類別"""
@@ -45,30 +207,182 @@ def __init__(self, arr: List[Any], test_mode: bool = False):
             self.fig = None
             self.ax = None
 
+        # 惰性建立的索引與各策略的建立成本，數組被修改後需呼叫 invalidate()
+        self._indexes: Dict[str, Any] = {}
+        self.build_costs: Dict[str, Dict[str, float]] = {}
+        self.auto_stats = self._new_auto_stats()
+
         self.logger.info(f"初始化搜尋算法，數組長度: {len(arr)}")
 
+    @staticmethod
+    def _new_auto_stats() -> Dict[str, Any]:
+        """auto 策略的統計: 查詢數、線性階段的掃描量與耗時、各策略使用次數、
+        數組特徵與切換紀錄"""
+        return {
+            "queries": 0,
+            "scanned": 0,
+            "linear_seconds": 0.0,
+            "fallbacks": 0,
+            "build_estimate": None,
+            "strategy": None,
+            "settled": False,
+            "counts": {},
+            "profile": {},
+            "decisions": [],
+        }
+
+    def invalidate(self):
+        """丟棄所有已建立的索引（修改 self.arr 後呼叫）"""
+        self._indexes.clear()
+        self.build_costs.clear()
+        self.auto_stats = self._new_auto_stats()
+
+    def _build(self, name: str, builder, memory) -> Any:
+        """建立並快取索引，記錄建立時間與記憶體用量"""
+        if name not in self._indexes:
+            start = time.perf_counter()
+            index = builder()
+            elapsed = time.perf_counter() - start
+            self._indexes[name] = index
+            self.build_costs[name] = {
+                "build_seconds": elapsed,
+                "memory_bytes": memory(index),
+            }
+            self.logger.info(f"建立{name}索引，耗時 {elapsed:.4f} 秒")
+        return self._indexes[name]
+
+    def _hash_index(self) -> Dict[Any, List[int]]:
+        """值到所有出現位置的雜湊索引"""
+
+        def build() -> Dict[Any, List[int]]:
+            index: Dict[Any, List[int]] = {}
+            for i, value in enumerate(self.arr):
+                positions = index.get(value)
+                if positions is None:
+                    index[value] = [i]
+                else:
+                    positions.append(i)
+            return index
+
+        def memory(index: Dict[Any, List[int]]) -> int:
+            return sys.getsizeof(index) + sum(
+                sys.getsizeof(positions) for positions in index.values()
+            )
+
+        return self._build("hash", build, memory)
+
+    def _is_sorted(self) -> bool:
+        """數組是否為升序，檢查結果會被快取；元素無法比較時視為未排序"""
+        arr = self.arr
+
+        def check() -> bool:
+            if isinstance(arr, np.ndarray):
+                return bool(np.all(arr[:-1] <= arr[1:]))
+            try:
+                return all(a <= b for a, b in zip(arr, arr[1:]))
+            except TypeError:
+                return False
+
+        return self._build("sorted_check", check, lambda _: 0)
+
+    def _require_sorted(self):
+        """確認數組為升序
+
+        Raises:
+            ValueError: 數組未排序時
+        """
+        if not self._is_sorted():
+            raise ValueError("此搜尋策略需要已排序的數組")
+
+    def _profile(self) -> Dict[str, Any]:
+        """分析數組特徵: 大小、是否排序、是否為數值、數值是否近似均勻分布"""
+        arr = self.arr
+        n = len(arr)
+        is_sorted = self._is_sorted()
+        if isinstance(arr, np.ndarray):
+            numeric = arr.dtype.kind in "iuf"
+        else:
+            # numbers.Real 同時涵蓋 Python 與 NumPy 的整數、浮點數純量
+            numeric = all(
+                isinstance(value, numbers.Real)
+                and not isinstance(value, (bool, np.bool_))
+                for value in arr
+            )
+        uniform = False
+        if is_sorted and numeric and n > 1 and arr[-1] > arr[0]:
+            low, span = arr[0], arr[-1] - arr[0]
+            samples = range(0, n, max(1, n // 32))
+            deviation = max(
+                abs(arr[i] - low - span * i / (n - 1)) / span for i in samples
+            )
+            uniform = deviation < _AUTO_UNIFORM_TOLERANCE
+        return {"size": n, "sorted": is_sorted, "numeric": numeric, "uniform": uniform}
+
+    def _decide(self, strategy: str, reason: str, settled: bool = True):
+        """記錄 auto 策略的選擇；策略改變時寫入切換紀錄與日誌"""
+        stats = self.auto_stats
+        stats["settled"] = settled
+        if stats["strategy"] != strategy:
+            stats["strategy"] = strategy
+            stats["decisions"].append(
+                {"query": stats["queries"], "strategy": strategy, "reason": reason}
+            )
+            self.logger.info(f"auto 搜尋切換為 {strategy}: {reason}")
+
+    def _index_paid_off(self) -> bool:
+        """線性階段累積的成本是否已達到建立索引的成本（租或買問題的 2-競爭策略）
+
+        建立成本優先使用已實測的排序檢查時間（分析數組時第一個要付出的
+        O(n) 掃描）；尚未建立過時，以線性搜尋實測的每元素掃描速率估計
+        一次完整掃描的時間，等價於累積掃描的元素數達到 n。
+        """
+        stats = self.auto_stats
+        measured = self.build_costs.get("sorted_check")
+        if measured is not None:
+            stats["build_estimate"] = measured["build_seconds"]
+            return stats["linear_seconds"] >= measured["build_seconds"]
+        if stats["scanned"]:
+            per_element = stats["linear_seconds"] / stats["scanned"]
+            stats["build_estimate"] = per_element * len(self.arr)
+        return stats["scanned"] >= len(self.arr)
+
+    def _choose_strategy(self) -> str:
+        """依查詢量與數組特徵選擇策略，選定後不再重新評估"""
+        stats = self.auto_stats
+        if stats["settled"]:
+            return stats["strategy"]
+
+        n = len(self.arr)
+        if n <= _AUTO_LINEAR_MAX:
+            self._decide("linear", f"數組很小 (n={n})")
+        elif not self._index_paid_off():
+            self._decide("linear", "查詢量尚不足以攤銷建立索引的成本", settled=False)
+        else:
+            profile = stats["profile"] = self._profile()
+            if profile["sorted"] and profile["uniform"]:
+                self._decide("interpolation", "已排序且數值近似均勻分布")
+            elif profile["sorted"]:
+                self._decide("binary", "已排序")
+            else:
+                try:
+                    self._hash_index()
+                    self._decide("hash", "未排序，建立雜湊索引")
+                except TypeError:
+                    self._decide("linear", "未排序且元素不可雜湊")
+        return stats["strategy"]
+
     def binary_search(self, target: Any) -> Optional[int]:
-        """二分搜尋
+        """二分搜尋（下界），有重複值時與線性搜尋一樣返回第一次出現的位置
 
         Args:
             target: 要搜尋的目標值
 
         Returns:
-            Optional[int]: 目標值的索引，如果未找到則返回None
+            Optional[int]: 目標值第一次出現的索引，如果未找到則返回None
         """
-        if not self.arr:
-            return None
-
-        left, right = 0, len(self.arr) - 1
-
-        while left <= right:
-            mid = (left + right) // 2
-            if self.arr[mid] == target:
-                return mid
-            elif self.arr[mid] < target:
-                left = mid + 1
-            else:
-                right = mid - 1
+        index = bisect_left(self.arr, target)
+        if index < len(self.arr) and self.arr[index] == target:
+            return index
         return None
 
     def linear_search(self, target: Any) -> Optional[int]:
@@ -85,6 +399,150 @@ def linear_search(self, target: Any) -> Optional[int]:
                 return i
         return None
 
+    def hash_search(self, target: Any) -> Optional[int]:
+        """雜湊索引搜尋
+
+        第一次查詢時以 O(n) 建立值到位置的索引，之後每次查詢 O(1)，
+        適合對同一數組重複做相等查詢。元素必須可雜湊。
+
+        Args:
+            target: 要搜尋的目標值
+
+        Returns:
+            Optional[int]: 目標值第一次出現的索引，如果未找到則返回None
+        """
+        positions = self._hash_index().get(target)
+        return positions[0] if positions else None
+
+    def find_all(self, target: Any) -> List[int]:
+        """以雜湊索引返回目標值所有出現的位置"""
+        return list(self._hash_index().get(target, []))
+
+    def interpolation_search(self, target: Any) -> Optional[int]:
+        """插值搜尋
+
+        依目標值在區間端點之間的比例估計位置，對均勻分布的數值鍵值平均
+        O(log log n)。連續探測次數超過 log2(n) 仍未找到時改用中點，
+        因此分布不均時最壞仍為 O(log n)。探測到目標後在左側做一次下界
+        二分搜尋，有重複值時返回第一次出現的位置。
+
+        Args:
+            target: 要搜尋的數值目標
+
+        Returns:
+            Optional[int]: 目標值第一次出現的索引，如果未找到則返回None
+
+        Raises:
+            ValueError: 數組未排序時
+        """
+        self._require_sorted()
+        arr = self.arr
+        left, right = 0, len(arr) - 1
+        budget = len(arr).bit_length()
+
+        # 不變量: left 左側的元素都小於目標，因此 left 處相等時即為第一次出現
+        while left <= right and arr[left] <= target <= arr[right]:
+            low, high = arr[left], arr[right]
+            if high == low:
+                return left
+            if budget > 0:
+                budget -= 1
+                mid = left + int((right - left) * ((target - low) / (high - low)))
+            else:
+                mid = (left + right) // 2
+            if arr[mid] == target:
+                return bisect_left(arr, target, left, mid)
+            if arr[mid] < target:
+                left = mid + 1
+            else:
+                right = mid - 1
+        return None
+
+    def exponential_search(self, target: Any) -> Optional[int]:
+        """指數搜尋，先倍增找出區間再二分，O(log i)
+
+        Raises:
+            ValueError: 數組未排序時
+        """
+        self._require_sorted()
+        return exponential_search(self.arr, target)
+
+    def auto_search(self, target: Any) -> Optional[int]:
+        """依工作量自動選擇搜尋策略
+
+        - 數組很小: 線性搜尋
+        - 線性搜尋累積的實測成本達到建立索引的成本之前: 線性搜尋，
+          避免少量查詢也付出 O(n) 的建立成本（見 _index_paid_off）
+        - 之後分析一次數組: 已排序時使用二分（數值均勻分布時用插值），
+          未排序時建立雜湊索引，元素不可雜湊時維持線性搜尋
+
+        所有策略在有重複值時都返回第一次出現的位置。目標與元素的型別不相容
+        （例如以 str 查詢整數數組、以不可雜湊的目標查詢雜湊索引）時，
+        索引策略會拋出 TypeError，此時改用線性搜尋（以 == 比較，不會拋出），
+        因此切換策略只影響速度，不影響結果。每次的選擇與原因記錄在
+        auto_stats 中，型別不相容而退回線性搜尋的次數記錄在 fallbacks。
+
+        Args:
+            target: 要搜尋的目標值
+
+        Returns:
+            Optional[int]: 目標值的索引，如果未找到則返回None
+        """
+        stats = self.auto_stats
+        stats["queries"] += 1
+        strategy = self._choose_strategy()
+        stats["counts"][strategy] = stats["counts"].get(strategy, 0) + 1
+        if strategy != "linear" or stats["settled"]:
+            try:
+                return self.algorithms[strategy](self, target)
+            except TypeError:
+                stats["fallbacks"] += 1
+                return self.linear_search(target)
+
+        # 線性階段: 記錄掃描的元素數與耗時，作為是否建立索引的依據
+        start = time.perf_counter()
+        result = self.linear_search(target)
+        stats["linear_seconds"] += time.perf_counter() - start
+        stats["scanned"] += len(self.arr) if result is None else result + 1
+        return result
+
+    def strategy_costs(self) -> Dict[str, Dict[str, Any]]:
+        """各搜尋策略的建立成本、記憶體與查詢複雜度，供呼叫者選擇策略
+
+        build_seconds 與 memory_bytes 在策略的索引建立前為 None。
+        """
+        n = len(self.arr)
+        profiles = {
+            "linear": ("O(1)", "O(n)", None),
+            "binary": ("O(1)", "O(log n)", None),
+            "hash": ("O(n)", "O(1)", "hash"),
+            "interpolation": ("O(n) 排序檢查", "O(log log n) 平均", "sorted_check"),
+            "exponential": ("O(n) 排序檢查", "O(log i)", "sorted_check"),
+        }
+        report = {}
+        for name, (build, query, index) in profiles.items():
+            if index is None:
+                cost = {"build_seconds": 0.0, "memory_bytes": 0}
+            else:
+                cost = self.build_costs.get(
+                    index, {"build_seconds": None, "memory_bytes": None}
+                )
+            report[name] = {"build": build, "query": query, "size": n, **cost}
+        return report
+
+    def build_index(self, presorted: bool = False) -> SortedIndex:
+        """以目前的數組建立可批次查詢的 SortedIndex
+
+        Args:
+            presorted: 數組是否已排序；True 時只驗證不排序
+
+        Returns:
+            SortedIndex: 搜尋索引
+        """
+        index = SortedIndex(self.arr, presorted=presorted)
+        self.logger.info(f"建立排序索引，鍵值數: {len(index)}")
+        return index
+
     def search(self, algorithm: str, target: Any) -> Optional[int]:
         """執行指定的搜尋算法
 
@@ -107,3 +565,7 @@ def search(self, algorithm: str, target: Any) -> Optional[int]:
 # 註冊內建算法
 Searching.register_algorithm("binary", Searching.binary_search)
 Searching.register_algorithm("linear", Searching.linear_search)
+Searching.register_algorithm("hash", Searching.hash_search)
+Searching.register_algorithm("interpolation", Searching.interpolation_search)
+Searching.register_algorithm("exponential", Searching.exponential_search)
+Searching.register_algorithm("auto", Searching.auto_search)
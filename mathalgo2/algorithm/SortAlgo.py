@@ -7,6 +7,15 @@
 import numpy as np
 from matplotlib.animation import FuncAnimation
 
+from mathalgo2.algorithm.sorting import argsort as engine_argsort
+from mathalgo2.algorithm.sorting import counting_sort as engine_counting_sort
+from mathalgo2.algorithm.sorting import introsort
+from mathalgo2.algorithm.sorting import merge_sort as engine_merge_sort
+from mathalgo2.algorithm.sorting import nlargest, nsmallest
+from mathalgo2.algorithm.sorting import parallel_sort as engine_parallel_sort
+from mathalgo2.algorithm.sorting import partial_sort as engine_partial_sort
+from mathalgo2.algorithm.sorting import radix_sort as engine_radix_sort
+from mathalgo2.algorithm.sorting import select as engine_select
 from mathalgo2.Logger import Logger, logging
 
 # 設置根目錄和日誌
@@ -44,6 +53,9 @@ class Sorting(Algorithm):
     - 插入排序 (Insertion Sort)
     - 合併排序 (Merge Sort)
 
+    未啟用視覺化時，快速排序與合併排序改由 sorting 模組中不含日誌的
+    內省排序與由下而上合併排序執行；sort() 另外支援 key 函數。
+
     Attributes:
         arr (List[Any]): 待排序的數組
         fig (Figure): matplotlib 圖形對象
@@ -124,7 +136,7 @@ def quick_sort(self, reverse: bool = False) -> List[Any]:
         快速排序算法實現
 
         原理: 選擇基準值(pivot)，將數組分為小於和大於基準值的兩部分，遞歸排序
-        時間複雜度: 平均O(nlogn)，最壞O(n²)
+        時間複雜度: 平均O(nlogn)，最壞O(n²)；未視覺化時使用內省排序，最壞O(nlogn)
         空間複雜度: O(logn) - 遞歸調用棧的深度
         穩定性: 不穩定
 
@@ -135,8 +147,11 @@ def quick_sort(self, reverse: bool = False) -> List[Any]:
             排序後的數組
         """
         self.logger.info(f"開始快速排序，排序方向: {'降序' if reverse else '升序'}")
-        if self.fig is not None:
-            plt.ion()
+        if self.fig is None:
+            self.arr = introsort(self.arr, reverse=reverse)
+            self.logger.info("快速排序完成")
+            return self.arr
+        plt.ion()
         self._quick_sort_helper(0, len(self.arr) - 1, reverse)
         self.logger.info("快速排序完成")
         return self.arr
@@ -261,8 +276,11 @@ def merge_sort(self, reverse: bool = False) -> List[Any]:
             排序後的數組
         """
         self.logger.info(f"開始合併排序，排序方向: {'降序' if reverse else '升序'}")
-        if self.fig is not None:
-            plt.ion()
+        if self.fig is None:
+            self.arr = engine_merge_sort(self.arr, reverse=reverse)
+            self.logger.info("合併排序完成")
+            return self.arr
+        plt.ion()
         self.arr = self._merge_sort_helper(self.arr, reverse)
         self.logger.info("合併排序完成")
         return self.arr
@@ -320,6 +338,172 @@ def _merge(self, left: List[Any], right: List[Any], reverse: bool) -> List[Any]:
         merged.extend(left or right)
         return merged
 
+    def sort(
+        self,
+        algorithm: str = "intro",
+        key: Optional[Callable[[Any], Any]] = None,
+        reverse: bool = False,
+    ) -> List[Any]:
+        """
+        不含視覺化的高效排序
+
+        Args:
+            algorithm: "intro" 為內省排序（不穩定），"merge" 為由下而上合併排序（穩定）
+            key: 計算比較鍵值的函數，每個元素只計算一次
+            reverse: 是否降序排序
+
+        Returns:
+            排序後的數組
+
+        Raises:
+            ValueError: 當算法名稱不支援時
+        """
+        if algorithm == "intro":
+            self.arr = introsort(self.arr, key=key, reverse=reverse)
+        elif algorithm == "merge":
+            self.arr = engine_merge_sort(self.arr, key=key, reverse=reverse)
+        else:
+            raise ValueError(f"不支持的算法: {algorithm}")
+        self.logger.info(f"{algorithm}排序完成，數組長度: {len(self.arr)}")
+        return self.arr
+
+    def nsmallest(
+        self, k: int, key: Optional[Callable[[Any], Any]] = None
+    ) -> Union[List[Any], np.ndarray]:
+        """
+        最小的 k 個元素（升序），O(n log k)，不排序整個數組
+
+        Args:
+            k: 元素數
+            key: 計算比較鍵值的函數
+
+        Returns:
+            最小的 k 個元素；無 key 的數值 ndarray 輸入時為 ndarray
+        """
+        return nsmallest(self.arr, k, key=key)
+
+    def nlargest(
+        self, k: int, key: Optional[Callable[[Any], Any]] = None
+    ) -> Union[List[Any], np.ndarray]:
+        """
+        最大的 k 個元素（降序），O(n log k)，不排序整個數組
+
+        Args:
+            k: 元素數
+            key: 計算比較鍵值的函數
+
+        Returns:
+            最大的 k 個元素；無 key 的數值 ndarray 輸入時為 ndarray
+        """
+        return nlargest(self.arr, k, key=key)
+
+    def select(self, kth: int, key: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        內省選擇第 kth 小的元素，平均 O(n)，不修改 self.arr
+
+        Args:
+            kth: 名次（從 0 開始，支援負索引）
+            key: 計算比較鍵值的函數
+
+        Returns:
+            第 kth 小的元素
+
+        Raises:
+            IndexError: 當 kth 超出範圍時
+        """
+        return engine_select(self.arr, kth, key=key)
+
+    def partial_sort(
+        self,
+        k: int,
+        key: Optional[Callable[[Any], Any]] = None,
+        reverse: bool = False,
+    ) -> Union[List[Any], np.ndarray]:
+        """
+        部分排序，只保證前 k 個元素有序，O(n + k log k)
+
+        Args:
+            k: 需要排序的元素數
+            key: 計算比較鍵值的函數
+            reverse: 是否取最大的 k 個並降序排列
+
+        Returns:
+            重排後的數組（無 key 的數值 ndarray 輸入時為 ndarray），同時存回 self.arr
+        """
+        self.arr = engine_partial_sort(self.arr, k, key=key, reverse=reverse)
+        self.logger.info(f"部分排序完成，k={k}")
+        return self.arr
+
+    def radix_sort(self, reverse: bool = False) -> np.ndarray:
+        """
+        數值數組的向量化 LSD 基數排序
+
+        Args:
+            reverse: 是否降序排序
+
+        Returns:
+            排序後的 np.ndarray，同時存回 self.arr
+
+        Raises:
+            TypeError: 當數組不是同質的整數或浮點數時
+        """
+        self.arr = engine_radix_sort(self.arr, reverse=reverse)
+        self.logger.info(f"基數排序完成，數組長度: {len(self.arr)}")
+        return self.arr
+
+    def counting_sort(self, reverse: bool = False) -> np.ndarray:
+        """
+        小值域整數數組的計數排序
+
+        Args:
+            reverse: 是否降序排序
+
+        Returns:
+            排序後的 np.ndarray，同時存回 self.arr
+
+        Raises:
+            TypeError: 當數組不是整數時
+            ValueError: 當值域過大時
+        """
+        self.arr = engine_counting_sort(self.arr, reverse=reverse)
+        self.logger.info(f"計數排序完成，數組長度: {len(self.arr)}")
+        return self.arr
+
+    def parallel_sort(
+        self, workers: Optional[int] = None, reverse: bool = False
+    ) -> np.ndarray:
+        """
+        數值數組的多進程樣本排序，資料透過共享記憶體傳遞
+
+        Args:
+            workers: 進程數，None 表示使用所有 CPU 核心
+            reverse: 是否降序排序
+
+        Returns:
+            排序後的 np.ndarray，同時存回 self.arr
+
+        Raises:
+            TypeError: 當數組不是同質的整數或浮點數時
+        """
+        self.arr = engine_parallel_sort(self.arr, workers=workers, reverse=reverse)
+        self.logger.info(f"並行排序完成，數組長度: {len(self.arr)}")
+        return self.arr
+
+    def argsort(self, reverse: bool = False, method: str = "numpy") -> np.ndarray:
+        """
+        數值數組的穩定間接排序，不修改 self.arr
+
+        Args:
+            reverse: 是否降序排序
+            method: "numpy" 或 "radix"
+
+        Returns:
+            使數組有序的索引排列
+        """
+        order = engine_argsort(self.arr, reverse=reverse, method=method)
+        self.logger.info(f"間接排序完成，數組長度: {len(order)}")
+        return order
+
     def visualize(self, algorithm: str = "bubble", reverse: bool = False):
         """
         視覺化排序過程
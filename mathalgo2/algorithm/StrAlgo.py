@@ -1,12 +1,14 @@
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List
+from typing import List, Optional, Sequence, Tuple, Union
 
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 
+from mathalgo2.algorithm.string.AhoCorasick import AhoCorasick
 from mathalgo2.algorithm.string.KMP import KMP
 from mathalgo2.algorithm.string.RabinKarp import RabinKarp
+from mathalgo2.algorithm.string.SuffixArray import SuffixArray
 from mathalgo2.Logger import Logger, logging
 
 # 設置根目錄和日誌
@@ -37,6 +39,7 @@ class StrAlgo(Algorithm):
     支援的字串演算法:
     - KMP (Knuth-Morris-Pratt)
     - Rabin-Karp
+    - Aho-Corasick (多模式匹配)
     - Trie (字典樹)
     - Suffix Array (後綴數組)
 
@@ -65,6 +68,8 @@ def __init__(self, text: str, pattern: str, test_mode: bool = False):
 
         self.text = text
         self.pattern = pattern
+        # 最近一次使用的 (模式, 自動機)，相同的模式不必重新建立
+        self._automaton: Optional[Tuple[Tuple[str, ...], AhoCorasick]] = None
 
         if not test_mode:
             self.fig, self.ax = plt.subplots()
@@ -90,6 +95,42 @@ def rabin_karp_search(self) -> List[int]:
         self.logger.info(f"Rabin-Karp 匹配完成，找到 {len(matches)} 個匹配")
         return matches
 
+    def aho_corasick_search(
+        self, patterns: Union[Sequence[str], AhoCorasick, None] = None
+    ) -> List[Tuple[int, int]]:
+        """Aho-Corasick 多模式匹配，單次掃描文本找出所有模式的出現位置。
+
+        自動機會快取在實例上，以相同的模式重複搜尋時不會重新建立；
+        也可以直接傳入預先建立的 AhoCorasick。
+
+        Args:
+            patterns: 模式字串的序列或 AhoCorasick 自動機，None 時只搜尋 self.pattern
+
+        Returns:
+            List[Tuple[int, int]]: 依結束位置排列的 (起始位置, 模式編號) 列表
+        """
+        if isinstance(patterns, AhoCorasick):
+            automaton = patterns
+        else:
+            key = (self.pattern,) if patterns is None else tuple(patterns)
+            if self._automaton is None or self._automaton[0] != key:
+                self._automaton = (key, AhoCorasick(key))
+            automaton = self._automaton[1]
+        self.logger.debug(f"開始 Aho-Corasick 字串匹配，模式數: {len(automaton.patterns)}")
+        matches = automaton.search(self.text)
+        self.logger.info(f"Aho-Corasick 匹配完成，找到 {len(matches)} 個匹配")
+        return matches
+
+    def build_index(self) -> SuffixArray:
+        """以目前的文本建立後綴數組索引，之後的查詢不必重新掃描文本。
+
+        Returns:
+            SuffixArray: 支援 count、locate 等查詢的索引
+        """
+        index = SuffixArray(self.text)
+        self.logger.info(f"建立後綴數組索引，文本長度: {index.n}")
+        return index
+
     def visualize(self, *args, **kwargs):
         """視覺化方法，傳遞給視覺化方法的位置參數和關鍵字參數。"""
         self.logger.debug("開始視覺化")
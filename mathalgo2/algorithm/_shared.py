@@ -0,0 +1,90 @@
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 共享陣列的描述: (共享記憶體名稱, 形狀, dtype 字串)
+ArrayHandle = Tuple[str, Tuple[int, ...], str]
+
+
+class SharedArrays:
+    """一組放在 multiprocessing.shared_memory 中的 NumPy 陣列
+
+    建立者負責 unlink；工作進程以 handles 呼叫 attach() 取得零複製的陣列視圖，
+    因此傳給進程池的只有共享記憶體名稱，而不是陣列內容。
+
+    Attributes:
+        arrays (Dict[str, np.ndarray]): 名稱對應的共享陣列視圖
+        handles (Dict[str, ArrayHandle]): 可 pickle 的陣列描述
+    """
+
+    def __init__(self):
+        """初始化空的共享陣列集合"""
+        self.arrays: Dict[str, np.ndarray] = {}
+        self.handles: Dict[str, ArrayHandle] = {}
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self._owner = True
+
+    def create(
+        self, name: str, shape: Tuple[int, ...], dtype, fill: Optional[float] = None
+    ) -> np.ndarray:
+        """建立新的共享陣列
+
+        Args:
+            name: 陣列名稱
+            shape: 陣列形狀
+            dtype: 陣列型別
+            fill: 可選的初始值
+
+        Returns:
+            np.ndarray: 共享陣列視圖
+        """
+        dtype = np.dtype(dtype)
+        size = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        block = shared_memory.SharedMemory(create=True, size=size)
+        self._blocks.append(block)
+        array = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+        if fill is not None:
+            array.fill(fill)
+        self.arrays[name] = array
+        self.handles[name] = (block.name, tuple(shape), dtype.str)
+        return array
+
+    def share(self, name: str, source: np.ndarray) -> np.ndarray:
+        """把現有陣列複製到共享記憶體"""
+        array = self.create(name, source.shape, source.dtype)
+        array[...] = source
+        return array
+
+    @classmethod
+    def attach(cls, handles: Dict[str, ArrayHandle]) -> "SharedArrays":
+        """在工作進程中依描述連接到既有的共享陣列"""
+        shared = cls()
+        shared._owner = False
+        for name, (block_name, shape, dtype) in handles.items():
+            block = shared_memory.SharedMemory(name=block_name)
+            shared._blocks.append(block)
+            shared.arrays[name] = np.ndarray(
+                shape, dtype=np.dtype(dtype), buffer=block.buf
+            )
+            shared.handles[name] = (block_name, shape, dtype)
+        return shared
+
+    def close(self):
+        """釋放陣列視圖並關閉共享記憶體；建立者同時 unlink"""
+        self.arrays.clear()
+        for block in self._blocks:
+            block.close()
+            if self._owner:
+                block.unlink()
+        self._blocks.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+__all__ = ["ArrayHandle", "SharedArrays"]
@@ -0,0 +1,81 @@
+"""
+圖論核心模組，以 CSR 陣列與整數節點編號實作不含視覺化的圖演算法
+"""
+
+from .all_pairs import bellman_ford_potential, distance_matrix, floyd_warshall, johnson
+from .analytics import (
+    connected_components,
+    kruskal,
+    minimum_spanning_tree,
+    prim,
+    strongly_connected_components,
+    topological_sort,
+)
+from .centrality import (
+    betweenness_centrality,
+    closeness_centrality,
+    degree_centrality,
+    pagerank,
+)
+from .csr import CSRGraph
+from .dynamic import DynamicSSSP
+from .io import (
+    load_binary,
+    load_graph,
+    read_edge_list,
+    read_matrix_market,
+    save_binary,
+    write_edge_list,
+    write_matrix_market,
+)
+from .landmarks import LandmarkIndex
+from .parallel import delta_stepping, parallel_bfs
+from .paths import (
+    astar,
+    bidirectional_dijkstra,
+    dijkstra,
+    multi_source_dijkstra,
+    reconstruct_path,
+    shortest_path,
+)
+from .shared import SharedArrays
+from .traversal import bfs, bfs_levels, dfs
+
+__all__ = [
+    "CSRGraph",
+    "bfs",
+    "dfs",
+    "dijkstra",
+    "bidirectional_dijkstra",
+    "shortest_path",
+    "reconstruct_path",
+    "multi_source_dijkstra",
+    "distance_matrix",
+    "floyd_warshall",
+    "bellman_ford_potential",
+    "johnson",
+    "SharedArrays",
+    "astar",
+    "LandmarkIndex",
+    "bfs_levels",
+    "connected_components",
+    "strongly_connected_components",
+    "topological_sort",
+    "kruskal",
+    "prim",
+    "minimum_spanning_tree",
+    "pagerank",
+    "degree_centrality",
+    "closeness_centrality",
+    "betweenness_centrality",
+    "DynamicSSSP",
+    "read_edge_list",
+    "write_edge_list",
+    "read_matrix_market",
+    "write_matrix_market",
+    "save_binary",
+    "load_binary",
+    "load_graph",
+    "parallel_bfs",
+    "delta_stepping",
+]
@@ -0,0 +1,192 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+from mathalgo2.algorithm._shared import ArrayHandle, SharedArrays
+from mathalgo2.algorithm.graph.csr import CSRGraph
+from mathalgo2.algorithm.graph.paths import dijkstra
+from mathalgo2.algorithm.graph.shared import attach_graph, share_graph
+
+# 工作進程連接的共享陣列，由 _init_worker 設置
+_worker_shared: Optional[SharedArrays] = None
+
+
+def _init_worker(handles: Dict[str, ArrayHandle]):
+    """工作進程初始化：連接共享的 CSR 陣列、目標列表與輸出矩陣"""
+    global _worker_shared
+    _worker_shared = SharedArrays.attach(handles)
+
+
+def _fill_rows(row_start: int, row_end: int):
+    """計算 sources[row_start:row_end] 的距離列並直接寫入共享輸出矩陣"""
+    arrays = _worker_shared.arrays
+    _rows_into(
+        attach_graph(_worker_shared),
+        arrays["sources"][row_start:row_end],
+        arrays["targets"],
+        arrays["output"][row_start:row_end],
+    )
+
+
+def _rows_into(
+    graph: CSRGraph, sources: np.ndarray, targets: np.ndarray, out: np.ndarray
+):
+    """逐一從 sources 執行 Dijkstra，把到 targets 的距離寫入 out"""
+    target_list = targets.tolist()
+    for row, source in enumerate(sources.tolist()):
+        dist, _ = dijkstra(graph, source, targets=target_list)
+        out[row] = dist[targets]
+
+
+def distance_matrix(
+    graph: CSRGraph,
+    sources: Sequence[int],
+    targets: Optional[Sequence[int]] = None,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+) -> np.ndarray:
+    """多對多距離表
+
+    CSR 陣列、目標列表與輸出矩陣都放在共享記憶體中，工作進程只收到
+    來源列的範圍，計算結果直接寫入輸出矩陣，不需在進程間序列化陣列。
+
+    Args:
+        graph: CSR 圖，權重必須非負
+        sources: 來源節點編號
+        targets: 目標節點編號，預設為所有節點
+        workers: 進程數，None 表示使用所有 CPU 核心，0 表示在目前進程中計算
+        chunk_size: 每個任務處理的來源數
+
+    Returns:
+        np.ndarray: 形狀為 (len(sources), len(targets)) 的距離矩陣，不可達為 inf
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    if targets is None:
+        targets = np.arange(graph.num_nodes, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    workers = os.cpu_count() if workers is None else workers
+
+    if workers == 0 or len(sources) <= 1:
+        out = np.empty((len(sources), len(targets)))
+        _rows_into(graph, sources, targets, out)
+        return out
+
+    if chunk_size is None:
+        chunk_size = max(1, len(sources) // (workers * 4))
+
+    with SharedArrays() as shared:
+        handles = share_graph(graph, shared)
+        shared.share("sources", sources)
+        shared.share("targets", targets)
+        output = shared.create("output", (len(sources), len(targets)), np.float64)
+        handles.update(
+            {key: shared.handles[key] for key in ("sources", "targets", "output")}
+        )
+
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(handles,)
+        ) as executor:
+            starts = range(0, len(sources), chunk_size)
+            ends = [min(start + chunk_size, len(sources)) for start in starts]
+            list(executor.map(_fill_rows, starts, ends))
+
+        return output.copy()
+
+
+def floyd_warshall(graph: CSRGraph) -> np.ndarray:
+    """Floyd–Warshall 全點對最短路徑
+
+    每一輪以 NumPy 廣播更新整個距離矩陣，適合節點數數千以內的稠密圖，
+    支援負權重邊。
+
+    時間複雜度: O(V^3)，空間複雜度: O(V^2)
+
+    Args:
+        graph: CSR 圖
+
+    Returns:
+        np.ndarray: V x V 距離矩陣，不可達為 inf
+
+    Raises:
+        ValueError: 圖中存在負權重環時
+    """
+    n = graph.num_nodes
+    dist = np.full((n, n), np.inf)
+    # 平行邊取最小權重
+    np.minimum.at(dist, (graph.sources(), graph.indices), graph.weights)
+    np.fill_diagonal(dist, np.minimum(np.diagonal(dist), 0.0))
+
+    for k in range(n):
+        np.minimum(dist, dist[:, k, None] + dist[None, k, :], out=dist)
+
+    if np.any(np.diagonal(dist) < 0):
+        raise ValueError("圖中存在負權重環")
+    return dist
+
+
+def bellman_ford_potential(graph: CSRGraph) -> np.ndarray:
+    """以虛擬源點執行向量化 Bellman–Ford，求出 Johnson 重新加權所需的位勢
+
+    Returns:
+        np.ndarray: 每個節點的位勢 h，使 w(u, v) + h[u] - h[v] >= 0
+
+    Raises:
+        ValueError: 圖中存在負權重環時
+    """
+    src = graph.sources()
+    dst = graph.indices
+    h = np.zeros(graph.num_nodes)
+    for _ in range(graph.num_nodes + 1):
+        candidate = h.copy()
+        np.minimum.at(candidate, dst, h[src] + graph.weights)
+        if np.array_equal(candidate, h):
+            return h
+        h = candidate
+    raise ValueError("圖中存在負權重環")
+
+
+def johnson(
+    graph: CSRGraph,
+    sources: Optional[Sequence[int]] = None,
+    workers: Optional[int] = 0,
+) -> np.ndarray:
+    """Johnson 全點對最短路徑，支援負權重邊
+
+    先以 Bellman–Ford 位勢把所有權重轉為非負，再從每個來源執行 Dijkstra，
+    適合稀疏圖；來源可透過 distance_matrix 的進程池並行計算。
+
+    時間複雜度: O(VE + V(V + E)logV)
+
+    Args:
+        graph: CSR 圖
+        sources: 來源節點編號，預設為所有節點
+        workers: 傳給 distance_matrix 的進程數
+
+    Returns:
+        np.ndarray: 形狀為 (len(sources), V) 的距離矩陣，不可達為 inf
+
+    Raises:
+        ValueError: 圖中存在負權重環時
+    """
+    h = bellman_ford_potential(graph)
+    reweighted = CSRGraph(
+        graph.indptr,
+        graph.indices,
+        # 浮點誤差可能產生極小的負值
+        np.maximum(graph.weights + h[graph.sources()] - h[graph.indices], 0.0),
+    )
+    if sources is None:
+        sources = np.arange(graph.num_nodes)
+    sources = np.asarray(sources, dtype=np.int64)
+    dist = distance_matrix(reweighted, sources, workers=workers)
+    return dist - h[sources, None] + h[None, :]
+
+
+__all__ = [
+    "distance_matrix",
+    "floyd_warshall",
+    "bellman_ford_potential",
+    "johnson",
+]
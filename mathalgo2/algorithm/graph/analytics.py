@@ -0,0 +1,307 @@
+import heapq
+from typing import Tuple
+
+import numpy as np
+
+from mathalgo2.algorithm.graph.csr import CSRGraph
+from mathalgo2.algorithm.graph.traversal import _SMALL_FRONTIER, gather_neighbors
+
+# 生成樹（森林）的邊: (起點編號, 終點編號, 權重)
+EdgeArrays = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def _undirected_edges(graph: CSRGraph) -> EdgeArrays:
+    """把圖的邊視為無向邊返回，排除自環
+
+    無向圖的每條邊在 CSR 中存了兩個方向，只保留 src < dst 的一份。
+    """
+    src = graph.sources()
+    dst = graph.indices
+    mask = src < dst if not graph.directed else src != dst
+    return src[mask], dst[mask], graph.weights[mask]
+
+
+def connected_components(graph: CSRGraph) -> np.ndarray:
+    """連通分量（有向圖視為無向，即弱連通分量）
+
+    以陣列上的並查集實作：每一輪把每條邊兩端中較大的根掛到較小的根下，
+    再以指標跳躍把所有節點直接指向根，並丟棄兩端已同屬一個集合的邊。
+    每一輪都是整批的 NumPy 運算，輪數通常只有 O(log V)。
+
+    時間複雜度: 每輪 O(V + E)
+
+    Args:
+        graph: CSR 圖
+
+    Returns:
+        np.ndarray: 長度為 V 的分量編號，依各分量最小節點編號的順序從 0 開始
+    """
+    n = graph.num_nodes
+    parent = np.arange(n, dtype=np.int64)
+    src, dst, _ = _undirected_edges(graph)
+
+    while len(src):
+        root_src = parent[src]
+        root_dst = parent[dst]
+        active = root_src != root_dst
+        src, dst = src[active], dst[active]
+        if not len(src):
+            break
+        low = np.minimum(root_src[active], root_dst[active])
+        high = np.maximum(root_src[active], root_dst[active])
+        # 根只會指向更小的根，因此不會形成環
+        np.minimum.at(parent, high, low)
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    # 每個集合的根是其中最小的節點編號
+    _, labels = np.unique(parent, return_inverse=True)
+    return labels.astype(np.int64)
+
+
+def strongly_connected_components(graph: CSRGraph) -> np.ndarray:
+    """Tarjan 強連通分量（顯式堆疊，不受遞迴深度限制）
+
+    分量編號依 Tarjan 演算法完成的順序給出，即縮點後 DAG 的逆拓撲順序：
+    若存在從分量 a 到分量 b 的邊，則 a > b。
+
+    時間複雜度: O(V + E)
+
+    Args:
+        graph: CSR 圖
+
+    Returns:
+        np.ndarray: 長度為 V 的強連通分量編號
+    """
+    n = graph.num_nodes
+    indptr = graph.indptr
+    indices = graph.indices
+    index = [-1] * n
+    low = [0] * n
+    on_stack = bytearray(n)
+    component = np.full(n, -1, dtype=np.int64)
+    stack = []
+    counter = 0
+    num_components = 0
+
+    for root in range(n):
+        if index[root] >= 0:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        work = [(root, iter(indices[indptr[root] : indptr[root + 1]].tolist()))]
+
+        while work:
+            v, neighbors = work[-1]
+            for w in neighbors:
+                if index[w] < 0:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append((w, iter(indices[indptr[w] : indptr[w + 1]].tolist())))
+                    break
+                if on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+                if low[v] == index[v]:
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component[w] = num_components
+                        if w == v:
+                            break
+                    num_components += 1
+
+    return component
+
+
+def topological_sort(graph: CSRGraph) -> np.ndarray:
+    """Kahn 拓撲排序
+
+    逐層處理入度為 0 的節點：整層的出鄰居一次展開、以 np.subtract.at
+    扣減入度，前緣很小時改為逐點處理。同一層內的節點依編號排列。
+
+    時間複雜度: O(V + E)
+
+    Args:
+        graph: 有向 CSR 圖
+
+    Returns:
+        np.ndarray: 拓撲順序的節點編號
+
+    Raises:
+        ValueError: 圖中存在環時
+    """
+    n = graph.num_nodes
+    indptr = graph.indptr
+    indices = graph.indices
+    in_degree = np.bincount(indices, minlength=n).astype(np.int64)
+    frontier = np.flatnonzero(in_degree == 0)
+    order = []
+    count = 0
+
+    while len(frontier):
+        order.append(frontier)
+        count += len(frontier)
+        if len(frontier) < _SMALL_FRONTIER:
+            next_frontier = []
+            for u in frontier.tolist():
+                for v in indices[indptr[u] : indptr[u + 1]].tolist():
+                    in_degree[v] -= 1
+                    if in_degree[v] == 0:
+                        next_frontier.append(v)
+            frontier = np.asarray(next_frontier, dtype=np.int64)
+        else:
+            targets = gather_neighbors(graph, frontier)
+            np.subtract.at(in_degree, targets, 1)
+            frontier = np.unique(targets[in_degree[targets] == 0])
+
+    if count < n:
+        raise ValueError("圖中存在環，無法進行拓撲排序")
+    if not order:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(order).astype(np.int64)
+
+
+def kruskal(graph: CSRGraph) -> EdgeArrays:
+    """Kruskal 最小生成樹（圖不連通時為最小生成森林）
+
+    邊依權重穩定排序後，以陣列並查集（路徑減半、依大小合併）逐條檢查，
+    選滿 V - 1 條邊即提前結束。有向圖的邊視為無向邊。
+
+    時間複雜度: O(E log E)
+
+    Args:
+        graph: CSR 圖
+
+    Returns:
+        (sources, targets, weights): 生成樹的邊，依加入順序排列
+    """
+    n = graph.num_nodes
+    src, dst, weights = _undirected_edges(graph)
+    order = np.argsort(weights, kind="stable")
+    parent = list(range(n))
+    size = [1] * n
+    chosen = []
+    remaining = n - 1
+
+    for edge, u, v in zip(order.tolist(), src[order].tolist(), dst[order].tolist()):
+        if remaining == 0:
+            break
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]
+            u = parent[u]
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        if u == v:
+            continue
+        if size[u] < size[v]:
+            u, v = v, u
+        parent[v] = u
+        size[u] += size[v]
+        chosen.append(edge)
+        remaining -= 1
+
+    chosen = np.asarray(chosen, dtype=np.int64)
+    return src[chosen], dst[chosen], weights[chosen]
+
+
+def prim(graph: CSRGraph) -> EdgeArrays:
+    """Prim 最小生成樹（圖不連通時為最小生成森林）
+
+    以二元堆積延遲刪除過期的候選邊（只推入比已知更輕的邊），
+    從每個尚未加入的節點開始生長一棵樹。
+    有向圖會先補上反向邊再視為無向圖。
+
+    時間複雜度: O(E log V)
+
+    Args:
+        graph: CSR 圖
+
+    Returns:
+        (sources, targets, weights): 生成樹的邊，依加入順序排列
+    """
+    if graph.directed:
+        src, dst, weights = _undirected_edges(graph)
+        graph = CSRGraph.from_edges(
+            src, dst, weights, num_nodes=graph.num_nodes, directed=False
+        )
+
+    n = graph.num_nodes
+    indptr = graph.indptr
+    indices = graph.indices
+    all_weights = graph.weights
+    in_tree = bytearray(n)
+    # 目前已知連到樹上的最小權重，只有更好的候選邊才推入堆積
+    best = [float("inf")] * n
+    tree_src, tree_dst, tree_weights = [], [], []
+
+    for root in range(n):
+        if in_tree[root]:
+            continue
+        heap = [(0.0, -1, root)]
+
+        while heap:
+            w, u, v = heapq.heappop(heap)
+            if in_tree[v]:
+                continue
+            in_tree[v] = 1
+            if u >= 0:
+                tree_src.append(u)
+                tree_dst.append(v)
+                tree_weights.append(w)
+            start, end = indptr[v], indptr[v + 1]
+            for x, wx in zip(
+                indices[start:end].tolist(), all_weights[start:end].tolist()
+            ):
+                if not in_tree[x] and wx < best[x]:
+                    best[x] = wx
+                    heapq.heappush(heap, (wx, v, x))
+
+    return (
+        np.asarray(tree_src, dtype=np.int64),
+        np.asarray(tree_dst, dtype=np.int64),
+        np.asarray(tree_weights, dtype=np.float64),
+    )
+
+
+def minimum_spanning_tree(graph: CSRGraph, method: str = "kruskal") -> EdgeArrays:
+    """最小生成樹（森林）
+
+    Args:
+        graph: CSR 圖
+        method: "kruskal" 或 "prim"
+
+    Returns:
+        (sources, targets, weights): 生成樹的邊
+
+    Raises:
+        ValueError: 不支援的方法
+    """
+    if method == "kruskal":
+        return kruskal(graph)
+    if method == "prim":
+        return prim(graph)
+    raise ValueError(f"不支援的最小生成樹方法: {method}")
+
+
+__all__ = [
+    "connected_components",
+    "strongly_connected_components",
+    "topological_sort",
+    "kruskal",
+    "prim",
+    "minimum_spanning_tree",
+]
@@ -0,0 +1,335 @@
+import heapq
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from mathalgo2.algorithm._shared import ArrayHandle, SharedArrays
+from mathalgo2.algorithm.graph.all_pairs import distance_matrix
+from mathalgo2.algorithm.graph.csr import CSRGraph
+from mathalgo2.algorithm.graph.shared import attach_graph, share_graph
+from mathalgo2.algorithm.graph.traversal import bfs_levels, gather_neighbors
+
+# 工作進程連接的共享 CSR 陣列，由 _init_worker 設置
+_worker_shared: Optional[SharedArrays] = None
+
+
+def _init_worker(handles: Dict[str, ArrayHandle]):
+    """工作進程初始化：連接共享的 CSR 陣列"""
+    global _worker_shared
+    _worker_shared = SharedArrays.attach(handles)
+
+
+def pagerank(
+    graph: CSRGraph,
+    damping: float = 0.85,
+    personalization: Optional[np.ndarray] = None,
+    weighted: bool = True,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+) -> np.ndarray:
+    """以稀疏冪迭代計算 PageRank
+
+    每次迭代是一次 CSR 上的稀疏矩陣向量乘法：以 np.bincount 把每條邊的
+    rank[u] * w(u, v) / out_weight(u) 累加到 v。沒有出邊的節點（懸掛節點）
+    的分數依個人化向量重新分配。
+
+    時間複雜度: 每次迭代 O(V + E)
+
+    Args:
+        graph: CSR 圖
+        damping: 阻尼係數
+        personalization: 長度為 V 的非負向量，None 表示均勻分布
+        weighted: 是否依邊權重分配分數
+        tol: 收斂容差，相鄰兩次迭代的 L1 差距小於 V * tol 時停止
+        max_iter: 最大迭代次數
+
+    Returns:
+        np.ndarray: 長度為 V、總和為 1 的 PageRank 分數
+
+    Raises:
+        ValueError: 個人化向量不合法時
+        RuntimeError: 在 max_iter 次迭代內未收斂時
+    """
+    n = graph.num_nodes
+    if n == 0:
+        return np.empty(0)
+
+    if personalization is None:
+        p = np.full(n, 1.0 / n)
+    else:
+        p = np.asarray(personalization, dtype=np.float64)
+        if p.shape != (n,) or np.any(p < 0) or p.sum() <= 0:
+            raise ValueError("個人化向量必須是長度為節點數的非負向量且總和大於 0")
+        p = p / p.sum()
+
+    src = graph.sources()
+    edge_weights = graph.weights if weighted else np.ones(graph.num_edges)
+    out_weight = np.bincount(src, weights=edge_weights, minlength=n)
+    dangling = out_weight == 0
+    # 每條邊的轉移係數 w(u, v) / out_weight(u)
+    coefficients = edge_weights / np.where(dangling, 1.0, out_weight)[src]
+    dst = graph.indices
+
+    rank = p.copy()
+    for _ in range(max_iter):
+        spread = np.bincount(dst, weights=rank[src] * coefficients, minlength=n)
+        new_rank = damping * (spread + rank[dangling].sum() * p) + (1 - damping) * p
+        error = np.abs(new_rank - rank).sum()
+        rank = new_rank
+        if error < n * tol:
+            return rank / rank.sum()
+
+    raise RuntimeError(f"PageRank 在{max_iter}次迭代後未收斂")
+
+
+def degree_centrality(graph: CSRGraph, mode: str = "out") -> np.ndarray:
+    """度中心性，以 V - 1 正規化
+
+    Args:
+        graph: CSR 圖
+        mode: "out"、"in" 或 "total"（無向圖三者相同）
+
+    Returns:
+        np.ndarray: 長度為 V 的度中心性
+
+    Raises:
+        ValueError: 不支援的 mode
+    """
+    if mode == "out" or not graph.directed:
+        degree = graph.out_degree()
+    elif mode == "in":
+        degree = graph.in_degree()
+    elif mode == "total":
+        degree = graph.out_degree() + graph.in_degree()
+    else:
+        raise ValueError(f"不支援的度數類型: {mode}")
+    n = graph.num_nodes
+    return degree / (n - 1) if n > 1 else np.zeros(n)
+
+
+def closeness_centrality(
+    graph: CSRGraph,
+    nodes: Optional[Sequence[int]] = None,
+    weighted: Optional[bool] = None,
+    workers: Optional[int] = 0,
+    chunk_size: int = 256,
+) -> np.ndarray:
+    """接近中心性（Wasserman–Faust 對不連通圖的修正版本）
+
+    節點 u 的分數為 (r - 1) / sum(d(v, u)) * (r - 1) / (V - 1)，
+    其中 r 為可到達 u 的節點數（含 u）。距離在反向圖上求得：無權圖使用
+    逐層向量化的 BFS；有權圖依 chunk_size 分批交給 distance_matrix，
+    記憶體只需 chunk_size x V。
+
+    時間複雜度: 無權 O(k(V + E))，有權 O(k(V + E)logV)，k 為查詢節點數
+
+    Args:
+        graph: CSR 圖，權重必須非負
+        nodes: 要計算的節點編號，預設為所有節點
+        weighted: 是否使用邊權重，None 時若所有權重皆為 1 則視為無權圖
+        workers: 有權圖時傳給 distance_matrix 的進程數
+        chunk_size: 有權圖時每批計算的節點數
+
+    Returns:
+        np.ndarray: 與 nodes 對齊的接近中心性
+    """
+    n = graph.num_nodes
+    if nodes is None:
+        nodes = np.arange(n)
+    nodes = np.asarray(nodes, dtype=np.int64)
+    if weighted is None:
+        weighted = not np.all(graph.weights == 1.0)
+    reverse = graph.reverse()
+    reachable = np.zeros(len(nodes))
+    total = np.zeros(len(nodes))
+
+    if weighted:
+        for start in range(0, len(nodes), chunk_size):
+            batch = slice(start, start + chunk_size)
+            dist = distance_matrix(reverse, nodes[batch], workers=workers)
+            finite = np.isfinite(dist)
+            reachable[batch] = finite.sum(axis=1) - 1
+            total[batch] = np.where(finite, dist, 0.0).sum(axis=1)
+    else:
+        for i, node in enumerate(nodes.tolist()):
+            depth = bfs_levels(reverse, node)
+            reachable[i] = np.count_nonzero(depth > 0)
+            total[i] = depth[depth > 0].sum()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        score = np.where(total > 0, reachable / total, 0.0)
+    if n > 1:
+        score *= reachable / (n - 1)
+    return score
+
+
+def _brandes_unweighted(graph: CSRGraph, source: int, betweenness: np.ndarray):
+    """無權圖上單一來源的 Brandes 依賴累加（逐層向量化），結果加到 betweenness
+
+    前向逐層 BFS 時保留每層的最短路徑 DAG 邊 (v, w)，以 np.add.at 累加
+    最短路徑數 sigma；反向時逐層把 sigma[v] / sigma[w] * (1 + delta[w])
+    累加到 delta[v]。Python 迴圈次數只等於 BFS 層數。
+    """
+    n = graph.num_nodes
+    indptr = graph.indptr
+    dist = np.full(n, -1, dtype=np.int64)
+    sigma = np.zeros(n)
+    dist[source] = 0
+    sigma[source] = 1.0
+    frontier = np.array([source], dtype=np.int64)
+    layers = []
+    level = 0
+
+    while len(frontier):
+        level += 1
+        counts = indptr[frontier + 1] - indptr[frontier]
+        heads = gather_neighbors(graph, frontier)
+        tails = np.repeat(frontier, counts)
+        dist[heads[dist[heads] < 0]] = level
+        on_dag = dist[heads] == level
+        tails, heads = tails[on_dag], heads[on_dag]
+        np.add.at(sigma, heads, sigma[tails])
+        layers.append((tails, heads))
+        frontier = np.unique(heads)
+
+    delta = np.zeros(n)
+    for tails, heads in reversed(layers):
+        np.add.at(delta, tails, sigma[tails] / sigma[heads] * (1.0 + delta[heads]))
+    delta[source] = 0.0
+    betweenness += delta
+
+
+def _brandes_weighted(graph: CSRGraph, source: int, betweenness: np.ndarray):
+    """有權圖上單一來源的 Brandes 依賴累加（Dijkstra），結果加到 betweenness"""
+    indptr = graph.indptr
+    indices = graph.indices
+    all_weights = graph.weights
+    order = []
+    predecessors = {source: []}
+    sigma = {source: 1}
+    dist = {source: 0.0}
+    settled = set()
+    heap = [(0.0, source)]
+
+    while heap:
+        d, v = heapq.heappop(heap)
+        if v in settled:
+            continue
+        settled.add(v)
+        order.append(v)
+        start, end = indptr[v], indptr[v + 1]
+        for w, weight in zip(
+            indices[start:end].tolist(), all_weights[start:end].tolist()
+        ):
+            candidate = d + weight
+            known = dist.get(w)
+            if known is None or candidate < known:
+                dist[w] = candidate
+                sigma[w] = sigma[v]
+                predecessors[w] = [v]
+                heapq.heappush(heap, (candidate, w))
+            elif candidate == known and w not in settled:
+                sigma[w] += sigma[v]
+                predecessors[w].append(v)
+
+    delta = dict.fromkeys(order, 0.0)
+    for w in reversed(order):
+        coefficient = (1.0 + delta[w]) / sigma[w]
+        for v in predecessors[w]:
+            delta[v] += sigma[v] * coefficient
+    del delta[source]
+    touched = np.fromiter(delta.keys(), dtype=np.int64, count=len(delta))
+    betweenness[touched] += np.fromiter(delta.values(), dtype=float, count=len(delta))
+
+
+def _brandes(graph: CSRGraph, sources: List[int], weighted: bool) -> np.ndarray:
+    """從 sources 逐一執行 Brandes 依賴累加，返回未縮放的介數"""
+    betweenness = np.zeros(graph.num_nodes)
+    accumulate = _brandes_weighted if weighted else _brandes_unweighted
+    for source in sources:
+        accumulate(graph, source, betweenness)
+    return betweenness
+
+
+def _brandes_chunk(sources: List[int], weighted: bool) -> np.ndarray:
+    """工作進程: 在共享的 CSR 圖上處理一批來源"""
+    return _brandes(attach_graph(_worker_shared), sources, weighted)
+
+
+def betweenness_centrality(
+    graph: CSRGraph,
+    k: Optional[int] = None,
+    normalized: bool = True,
+    weighted: Optional[bool] = None,
+    seed: Optional[int] = None,
+    workers: Optional[int] = 0,
+    chunk_size: Optional[int] = None,
+) -> np.ndarray:
+    """Brandes 介數中心性，可抽樣來源節點近似
+
+    k 不為 None 時均勻抽出 k 個來源，結果乘以 V / k 作為無偏估計。
+    各來源互相獨立，可分批交給進程池；CSR 陣列放在共享記憶體中，
+    工作進程只收到來源列表並返回長度為 V 的部分和。
+
+    無權圖的每個來源以逐層向量化的 BFS 處理，有權圖則逐點執行 Dijkstra。
+
+    時間複雜度: 無權 O(kE)，有權 O(k(E + V log V))
+
+    Args:
+        graph: CSR 圖，權重必須非負
+        k: 抽樣的來源數，None 表示使用所有節點（精確值）
+        normalized: 是否以 (V - 1)(V - 2) 正規化
+        weighted: 是否使用邊權重，None 時若所有權重皆為 1 則視為無權圖
+        seed: 抽樣的隨機種子
+        workers: 進程數，None 表示使用所有 CPU 核心，0 表示在目前進程中計算
+        chunk_size: 每個任務處理的來源數
+
+    Returns:
+        np.ndarray: 長度為 V 的介數中心性
+    """
+    n = graph.num_nodes
+    if weighted is None:
+        weighted = not np.all(graph.weights == 1.0)
+    if k is None or k >= n:
+        sources = np.arange(n)
+    else:
+        sources = np.random.default_rng(seed).choice(n, size=k, replace=False)
+    sources = sources.tolist()
+    workers = os.cpu_count() if workers is None else workers
+
+    if workers == 0 or len(sources) <= 1:
+        betweenness = _brandes(graph, sources, weighted)
+    else:
+        if chunk_size is None:
+            chunk_size = max(1, len(sources) // (workers * 4))
+        chunks = [
+            sources[i : i + chunk_size] for i in range(0, len(sources), chunk_size)
+        ]
+        with SharedArrays() as shared:
+            handles = share_graph(graph, shared)
+            with ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(handles,)
+            ) as executor:
+                betweenness = sum(
+                    executor.map(_brandes_chunk, chunks, [weighted] * len(chunks))
+                )
+
+    if len(sources) < n and len(sources) > 0:
+        betweenness = betweenness * (n / len(sources))
+    if not graph.directed:
+        # 無向圖的每條路徑會從兩端各計算一次
+        betweenness = betweenness / 2
+    if normalized and n > 2:
+        scale = (n - 1) * (n - 2)
+        betweenness = betweenness / (scale if graph.directed else scale / 2)
+    return betweenness
+
+
+__all__ = [
+    "pagerank",
+    "degree_centrality",
+    "closeness_centrality",
+    "betweenness_centrality",
+]
@@ -0,0 +1,305 @@
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+def _index_dtype(size: int) -> np.dtype:
+    """依節點數選擇最小的整數型別，降低 indices 陣列的記憶體用量"""
+    return np.dtype(np.int32) if size < np.iinfo(np.int32).max else np.dtype(np.int64)
+
+
+def _stable_order(keys: np.ndarray, num_keys: int) -> np.ndarray:
+    """依 keys 穩定排序的索引
+
+    把 (key, 位置) 編碼成單一 int64 後做不穩定的數值排序，再取出低位的位置。
+    NumPy 對數值的 np.sort 有 SIMD 實作，比 argsort(kind="stable") 快數倍；
+    編碼放不進 63 位元時退回穩定的 argsort。
+    """
+    n = len(keys)
+    position_bits = max(int(n).bit_length(), 1)
+    if max(int(num_keys), 1).bit_length() + position_bits > 63:
+        return np.argsort(keys, kind="stable")
+    encoded = (keys.astype(np.int64) << position_bits) | np.arange(n, dtype=np.int64)
+    encoded.sort()
+    encoded &= (1 << position_bits) - 1
+    return encoded
+
+
+class CSRGraph:
+    """壓縮稀疏列 (CSR) 格式的圖
+
+    節點在內部以 0..n-1 的整數編號，節點 u 的出邊位於
+    ``indices[indptr[u]:indptr[u + 1]]``，對應權重位於同一區段的 ``weights``。
+    與 GraphAlgo 使用的 dict 鄰接表相比，每條邊只需一個整數與一個浮點數。
+
+    Attributes:
+        indptr (np.ndarray): 長度 n+1 的 int64 陣列，每個節點出邊的起始位置
+        indices (np.ndarray): 長度 m 的整數陣列，邊的終點編號
+        weights (np.ndarray): 長度 m 的 float64 陣列，邊的權重
+        labels (Optional[List[Any]]): 節點編號對應的原始標籤，None 表示標籤即編號
+        directed (bool): 建構時是否視為有向圖
+    """
+
+    def __init__(
+        self,
+        indptr: Sequence[int],
+        indices: Sequence[int],
+        weights: Optional[Sequence[float]] = None,
+        labels: Optional[Sequence[Any]] = None,
+        directed: bool = True,
+    ):
+        """初始化 CSR 圖
+
+        Args:
+            indptr: 每個節點出邊的起始位置，長度為節點數 + 1
+            indices: 邊的終點編號
+            weights: 邊的權重，None 表示所有權重為 1.0
+            labels: 節點標籤，None 表示直接使用整數編號
+            directed: 是否為有向圖
+
+        Raises:
+            ValueError: 陣列長度不一致時
+        """
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        num_nodes = len(self.indptr) - 1
+        self.indices = np.asarray(indices, dtype=_index_dtype(num_nodes))
+        if weights is None:
+            self.weights = np.ones(len(self.indices), dtype=np.float64)
+        else:
+            self.weights = np.asarray(weights, dtype=np.float64)
+
+        if num_nodes < 0 or self.indptr[-1] != len(self.indices):
+            raise ValueError("indptr 與 indices 的長度不一致")
+        if len(self.weights) != len(self.indices):
+            raise ValueError("weights 與 indices 的長度不一致")
+        if labels is not None and len(labels) != num_nodes:
+            raise ValueError("labels 的長度必須等於節點數")
+
+        self.labels = list(labels) if labels is not None else None
+        self.directed = directed
+        self._label_to_id: Optional[Dict[Any, int]] = None
+        self._reverse: Optional["CSRGraph"] = None
+
+    @classmethod
+    def from_edges(
+        cls,
+        src: Sequence[Any],
+        dst: Sequence[Any],
+        weights: Optional[Sequence[float]] = None,
+        num_nodes: Optional[int] = None,
+        labels: Optional[Sequence[Any]] = None,
+        directed: bool = True,
+    ) -> "CSRGraph":
+        """從邊列表建立 CSR 圖
+
+        src/dst 為整數陣列時直接作為節點編號；否則視為節點標籤，
+        依首次出現的順序編號。排序使用穩定排序，同一節點的鄰居保持輸入順序。
+
+        Args:
+            src: 邊的起點
+            dst: 邊的終點
+            weights: 邊的權重
+            num_nodes: 節點數，預設為最大編號 + 1
+            labels: 整數編號對應的節點標籤
+            directed: False 時每條邊會加入兩個方向
+
+        Returns:
+            CSRGraph: 建立好的圖
+        """
+        src = np.asarray(src)
+        dst = np.asarray(dst)
+        if src.shape != dst.shape:
+            raise ValueError("src 與 dst 的長度不一致")
+        w = None if weights is None else np.asarray(weights, dtype=np.float64)
+
+        if src.dtype.kind not in "iu" or dst.dtype.kind not in "iu":
+            codes, uniques = pd.factorize(np.concatenate([src, dst]).astype(object))
+            src, dst = codes[: len(src)], codes[len(src) :]
+            labels = list(uniques)
+            num_nodes = len(labels)
+
+        if num_nodes is None:
+            num_nodes = int(max(src.max(initial=-1), dst.max(initial=-1))) + 1
+        if not directed:
+            src, dst = np.concatenate([src, dst]), np.concatenate([dst, src])
+            if w is not None:
+                w = np.concatenate([w, w])
+
+        order = _stable_order(src, num_nodes)
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=num_nodes), out=indptr[1:])
+        return cls(
+            indptr,
+            dst[order],
+            None if w is None else w[order],
+            labels=labels,
+            directed=directed,
+        )
+
+    @classmethod
+    def from_dict(
+        cls,
+        graph: Dict[Any, List[Any]],
+        weights: Optional[Dict[Tuple[Any, Any], float]] = None,
+        default_weight: float = 1.0,
+    ) -> "CSRGraph":
+        """從 GraphAlgo 使用的 dict 鄰接表建立 CSR 圖
+
+        權重查詢規則與 GraphAlgo 相同：先找 (u, v)，再找 (v, u)，
+        都沒有時使用 default_weight。
+
+        Args:
+            graph: 鄰接表，key 為節點，value 為相鄰節點列表
+            weights: 邊的權重字典
+            default_weight: 未指定權重的邊所使用的權重
+
+        Returns:
+            CSRGraph: 建立好的圖
+        """
+        label_to_id = {node: i for i, node in enumerate(graph)}
+        for neighbors in graph.values():
+            for v in neighbors:
+                if v not in label_to_id:
+                    label_to_id[v] = len(label_to_id)
+
+        num_nodes = len(label_to_id)
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        for u, neighbors in graph.items():
+            indptr[label_to_id[u] + 1] = len(neighbors)
+        np.cumsum(indptr, out=indptr)
+
+        num_edges = int(indptr[-1])
+        indices = np.empty(num_edges, dtype=_index_dtype(num_nodes))
+        w = np.full(num_edges, default_weight, dtype=np.float64)
+        for u, neighbors in graph.items():
+            start = indptr[label_to_id[u]]
+            indices[start : start + len(neighbors)] = [
+                label_to_id[v] for v in neighbors
+            ]
+            if weights:
+                for offset, v in enumerate(neighbors):
+                    weight = weights.get((u, v))
+                    if weight is None:
+                        weight = weights.get((v, u), default_weight)
+                    w[start + offset] = weight
+
+        graph_obj = cls(indptr, indices, w, labels=list(label_to_id))
+        graph_obj._label_to_id = label_to_id
+        return graph_obj
+
+    @property
+    def num_nodes(self) -> int:
+        """節點數"""
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        """邊數（無向圖的每條邊計為兩條有向邊）"""
+        return len(self.indices)
+
+    def node_id(self, label: Hashable) -> int:
+        """將節點標籤轉為整數編號
+
+        Raises:
+            KeyError: 節點不在圖中時
+        """
+        if self.labels is None:
+            if isinstance(label, (int, np.integer)) and 0 <= label < self.num_nodes:
+                return int(label)
+            raise KeyError(f"節點 {label} 不存在")
+        if self._label_to_id is None:
+            self._label_to_id = {node: i for i, node in enumerate(self.labels)}
+        try:
+            return self._label_to_id[label]
+        except KeyError:
+            raise KeyError(f"節點 {label} 不存在") from None
+
+    def node_label(self, node: int) -> Any:
+        """將整數編號轉為節點標籤"""
+        return node if self.labels is None else self.labels[node]
+
+    def to_labels(self, nodes: Iterable[int]) -> List[Any]:
+        """將整數編號序列轉為節點標籤列表"""
+        if self.labels is None:
+            return [int(node) for node in nodes]
+        return [self.labels[node] for node in nodes]
+
+    def neighbors(self, node: int) -> np.ndarray:
+        """返回節點的出鄰居編號（陣列視圖，不複製）"""
+        return self.indices[self.indptr[node] : self.indptr[node + 1]]
+
+    def edge_weights(self, node: int) -> np.ndarray:
+        """返回節點出邊的權重（陣列視圖，不複製）"""
+        return self.weights[self.indptr[node] : self.indptr[node + 1]]
+
+    def out_degree(self) -> np.ndarray:
+        """每個節點的出度"""
+        return np.diff(self.indptr)
+
+    def in_degree(self) -> np.ndarray:
+        """每個節點的入度"""
+        return np.bincount(self.indices, minlength=self.num_nodes)
+
+    def sources(self) -> np.ndarray:
+        """每條邊的起點編號，與 indices 對齊"""
+        return np.repeat(
+            np.arange(self.num_nodes, dtype=self.indices.dtype), self.out_degree()
+        )
+
+    def reverse(self) -> "CSRGraph":
+        """返回所有邊反向後的圖（結果會被快取）"""
+        if self._reverse is None:
+            rev = CSRGraph.from_edges(
+                self.indices,
+                self.sources(),
+                self.weights,
+                num_nodes=self.num_nodes,
+            )
+            rev.directed = self.directed
+            rev.labels = self.labels
+            rev._label_to_id = self._label_to_id
+            rev._reverse = self
+            self._reverse = rev
+        return self._reverse
+
+    def to_dict(self) -> Tuple[Dict[Any, List[Any]], Dict[Tuple[Any, Any], float]]:
+        """轉回 GraphAlgo 使用的鄰接表與權重字典"""
+        graph = {}
+        weights = {}
+        for u in range(self.num_nodes):
+            label = self.node_label(u)
+            start, end = self.indptr[u], self.indptr[u + 1]
+            neighbors = self.to_labels(self.indices[start:end].tolist())
+            graph[label] = neighbors
+            for v, w in zip(neighbors, self.weights[start:end].tolist()):
+                weights[(label, v)] = w
+        return graph, weights
+
+    def nbytes(self) -> int:
+        """三個 CSR 陣列佔用的位元組數"""
+        return self.indptr.nbytes + self.indices.nbytes + self.weights.nbytes
+
+    def bfs(self, start: Any) -> List[Any]:
+        """廣度優先搜尋，返回節點標籤的訪問順序"""
+        from mathalgo2.algorithm.graph.traversal import bfs
+
+        return self.to_labels(bfs(self, self.node_id(start)))
+
+    def dfs(self, start: Any) -> List[Any]:
+        """深度優先搜尋，返回節點標籤的訪問順序"""
+        from mathalgo2.algorithm.graph.traversal import dfs
+
+        return self.to_labels(dfs(self, self.node_id(start)))
+
+    def dijkstra(self, start: Any) -> Tuple[np.ndarray, np.ndarray]:
+        """Dijkstra 最短路徑，返回以節點編號索引的距離與前驅陣列"""
+        from mathalgo2.algorithm.graph.paths import dijkstra
+
+        return dijkstra(self, self.node_id(start))
+
+    def __repr__(self) -> str:
+        return f"CSRGraph(num_nodes={self.num_nodes}, num_edges={self.num_edges})"
+
+
+__all__ = ["CSRGraph"]
@@ -0,0 +1,191 @@
+import heapq
+from typing import Any, Dict, Iterable, List
+
+from mathalgo2.structure import Graph
+
+INF = float("inf")
+
+
+class DynamicSSSP:
+    """可增量維護的單源最短路徑
+
+    包裝一個 structure.Graph，所有修改都透過本類別的方法進行，
+    每次修改後只修補受影響的節點，而不是重新執行整個 Dijkstra：
+
+    - 新增邊或權重變小: 若經由該邊能縮短終點距離，從終點開始做局部 Dijkstra
+    - 刪除邊或權重變大: 只有最短路徑樹上的邊會影響距離。找出以終點為根的
+      子樹，從子樹外的入鄰居重新估計這些節點的距離，再做局部 Dijkstra
+
+    修補的成本與受影響節點的度數和成正比，touched 記錄上一次修改處理的節點數。
+
+    Attributes:
+        graph (Graph): 被維護的圖，權重必須非負
+        source: 起點
+        distances (Dict[Any, float]): 可達節點到起點的最短距離
+        parents (Dict[Any, Any]): 最短路徑樹中每個節點的父節點，起點為 None
+        touched (int): 上一次修改時距離被重新處理的節點數
+    """
+
+    def __init__(self, graph: Graph, source: Any):
+        """建立索引並計算初始的最短路徑
+
+        Args:
+            graph: 有向加權圖
+            source: 起點
+
+        Raises:
+            KeyError: 起點不在圖中時
+        """
+        if source not in graph.graph:
+            raise KeyError(f"節點 {source} 不存在")
+        self.graph = graph
+        self.source = source
+        self.distances: Dict[Any, float] = {}
+        self.parents: Dict[Any, Any] = {}
+        self.touched = 0
+        self.recompute()
+
+    def recompute(self):
+        """從頭執行 Dijkstra 重建所有距離"""
+        self.distances = {self.source: 0.0}
+        self.parents = {self.source: None}
+        self.touched = self._propagate([(0.0, self.source)])
+
+    def distance(self, vertex: Any) -> float:
+        """起點到 vertex 的最短距離，不可達時為 inf"""
+        return self.distances.get(vertex, INF)
+
+    def path(self, vertex: Any) -> List[Any]:
+        """起點到 vertex 的最短路徑，不可達時為空列表"""
+        if vertex not in self.distances:
+            return []
+        path = []
+        while vertex is not None:
+            path.append(vertex)
+            vertex = self.parents[vertex]
+        path.reverse()
+        return path
+
+    def add_edge(self, u: Any, v: Any, weight: float = 1.0):
+        """新增邊或修改既有邊的權重，並修補距離
+
+        Raises:
+            ValueError: 權重為負時
+        """
+        if weight < 0:
+            raise ValueError("動態最短路徑不支援負權重")
+        old = self.graph.graph.get(u, {}).get(v)
+        self.graph.add_edge(u, v, weight)
+        if old is not None and weight > old and self.parents.get(v) == u:
+            self._repair(self._subtree(v))
+        else:
+            self._relax_edge(u, v, weight)
+
+    def set_weight(self, u: Any, v: Any, weight: float):
+        """修改既有邊的權重
+
+        Raises:
+            KeyError: 邊不存在時
+            ValueError: 權重為負時
+        """
+        if not self.graph.has_edge(u, v):
+            raise KeyError(f"邊 {u} -> {v} 不存在")
+        self.add_edge(u, v, weight)
+
+    def remove_edge(self, u: Any, v: Any):
+        """刪除邊，並修補距離"""
+        if not self.graph.has_edge(u, v):
+            self.touched = 0
+            return
+        affected = self._subtree(v) if self.parents.get(v) == u else []
+        self.graph.remove_edge(u, v)
+        self._repair(affected)
+
+    def remove_vertex(self, vertex: Any):
+        """刪除節點及其所有邊，並修補距離
+
+        Raises:
+            ValueError: 刪除起點時
+        """
+        if vertex == self.source:
+            raise ValueError("不能刪除起點")
+        affected = self._subtree(vertex) if vertex in self.distances else []
+        self.graph.remove_vertex(vertex)
+        self.distances.pop(vertex, None)
+        self.parents.pop(vertex, None)
+        self._repair([node for node in affected if node != vertex])
+
+    def _relax_edge(self, u: Any, v: Any, weight: float):
+        """邊變短或新增時，若能縮短 v 的距離則從 v 開始局部傳播"""
+        candidate = self.distances.get(u, INF) + weight
+        if candidate < self.distances.get(v, INF):
+            self.distances[v] = candidate
+            self.parents[v] = u
+            self.touched = self._propagate([(candidate, v)])
+        else:
+            self.touched = 0
+
+    def _subtree(self, root: Any) -> List[Any]:
+        """最短路徑樹中以 root 為根的子樹（含 root）"""
+        subtree = [root]
+        for node in subtree:
+            for child in self.graph.successors(node):
+                if self.parents.get(child) == node:
+                    subtree.append(child)
+        return subtree
+
+    def _repair(self, affected: Iterable[Any]):
+        """重新估計受影響節點的距離，再從它們開始局部傳播
+
+        受影響節點的舊距離都失效；其餘節點的最短路徑不經過被刪除或變長的邊，
+        距離保持不變，因此只需從子樹外的入鄰居取最小值作為初始估計。
+        """
+        affected = list(affected)
+        affected_set = set(affected)
+        for node in affected:
+            del self.distances[node]
+            del self.parents[node]
+
+        heap = []
+        for node in affected:
+            best, parent = INF, None
+            for predecessor in self.graph.predecessors(node):
+                if predecessor in affected_set:
+                    continue
+                candidate = (
+                    self.distances.get(predecessor, INF)
+                    + self.graph.graph[predecessor][node]
+                )
+                if candidate < best:
+                    best, parent = candidate, predecessor
+            if parent is not None:
+                self.distances[node] = best
+                self.parents[node] = parent
+                heap.append((best, node))
+
+        heapq.heapify(heap)
+        self.touched = len(affected) + self._propagate(heap)
+
+    def _propagate(self, heap: List) -> int:
+        """以 heap 中的節點為起點執行 Dijkstra 鬆弛，返回被處理的節點數"""
+        distances = self.distances
+        parents = self.parents
+        adjacency = self.graph.graph
+        processed = 0
+
+        while heap:
+            d, u = heapq.heappop(heap)
+            if d > distances.get(u, INF):
+                continue
+            processed += 1
+            for v, weight in adjacency[u].items():
+                candidate = d + weight
+                if candidate < distances.get(v, INF):
+                    distances[v] = candidate
+                    parents[v] = u
+                    heapq.heappush(heap, (candidate, v))
+
+        return processed
+
+
+__all__ = ["DynamicSSSP"]
@@ -0,0 +1,333 @@
+import json
+import struct
+from pathlib import Path
+from typing import Any, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from mathalgo2.algorithm.graph.csr import CSRGraph
+
+PathLike = Union[str, Path]
+
+# 二進位格式: 固定長度檔頭，之後依序為對齊到 64 位元組的 indptr、indices、
+# weights 陣列，最後是可選的節點標籤 JSON
+_MAGIC = b"MAGRAPH\x00"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIQQ8s8s8sQQQQQ")
+_HEADER_SIZE = 128
+_ALIGNMENT = 64
+_FLAG_DIRECTED = 1
+_FLAG_LABELS = 2
+
+
+def _edges_to_graph(
+    src: List[np.ndarray],
+    dst: List[np.ndarray],
+    weights: Optional[List[np.ndarray]],
+    num_nodes: Optional[int],
+    directed: bool,
+) -> CSRGraph:
+    """把分塊讀入的邊陣列串接後建立 CSR 圖"""
+    src = np.concatenate(src) if src else np.empty(0, dtype=np.int64)
+    dst = np.concatenate(dst) if dst else np.empty(0, dtype=np.int64)
+    w = np.concatenate(weights) if weights else None
+    return CSRGraph.from_edges(src, dst, w, num_nodes=num_nodes, directed=directed)
+
+
+def read_edge_list(
+    path: PathLike,
+    sep: Optional[str] = None,
+    header: bool = False,
+    comment: Optional[str] = "#",
+    weighted: Optional[bool] = None,
+    directed: bool = True,
+    num_nodes: Optional[int] = None,
+    chunksize: int = 1_000_000,
+) -> CSRGraph:
+    """分塊讀取邊列表 CSV/TSV 並直接建立 CSR 圖
+
+    每一列為 ``起點 終點 [權重]``。以 pandas 的 C 解析器逐塊讀取，每塊只轉成
+    NumPy 陣列保存，不經過 Python 的 dict 或逐邊迴圈。起點與終點皆為整數時
+    直接作為節點編號，否則視為標籤並依首次出現的順序編號。
+
+    Args:
+        path: 檔案路徑，可為 .gz/.bz2 等 pandas 支援的壓縮格式
+        sep: 分隔符號，None 時 .tsv/.tab 使用 tab，.csv 使用逗號，其餘使用空白
+        header: 第一列是否為欄位名稱
+        comment: 註解字元，該字元之後的內容會被忽略
+        weighted: 是否讀取第三欄作為權重，None 表示有第三欄時才讀取
+        directed: False 時每條邊加入兩個方向
+        num_nodes: 節點數，預設為最大編號 + 1
+        chunksize: 每塊讀取的列數
+
+    Returns:
+        CSRGraph: 建立好的圖
+
+    Raises:
+        ValueError: 檔案欄位少於兩欄時
+    """
+    path = Path(path)
+    if sep is None:
+        suffixes = [suffix.lower() for suffix in path.suffixes]
+        if ".tsv" in suffixes or ".tab" in suffixes:
+            sep = "\t"
+        elif ".csv" in suffixes:
+            sep = ","
+        else:
+            sep = r"\s+"
+
+    reader = pd.read_csv(
+        path,
+        sep=sep,
+        header=0 if header else None,
+        comment=comment,
+        chunksize=chunksize,
+    )
+    src, dst, weights = [], [], []
+    for chunk in reader:
+        if chunk.shape[1] < 2:
+            raise ValueError("邊列表至少需要起點與終點兩欄")
+        if weighted is None:
+            weighted = chunk.shape[1] >= 3
+        src.append(chunk.iloc[:, 0].to_numpy())
+        dst.append(chunk.iloc[:, 1].to_numpy())
+        if weighted:
+            weights.append(chunk.iloc[:, 2].to_numpy(dtype=np.float64))
+
+    return _edges_to_graph(src, dst, weights or None, num_nodes, directed)
+
+
+def write_edge_list(
+    graph: CSRGraph, path: PathLike, sep: str = ",", weighted: bool = True
+):
+    """把 CSR 圖寫成邊列表（無向圖的每條邊寫出兩個方向）"""
+    src = graph.sources()
+    dst = graph.indices
+    if graph.labels is not None:
+        labels = np.asarray(graph.labels, dtype=object)
+        src, dst = labels[src], labels[dst]
+    columns = {"source": src, "target": dst}
+    if weighted:
+        columns["weight"] = graph.weights
+    pd.DataFrame(columns).to_csv(path, sep=sep, header=False, index=False)
+
+
+def read_matrix_market(path: PathLike, chunksize: int = 1_000_000) -> CSRGraph:
+    """分塊讀取 Matrix Market 座標格式 (.mtx) 的鄰接矩陣
+
+    支援 real/integer/pattern 與 general/symmetric。symmetric 矩陣只存下三角，
+    讀入後補上對稱的另一半並標記為無向圖；pattern 矩陣的權重皆為 1。
+
+    Args:
+        path: 檔案路徑
+        chunksize: 每塊讀取的非零元素數
+
+    Returns:
+        CSRGraph: 建立好的圖，節點編號為列/行索引減 1
+
+    Raises:
+        ValueError: 檔案不是方陣的座標格式時
+    """
+    with open(path, "r") as f:
+        banner = f.readline().lower().split()
+        if len(banner) < 5 or banner[0] != "%%matrixmarket":
+            raise ValueError("不是有效的 Matrix Market 檔案")
+        _, obj, fmt, field, symmetry = banner[:5]
+        if obj != "matrix" or fmt != "coordinate":
+            raise ValueError("只支援 coordinate 格式的矩陣")
+        if field == "complex" or symmetry not in ("general", "symmetric"):
+            raise ValueError(f"不支援的 Matrix Market 類型: {field} {symmetry}")
+
+        skip = 1
+        line = f.readline()
+        while line.startswith("%") or not line.strip():
+            skip += 1
+            line = f.readline()
+        rows, cols, _ = (int(value) for value in line.split()[:3])
+        skip += 1
+    if rows != cols:
+        raise ValueError("鄰接矩陣必須是方陣")
+
+    weighted = field != "pattern"
+    reader = pd.read_csv(
+        path,
+        sep=r"\s+",
+        header=None,
+        skiprows=skip,
+        comment="%",
+        chunksize=chunksize,
+        usecols=[0, 1, 2] if weighted else [0, 1],
+    )
+    src, dst, weights = [], [], []
+    for chunk in reader:
+        i = chunk[0].to_numpy(dtype=np.int64) - 1
+        j = chunk[1].to_numpy(dtype=np.int64) - 1
+        w = chunk[2].to_numpy(dtype=np.float64) if weighted else np.ones(len(i))
+        src.append(i)
+        dst.append(j)
+        weights.append(w)
+        if symmetry == "symmetric":
+            off_diagonal = i != j
+            src.append(j[off_diagonal])
+            dst.append(i[off_diagonal])
+            weights.append(w[off_diagonal])
+
+    graph = _edges_to_graph(src, dst, weights, rows, directed=True)
+    graph.directed = symmetry == "general"
+    return graph
+
+
+def write_matrix_market(graph: CSRGraph, path: PathLike):
+    """把 CSR 圖寫成 Matrix Market 座標格式（general，索引從 1 開始）"""
+    with open(path, "w") as f:
+        f.write("%%MatrixMarket matrix coordinate real general\n")
+        f.write(f"{graph.num_nodes} {graph.num_nodes} {graph.num_edges}\n")
+        pd.DataFrame(
+            {
+                "row": graph.sources() + 1,
+                "col": graph.indices.astype(np.int64) + 1,
+                "value": graph.weights,
+            }
+        ).to_csv(f, sep=" ", header=False, index=False)
+
+
+def _aligned(offset: int) -> int:
+    """向上對齊到 _ALIGNMENT 的倍數"""
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _labels_from_json(value: Any) -> Any:
+    """把 JSON 陣列轉回 tuple: 節點標籤必須可雜湊，因此原本一定是 tuple"""
+    if isinstance(value, list):
+        return tuple(_labels_from_json(item) for item in value)
+    return value
+
+
+def save_binary(graph: CSRGraph, path: PathLike):
+    """以可記憶體映射的二進位格式保存 CSR 圖
+
+    檔頭記錄魔術字串、版本、旗標、節點數、邊數、三個陣列的 dtype 與位移，
+    陣列以原生位元組直接寫出並對齊到 64 位元組；節點標籤以 JSON 附加在最後，
+    tuple 標籤（例如網格圖的 (row, col)）存為 JSON 陣列，載入時轉回 tuple。
+
+    Raises:
+        ValueError: 節點標籤無法以 JSON 表示，或載入後無法還原為相同的標籤時
+    """
+    arrays = [
+        np.ascontiguousarray(graph.indptr),
+        np.ascontiguousarray(graph.indices),
+        np.ascontiguousarray(graph.weights),
+    ]
+    offsets = []
+    offset = _HEADER_SIZE
+    for array in arrays:
+        offsets.append(offset)
+        offset = _aligned(offset + array.nbytes)
+
+    labels = b""
+    flags = _FLAG_DIRECTED if graph.directed else 0
+    if graph.labels is not None:
+        try:
+            text = json.dumps(graph.labels, ensure_ascii=False)
+        except TypeError as e:
+            raise ValueError(f"節點標籤必須可以 JSON 序列化: {e}") from e
+        restored = [_labels_from_json(label) for label in json.loads(text)]
+        if restored != list(graph.labels):
+            raise ValueError("節點標籤經過 JSON 轉換後無法還原為相同的值")
+        labels = text.encode("utf-8")
+        flags |= _FLAG_LABELS
+
+    header = _HEADER.pack(
+        _MAGIC,
+        _VERSION,
+        flags,
+        graph.num_nodes,
+        graph.num_edges,
+        *(array.dtype.str.encode("ascii") for array in arrays),
+        *offsets,
+        offset,
+        len(labels),
+    )
+    with open(path, "wb") as f:
+        f.write(header.ljust(_HEADER_SIZE, b"\x00"))
+        for array, start in zip(arrays, offsets):
+            f.seek(start)
+            array.tofile(f)
+        f.seek(offset)
+        f.write(labels)
+
+
+def load_binary(path: PathLike, mmap: bool = True) -> CSRGraph:
+    """載入 save_binary 產生的檔案
+
+    mmap=True 時陣列以唯讀 np.memmap 開啟，只讀取檔頭與標籤，
+    資料在存取時才由作業系統分頁載入，因此大型圖也能立即開啟，
+    且多個進程可共用同一份頁面快取。
+
+    Args:
+        path: 檔案路徑
+        mmap: 是否使用記憶體映射，False 時把陣列完整讀入記憶體
+
+    Returns:
+        CSRGraph: 載入的圖
+
+    Raises:
+        ValueError: 檔案格式或版本不符時
+    """
+    with open(path, "rb") as f:
+        raw = f.read(_HEADER_SIZE)
+        if len(raw) < _HEADER.size or raw[: len(_MAGIC)] != _MAGIC:
+            raise ValueError("不是有效的二進位圖檔案")
+        fields = _HEADER.unpack_from(raw)
+        _, version, flags, num_nodes, num_edges = fields[:5]
+        if version != _VERSION:
+            raise ValueError(f"不支援的二進位圖格式版本: {version}")
+        dtypes = [
+            np.dtype(code.rstrip(b"\x00").decode("ascii")) for code in fields[5:8]
+        ]
+        offsets = fields[8:11]
+        labels_offset, labels_length = fields[11:13]
+
+        labels = None
+        if flags & _FLAG_LABELS:
+            f.seek(labels_offset)
+            labels = [
+                _labels_from_json(label)
+                for label in json.loads(f.read(labels_length).decode("utf-8"))
+            ]
+
+        shapes = [num_nodes + 1, num_edges, num_edges]
+        if mmap:
+            arrays = [
+                np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(shape,))
+                for dtype, offset, shape in zip(dtypes, offsets, shapes)
+            ]
+        else:
+            arrays = []
+            for dtype, offset, shape in zip(dtypes, offsets, shapes):
+                f.seek(offset)
+                arrays.append(np.fromfile(f, dtype=dtype, count=shape))
+
+    return CSRGraph(*arrays, labels=labels, directed=bool(flags & _FLAG_DIRECTED))
+
+
+def load_graph(path: PathLike, **kwargs) -> CSRGraph:
+    """依副檔名選擇載入方式: .mtx 為 Matrix Market，.csrg 為二進位格式，其餘為邊列表"""
+    suffix = Path(path).suffix.lower()
+    if suffix == ".mtx":
+        return read_matrix_market(path, **kwargs)
+    if suffix == ".csrg":
+        return load_binary(path, **kwargs)
+    return read_edge_list(path, **kwargs)
+
+
+__all__ = [
+    "read_edge_list",
+    "write_edge_list",
+    "read_matrix_market",
+    "write_matrix_market",
+    "save_binary",
+    "load_binary",
+    "load_graph",
+]
@@ -0,0 +1,173 @@
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+from mathalgo2.algorithm.graph.csr import CSRGraph
+from mathalgo2.algorithm.graph.paths import dijkstra, multi_source_dijkstra
+
+
+class LandmarkIndex:
+    """ALT (A*, Landmarks, Triangle inequality) 前處理索引
+
+    預先計算每個地標到所有節點、以及所有節點到每個地標的最短距離。
+    由三角不等式，對任意地標 L:
+
+        d(v, t) >= d(L, t) - d(L, v)
+        d(v, t) >= d(v, L) - d(t, L)
+
+    取所有地標中的最大值即為 A* 可用的可採納且一致的下界。
+    距離陣列以 (V, L) 形狀保存，查詢單一節點時讀取連續的一列。
+
+    Attributes:
+        landmarks (np.ndarray): 地標節點編號
+        from_landmarks (np.ndarray): (V, L) 陣列，地標到各節點的距離
+        to_landmarks (np.ndarray): (V, L) 陣列，各節點到地標的距離
+        num_edges (int): 建立索引時圖的邊數，載入時用於檢查是否對應同一張圖
+    """
+
+    def __init__(
+        self,
+        landmarks: np.ndarray,
+        from_landmarks: np.ndarray,
+        to_landmarks: np.ndarray,
+        num_edges: int = -1,
+    ):
+        """以預先計算好的陣列建立索引"""
+        self.landmarks = np.asarray(landmarks, dtype=np.int64)
+        self.from_landmarks = np.asarray(from_landmarks)
+        self.to_landmarks = np.asarray(to_landmarks)
+        self.num_edges = num_edges
+        if self.from_landmarks.shape != self.to_landmarks.shape:
+            raise ValueError("from_landmarks 與 to_landmarks 的形狀不一致")
+
+    @classmethod
+    def build(
+        cls,
+        graph: CSRGraph,
+        num_landmarks: int = 8,
+        method: str = "farthest",
+        seed: Optional[int] = None,
+        dtype=np.float64,
+    ) -> "LandmarkIndex":
+        """選擇地標並預先計算距離
+
+        "farthest" 每次選擇離已選地標集合最遠（可達）的節點，通常能得到
+        分布在圖邊緣、下界較緊的地標，沒有更遠的可達節點時提前停止；
+        "random" 則均勻隨機抽選。
+
+        Args:
+            graph: CSR 圖，權重必須非負
+            num_landmarks: 地標數量
+            method: 地標選擇方式，"farthest" 或 "random"
+            seed: 隨機種子
+            dtype: 距離陣列的型別，可用 np.float32 節省一半記憶體
+
+        Returns:
+            LandmarkIndex: 建立好的索引
+        """
+        n = graph.num_nodes
+        num_landmarks = min(num_landmarks, n)
+        rng = np.random.default_rng(seed)
+
+        if method == "random":
+            landmarks = rng.choice(n, size=num_landmarks, replace=False)
+        elif method == "farthest":
+            landmarks = [int(rng.integers(n))]
+            # 第一個地標改為離隨機起點最遠的節點
+            first, _ = dijkstra(graph, landmarks[0])
+            landmarks[0] = int(np.argmax(np.where(np.isfinite(first), first, -1)))
+            while len(landmarks) < num_landmarks:
+                dist, _ = multi_source_dijkstra(graph, landmarks)
+                dist[~np.isfinite(dist)] = -1
+                dist[landmarks] = -1
+                if dist.max() <= 0:
+                    break
+                landmarks.append(int(np.argmax(dist)))
+        else:
+            raise ValueError(f"不支援的地標選擇方式: {method}")
+
+        landmarks = np.asarray(landmarks, dtype=np.int64)
+        reverse = graph.reverse()
+        from_landmarks = np.empty((n, len(landmarks)), dtype=dtype)
+        to_landmarks = np.empty((n, len(landmarks)), dtype=dtype)
+        for i, landmark in enumerate(landmarks.tolist()):
+            from_landmarks[:, i] = dijkstra(graph, landmark)[0]
+            to_landmarks[:, i] = dijkstra(reverse, landmark)[0]
+        return cls(landmarks, from_landmarks, to_landmarks, graph.num_edges)
+
+    @property
+    def num_nodes(self) -> int:
+        """索引涵蓋的節點數"""
+        return self.from_landmarks.shape[0]
+
+    def bound(self, node: int, target: int) -> float:
+        """node 到 target 最短距離的下界"""
+        with np.errstate(invalid="ignore"):
+            forward = self.from_landmarks[target] - self.from_landmarks[node]
+            backward = self.to_landmarks[node] - self.to_landmarks[target]
+            value = np.fmax.reduce(np.fmax(forward, backward))
+        # 兩者皆為 inf - inf 時無法提供資訊
+        return 0.0 if np.isnan(value) else max(float(value), 0.0)
+
+    def bounds(self, target: int) -> np.ndarray:
+        """所有節點到 target 的下界，以長度 V 的陣列返回（O(V·L)）"""
+        with np.errstate(invalid="ignore"):
+            forward = self.from_landmarks[target][None, :] - self.from_landmarks
+            backward = self.to_landmarks - self.to_landmarks[target][None, :]
+            value = np.fmax.reduce(np.fmax(forward, backward), axis=1)
+        return np.maximum(np.nan_to_num(value, nan=0.0, posinf=np.inf), 0.0)
+
+    def heuristic(self, target: int) -> Callable[[int], float]:
+        """返回供 astar 使用的啟發函數，只在節點被觸及時計算下界"""
+        from_target = self.from_landmarks[target]
+        to_target = self.to_landmarks[target]
+        from_landmarks = self.from_landmarks
+        to_landmarks = self.to_landmarks
+
+        def h(node: int) -> float:
+            with np.errstate(invalid="ignore"):
+                value = np.fmax.reduce(
+                    np.fmax(
+                        from_target - from_landmarks[node],
+                        to_landmarks[node] - to_target,
+                    )
+                )
+            return 0.0 if value != value or value < 0 else float(value)
+
+        return h
+
+    def check_graph(self, graph: CSRGraph):
+        """確認索引與圖的節點數、邊數相符
+
+        Raises:
+            ValueError: 索引不是由這張圖建立時
+        """
+        if graph.num_nodes != self.num_nodes or (
+            self.num_edges >= 0 and graph.num_edges != self.num_edges
+        ):
+            raise ValueError("地標索引與圖不相符")
+
+    def save(self, path: Union[str, Path]):
+        """將索引存為 .npz 檔案"""
+        np.savez(
+            path,
+            landmarks=self.landmarks,
+            from_landmarks=self.from_landmarks,
+            to_landmarks=self.to_landmarks,
+            num_edges=np.int64(self.num_edges),
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "LandmarkIndex":
+        """從 save() 產生的檔案載入索引"""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                data["landmarks"],
+                data["from_landmarks"],
+                data["to_landmarks"],
+                int(data["num_edges"]),
+            )
+
+
+__all__ = ["LandmarkIndex"]
@@ -0,0 +1,301 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from mathalgo2.algorithm._shared import ArrayHandle, SharedArrays
+from mathalgo2.algorithm.graph.csr import CSRGraph
+
+# 工作進程連接的共享陣列，由 _init_worker 設置
+_worker_shared: Optional[SharedArrays] = None
+
+# 單層工作量（邊數）低於此值時直接在主進程計算，省去任務分派的開銷
+_PARALLEL_MIN_EDGES = 1 << 16
+
+
+def _init_worker(handles: Dict[str, ArrayHandle]):
+    """工作進程初始化：連接共享的 CSR 陣列與狀態陣列"""
+    global _worker_shared
+    _worker_shared = SharedArrays.attach(handles)
+
+
+def _edge_positions(
+    indptr: np.ndarray, nodes: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """nodes 的所有出邊在 indices 中的位置，以及每條邊對應的起點"""
+    starts = indptr[nodes]
+    counts = indptr[nodes + 1] - starts
+    total = int(counts.sum())
+    tails = np.repeat(nodes, counts)
+    if total == 0:
+        return tails, np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return tails, offsets + np.arange(total)
+
+
+def _top_down(arrays: Dict[str, np.ndarray], frontier: np.ndarray, level: int):
+    """由上而下: 展開前緣的出邊，標記未訪問的鄰居，返回新發現的節點
+
+    多個進程可能同時把同一節點的層數寫為相同的值，這種競爭是無害的；
+    重複的節點由主進程去重。
+    """
+    depth = arrays["depth"]
+    _, positions = _edge_positions(arrays["indptr"], frontier)
+    heads = arrays["indices"][positions]
+    found = np.unique(heads[depth[heads] < 0])
+    depth[found] = level
+    return found
+
+
+def _bottom_up(arrays: Dict[str, np.ndarray], start: int, end: int, level: int):
+    """由下而上: 檢查 [start, end) 中未訪問節點是否有入鄰居在前緣中"""
+    depth = arrays["depth"]
+    unvisited = np.flatnonzero(depth[start:end] < 0) + start
+    if len(unvisited) == 0:
+        return unvisited
+    tails, positions = _edge_positions(arrays["rindptr"], unvisited)
+    hits = arrays["frontier"][arrays["rindices"][positions]].astype(bool)
+    found = np.unique(tails[hits])
+    depth[found] = level
+    return found
+
+
+def _top_down_task(frontier: np.ndarray, level: int) -> np.ndarray:
+    """工作進程: 由上而下處理一段前緣"""
+    return _top_down(_worker_shared.arrays, frontier, level)
+
+
+def _bottom_up_task(start: int, end: int, level: int) -> np.ndarray:
+    """工作進程: 由下而上處理一段節點範圍"""
+    return _bottom_up(_worker_shared.arrays, start, end, level)
+
+
+def _split(array: np.ndarray, parts: int) -> List[np.ndarray]:
+    """把陣列切成至多 parts 段非空的片段"""
+    return [piece for piece in np.array_split(array, parts) if len(piece)]
+
+
+def parallel_bfs(
+    graph: CSRGraph,
+    source: int,
+    workers: Optional[int] = None,
+    alpha: float = 15.0,
+    beta: float = 18.0,
+) -> np.ndarray:
+    """多進程的方向最佳化 BFS (direction-optimizing BFS)
+
+    CSR 與反向 CSR、層數陣列、前緣位元圖都放在共享記憶體中，每一層把工作
+    切給工作進程：
+
+    - 由上而下: 前緣節點切段，各進程展開出邊並直接在共享的層數陣列標記
+    - 由下而上: 節點編號範圍切段，各進程檢查未訪問節點的入邊是否落在前緣中
+
+    依 Beamer 的啟發式在兩種方向間切換：前緣的出邊數超過未訪問節點入邊數的
+    1/alpha 時改為由下而上；前緣節點數少於 V/beta 時改回由上而下。
+    單層工作量很小時直接在主進程計算。
+
+    Args:
+        graph: CSR 圖
+        source: 起點編號
+        workers: 進程數，None 表示使用所有 CPU 核心，0 表示在目前進程中計算
+        alpha: 切換為由下而上的門檻
+        beta: 切換回由上而下的門檻
+
+    Returns:
+        np.ndarray: 長度為 V 的層數陣列，不可達節點為 -1
+    """
+    n = graph.num_nodes
+    workers = os.cpu_count() if workers is None else workers
+    reverse = graph.reverse()
+
+    with SharedArrays() as shared:
+        shared.share("indptr", graph.indptr)
+        shared.share("indices", graph.indices)
+        shared.share("rindptr", reverse.indptr)
+        shared.share("rindices", reverse.indices)
+        depth = shared.create("depth", (n,), np.int64, fill=-1)
+        frontier_map = shared.create("frontier", (n,), np.uint8, fill=0)
+        arrays = shared.arrays
+
+        executor = None
+        if workers > 0:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(dict(shared.handles),),
+            )
+
+        try:
+            depth[source] = 0
+            frontier = np.array([source], dtype=np.int64)
+            out_degree = np.diff(graph.indptr)
+            in_degree = np.diff(reverse.indptr)
+            unexplored_edges = int(in_degree.sum())
+            bottom_up = False
+            level = 0
+
+            while len(frontier):
+                level += 1
+                frontier_edges = int(out_degree[frontier].sum())
+                if not bottom_up and frontier_edges > unexplored_edges / alpha:
+                    bottom_up = True
+                elif bottom_up and len(frontier) < n / beta:
+                    bottom_up = False
+
+                work = unexplored_edges if bottom_up else frontier_edges
+                parallel = executor is not None and work >= _PARALLEL_MIN_EDGES
+
+                if bottom_up:
+                    frontier_map[:] = 0
+                    frontier_map[frontier] = 1
+                    if parallel:
+                        bounds = np.linspace(0, n, workers * 4 + 1).astype(int)
+                        pieces = list(
+                            executor.map(
+                                _bottom_up_task,
+                                bounds[:-1].tolist(),
+                                bounds[1:].tolist(),
+                                [level] * (len(bounds) - 1),
+                            )
+                        )
+                    else:
+                        pieces = [_bottom_up(arrays, 0, n, level)]
+                else:
+                    if parallel:
+                        chunks = _split(frontier, workers * 4)
+                        pieces = list(
+                            executor.map(_top_down_task, chunks, [level] * len(chunks))
+                        )
+                    else:
+                        pieces = [_top_down(arrays, frontier, level)]
+
+                frontier = np.unique(np.concatenate(pieces)) if pieces else frontier[:0]
+                unexplored_edges -= int(in_degree[frontier].sum())
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return depth.copy()
+
+
+def _relax(
+    arrays: Dict[str, np.ndarray], nodes: np.ndarray, light: bool
+) -> Tuple[np.ndarray, np.ndarray]:
+    """計算 nodes 的輕邊或重邊鬆弛請求，返回 (終點, 候選距離)，每個終點只保留最小值"""
+    tails, positions = _edge_positions(arrays["indptr"], nodes)
+    weights = arrays["weights"][positions]
+    mask = arrays["light"][positions].astype(bool)
+    if not light:
+        mask = ~mask
+    heads = arrays["indices"][positions[mask]]
+    candidates = arrays["dist"][tails[mask]] + weights[mask]
+    improves = candidates < arrays["dist"][heads]
+    heads, candidates = heads[improves], candidates[improves]
+    if len(heads) == 0:
+        return heads.astype(np.int64), candidates
+    order = np.lexsort((candidates, heads))
+    heads, candidates = heads[order], candidates[order]
+    first = np.ones(len(heads), dtype=bool)
+    first[1:] = heads[1:] != heads[:-1]
+    return heads[first].astype(np.int64), candidates[first]
+
+
+def _relax_task(nodes: np.ndarray, light: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """工作進程: 計算一段節點的鬆弛請求"""
+    return _relax(_worker_shared.arrays, nodes, light)
+
+
+def delta_stepping(
+    graph: CSRGraph,
+    source: int,
+    delta: Optional[float] = None,
+    workers: Optional[int] = None,
+) -> np.ndarray:
+    """多進程的 Δ-stepping 單源最短路徑
+
+    距離依寬度 delta 分桶，由小到大處理：桶內反覆鬆弛輕邊 (w <= delta)
+    直到桶內不再有距離變小的節點，再一次鬆弛桶內所有節點的重邊。
+    同一輪的鬆弛請求互相獨立，切段交給工作進程在共享的 CSR 與距離陣列上
+    計算並先在本地取最小值，主進程再合併寫回距離。
+
+    Args:
+        graph: CSR 圖，權重必須非負
+        source: 起點編號
+        delta: 桶寬，None 時取 最大權重 / 平均出度
+        workers: 進程數，None 表示使用所有 CPU 核心，0 表示在目前進程中計算
+
+    Returns:
+        np.ndarray: 長度為 V 的最短距離，不可達為 inf
+
+    Raises:
+        ValueError: 圖中有負權重或 delta 不是正數時
+    """
+    n = graph.num_nodes
+    if graph.num_edges and graph.weights.min() < 0:
+        raise ValueError("Δ-stepping 不支援負權重")
+    if delta is None:
+        average_degree = max(graph.num_edges / max(n, 1), 1.0)
+        max_weight = graph.weights.max() if graph.num_edges else 1.0
+        delta = max_weight / average_degree or 1.0
+    if delta <= 0:
+        raise ValueError("delta 必須是正數")
+    workers = os.cpu_count() if workers is None else workers
+    out_degree = np.diff(graph.indptr)
+
+    with SharedArrays() as shared:
+        shared.share("indptr", graph.indptr)
+        shared.share("indices", graph.indices)
+        shared.share("weights", graph.weights)
+        shared.share("light", (graph.weights <= delta).astype(np.uint8))
+        dist = shared.create("dist", (n,), np.float64, fill=np.inf)
+        arrays = shared.arrays
+
+        executor = None
+        if workers > 0:
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(dict(shared.handles),),
+            )
+
+        def relax(nodes: np.ndarray, light: bool) -> np.ndarray:
+            """鬆弛 nodes 的輕邊或重邊並寫回距離，返回距離變小的節點"""
+            if executor is not None and out_degree[nodes].sum() >= _PARALLEL_MIN_EDGES:
+                chunks = _split(nodes, workers * 4)
+                pieces = list(executor.map(_relax_task, chunks, [light] * len(chunks)))
+            else:
+                pieces = [_relax(arrays, nodes, light)]
+            heads = np.concatenate([piece[0] for piece in pieces])
+            candidates = np.concatenate([piece[1] for piece in pieces])
+            np.minimum.at(dist, heads, candidates)
+            return np.unique(heads)
+
+        try:
+            dist[source] = 0.0
+            pending = np.array([source], dtype=np.int64)
+
+            while len(pending):
+                bucket = np.floor(dist[pending].min() / delta)
+                settled = []
+                # 桶內反覆鬆弛輕邊
+                while True:
+                    in_bucket = np.floor(dist[pending] / delta) == bucket
+                    current = pending[in_bucket]
+                    if len(current) == 0:
+                        break
+                    pending = pending[~in_bucket]
+                    settled.append(current)
+                    improved = relax(current, light=True)
+                    pending = np.union1d(pending, improved)
+                # 桶內距離已確定，鬆弛重邊
+                improved = relax(np.unique(np.concatenate(settled)), light=False)
+                pending = np.union1d(pending, improved)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return dist.copy()
+
+
+__all__ = ["parallel_bfs", "delta_stepping"]
@@ -0,0 +1,319 @@
+import heapq
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from mathalgo2.algorithm.graph.csr import CSRGraph
+
+
+def dijkstra(
+    graph: CSRGraph, source: int, targets: Optional[Iterable[int]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """CSR 圖上的 Dijkstra 單源最短路徑
+
+    不寫入任何視覺化狀態，距離與前驅以整數編號索引的陣列保存。
+    指定 targets 時，所有目標節點確定距離後立即停止，
+    此時只有已確定的節點（包含所有目標）距離為最終值。
+
+    時間複雜度: O((V + E)logV)
+
+    Args:
+        graph: CSR 圖，權重必須非負
+        source: 起點編號
+        targets: 可選的目標節點編號集合
+
+    Returns:
+        (distances, predecessors): 距離陣列（不可達為 inf）與前驅陣列（無前驅為 -1）
+    """
+    indptr = graph.indptr.tolist()
+    indices = graph.indices
+    weights = graph.weights
+    dist = [float("inf")] * graph.num_nodes
+    pred = [-1] * graph.num_nodes
+    done = bytearray(graph.num_nodes)
+    remaining = set(targets) if targets is not None else None
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = 1
+        if remaining is not None:
+            remaining.discard(u)
+            if not remaining:
+                break
+        start, end = indptr[u], indptr[u + 1]
+        for v, w in zip(indices[start:end].tolist(), weights[start:end].tolist()):
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                heapq.heappush(heap, (nd, v))
+
+    return np.asarray(dist), np.asarray(pred, dtype=np.int64)
+
+
+def multi_source_dijkstra(graph: CSRGraph, sources: Sequence[int]):
+    """多源 Dijkstra：一次搜尋求出每個節點到最近來源的距離
+
+    等同於加入一個超級源點並以零權重連到所有來源後執行一次 Dijkstra。
+
+    Args:
+        graph: CSR 圖，權重必須非負
+        sources: 來源節點編號
+
+    Returns:
+        (distances, nearest): 到最近來源的距離陣列（不可達為 inf）
+        與最近來源的編號陣列（不可達為 -1）
+    """
+    indptr = graph.indptr.tolist()
+    indices = graph.indices
+    weights = graph.weights
+    dist = [float("inf")] * graph.num_nodes
+    nearest = [-1] * graph.num_nodes
+    done = bytearray(graph.num_nodes)
+    heap = []
+    for source in sources:
+        source = int(source)
+        dist[source] = 0.0
+        nearest[source] = source
+        heap.append((0.0, source))
+    heapq.heapify(heap)
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if done[u]:
+            continue
+        done[u] = 1
+        origin = nearest[u]
+        start, end = indptr[u], indptr[u + 1]
+        for v, w in zip(indices[start:end].tolist(), weights[start:end].tolist()):
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                nearest[v] = origin
+                heapq.heappush(heap, (nd, v))
+
+    return np.asarray(dist), np.asarray(nearest, dtype=np.int64)
+
+
+def reconstruct_path(predecessors: np.ndarray, source: int, target: int) -> np.ndarray:
+    """由前驅陣列還原從 source 到 target 的路徑
+
+    Returns:
+        np.ndarray: 路徑上的節點編號，不可達時為空陣列
+    """
+    path = [target]
+    node = target
+    while node != source:
+        node = int(predecessors[node])
+        if node < 0:
+            return np.empty(0, dtype=np.int64)
+        path.append(node)
+    path.reverse()
+    return np.asarray(path, dtype=np.int64)
+
+
+def _point_to_point(
+    graph: CSRGraph, source: int, target: int
+) -> Tuple[float, np.ndarray]:
+    """單向點對點搜尋，距離以 dict 保存，成本只與實際擴展的節點數相關"""
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    dist = {source: 0.0}
+    pred = {source: -1}
+    done = set()
+    heap = [(0.0, source)]
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        if u == target:
+            path = []
+            while u != -1:
+                path.append(u)
+                u = pred[u]
+            path.reverse()
+            return d, np.asarray(path, dtype=np.int64)
+        done.add(u)
+        start, end = indptr[u], indptr[u + 1]
+        for v, w in zip(indices[start:end].tolist(), weights[start:end].tolist()):
+            nd = d + w
+            if nd < dist.get(v, float("inf")):
+                dist[v] = nd
+                pred[v] = u
+                heapq.heappush(heap, (nd, v))
+
+    return float("inf"), np.empty(0, dtype=np.int64)
+
+
+def bidirectional_dijkstra(
+    graph: CSRGraph, source: int, target: int
+) -> Tuple[float, np.ndarray]:
+    """雙向 Dijkstra 點對點最短路徑
+
+    同時從起點沿正向邊、從終點沿反向邊擴展，每次擴展堆頂距離較小的一側，
+    當兩側堆頂距離之和不小於目前最佳路徑長度時停止。
+    反向圖由 CSRGraph.reverse() 建立並快取；距離以 dict 保存，
+    成本只與實際擴展的節點數相關，不需配置長度為 V 的陣列。
+
+    Args:
+        graph: CSR 圖，權重必須非負
+        source: 起點編號
+        target: 終點編號
+
+    Returns:
+        (distance, path): 最短距離（不可達為 inf）與路徑節點編號
+    """
+    if source == target:
+        return 0.0, np.asarray([source], dtype=np.int64)
+
+    graphs = (graph, graph.reverse())
+    dists = ({source: 0.0}, {target: 0.0})
+    preds = ({source: -1}, {target: -1})
+    dones = (set(), set())
+    heaps = ([(0.0, source)], [(0.0, target)])
+
+    best = float("inf")
+    meet = -1
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        g, dist, pred, done, heap = (
+            graphs[side],
+            dists[side],
+            preds[side],
+            dones[side],
+            heaps[side],
+        )
+        other_dist = dists[1 - side]
+
+        d, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        start, end = g.indptr[u], g.indptr[u + 1]
+        for v, w in zip(g.indices[start:end].tolist(), g.weights[start:end].tolist()):
+            nd = d + w
+            if nd < dist.get(v, float("inf")):
+                dist[v] = nd
+                pred[v] = u
+                heapq.heappush(heap, (nd, v))
+            if v in other_dist and nd + other_dist[v] < best:
+                best = nd + other_dist[v]
+                meet = v
+
+    if meet < 0:
+        return float("inf"), np.empty(0, dtype=np.int64)
+
+    path = []
+    node = meet
+    while node != -1:
+        path.append(node)
+        node = preds[0][node]
+    path.reverse()
+    node = preds[1][meet]
+    while node != -1:
+        path.append(node)
+        node = preds[1][node]
+    return best, np.asarray(path, dtype=np.int64)
+
+
+def astar(
+    graph: CSRGraph,
+    source: int,
+    target: int,
+    heuristic: Union[Callable[[int], float], np.ndarray, None] = None,
+    stats: Optional[Dict[str, int]] = None,
+) -> Tuple[float, np.ndarray]:
+    """CSR 圖上的 A* 點對點最短路徑
+
+    heuristic 必須是可採納且一致的下界（例如 LandmarkIndex.heuristic 的結果），
+    才能在節點第一次出堆時確定其距離。
+
+    Args:
+        graph: CSR 圖，權重必須非負
+        source: 起點編號
+        target: 終點編號
+        heuristic: 節點到終點距離的下界，可為函數或長度 V 的陣列，None 時退化為 Dijkstra
+        stats: 可選的 dict，會寫入已確定節點數 "settled" 與推入堆的次數 "pushed"
+
+    Returns:
+        (distance, path): 最短距離（不可達為 inf）與路徑節點編號
+    """
+    if heuristic is None:
+        h = lambda node: 0.0  # noqa: E731
+    elif isinstance(heuristic, np.ndarray):
+        h = heuristic.item
+    else:
+        h = heuristic
+
+    indptr, indices, weights = graph.indptr, graph.indices, graph.weights
+    dist = {source: 0.0}
+    pred = {source: -1}
+    done = set()
+    heap = [(h(source), 0.0, source)]
+    pushed = 1
+    result = (float("inf"), np.empty(0, dtype=np.int64))
+
+    while heap:
+        _, d, u = heapq.heappop(heap)
+        if u in done:
+            continue
+        done.add(u)
+        if u == target:
+            path = []
+            while u != -1:
+                path.append(u)
+                u = pred[u]
+            path.reverse()
+            result = (d, np.asarray(path, dtype=np.int64))
+            break
+        start, end = indptr[u], indptr[u + 1]
+        for v, w in zip(indices[start:end].tolist(), weights[start:end].tolist()):
+            nd = d + w
+            if nd < dist.get(v, float("inf")):
+                estimate = nd + h(v)
+                if estimate == float("inf"):
+                    continue
+                dist[v] = nd
+                pred[v] = u
+                heapq.heappush(heap, (estimate, nd, v))
+                pushed += 1
+
+    if stats is not None:
+        stats["settled"] = len(done)
+        stats["pushed"] = pushed
+    return result
+
+
+def shortest_path(
+    graph: CSRGraph, source: int, target: int, bidirectional: bool = False
+) -> Tuple[float, np.ndarray]:
+    """點對點最短路徑，確定終點距離後立即停止
+
+    Args:
+        graph: CSR 圖，權重必須非負
+        source: 起點編號
+        target: 終點編號
+        bidirectional: 是否使用雙向搜尋
+
+    Returns:
+        (distance, path): 最短距離（不可達為 inf）與路徑節點編號
+    """
+    if bidirectional:
+        return bidirectional_dijkstra(graph, source, target)
+    return _point_to_point(graph, source, target)
+
+
+__all__ = [
+    "dijkstra",
+    "multi_source_dijkstra",
+    "bidirectional_dijkstra",
+    "astar",
+    "shortest_path",
+    "reconstruct_path",
+]
@@ -0,0 +1,22 @@
+from typing import Dict
+
+from mathalgo2.algorithm._shared import ArrayHandle, SharedArrays
+from mathalgo2.algorithm.graph.csr import CSRGraph
+
+
+def share_graph(graph: CSRGraph, shared: SharedArrays) -> Dict[str, ArrayHandle]:
+    """把 CSR 圖的三個陣列放入共享記憶體，返回可傳給工作進程的描述"""
+    shared.share("indptr", graph.indptr)
+    shared.share("indices", graph.indices)
+    shared.share("weights", graph.weights)
+    return {key: shared.handles[key] for key in ("indptr", "indices", "weights")}
+
+
+def attach_graph(shared: SharedArrays) -> CSRGraph:
+    """由已連接的共享陣列建立零複製的 CSR 圖（不含標籤）"""
+    return CSRGraph(
+        shared.arrays["indptr"], shared.arrays["indices"], shared.arrays["weights"]
+    )
+
+
+__all__ = ["ArrayHandle", "SharedArrays", "share_graph", "attach_graph"]
@@ -0,0 +1,137 @@
+from collections import deque
+from typing import Sequence, Union
+
+import numpy as np
+
+from mathalgo2.algorithm.graph.csr import CSRGraph
+
+
+def bfs(graph: CSRGraph, source: int) -> np.ndarray:
+    """CSR 圖上的廣度優先搜尋
+
+    時間複雜度: O(V + E)
+
+    Args:
+        graph: CSR 圖
+        source: 起點編號
+
+    Returns:
+        np.ndarray: 依訪問順序排列的節點編號
+    """
+    indptr = graph.indptr.tolist()
+    indices = graph.indices
+    visited = bytearray(graph.num_nodes)
+    visited[source] = 1
+    order = [source]
+    queue = deque([source])
+
+    while queue:
+        u = queue.popleft()
+        for v in indices[indptr[u] : indptr[u + 1]].tolist():
+            if not visited[v]:
+                visited[v] = 1
+                order.append(v)
+                queue.append(v)
+
+    return np.asarray(order, dtype=np.int64)
+
+
+def dfs(graph: CSRGraph, source: int) -> np.ndarray:
+    """CSR 圖上的深度優先搜尋（顯式堆疊，不受遞迴深度限制）
+
+    鄰居以反序推入堆疊、出堆疊時才檢查是否已訪問，
+    因此訪問順序與遞迴版本的前序相同。
+
+    Args:
+        graph: CSR 圖
+        source: 起點編號
+
+    Returns:
+        np.ndarray: 依訪問順序排列的節點編號
+    """
+    indptr = graph.indptr.tolist()
+    indices = graph.indices
+    visited = bytearray(graph.num_nodes)
+    order = []
+    stack = [source]
+
+    while stack:
+        u = stack.pop()
+        if visited[u]:
+            continue
+        visited[u] = 1
+        order.append(u)
+        neighbors = indices[indptr[u] : indptr[u + 1]].tolist()
+        neighbors.reverse()
+        stack.extend(v for v in neighbors if not visited[v])
+
+    return np.asarray(order, dtype=np.int64)
+
+
+# 前緣小於此大小時改用逐點展開
+_SMALL_FRONTIER = 64
+
+
+def gather_neighbors(graph: CSRGraph, frontier: np.ndarray) -> np.ndarray:
+    """一次取出前緣中所有節點的出鄰居（向量化，結果可能含重複）
+
+    Args:
+        graph: CSR 圖
+        frontier: 節點編號陣列
+
+    Returns:
+        np.ndarray: 依前緣順序串接的鄰居編號
+    """
+    starts = graph.indptr[frontier]
+    counts = graph.indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=graph.indices.dtype)
+    # 每段的位置 = 段內偏移 + 該段在 indices 中的起點
+    offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return graph.indices[offsets + np.arange(total)]
+
+
+def bfs_levels(graph: CSRGraph, source: Union[int, Sequence[int]]) -> np.ndarray:
+    """逐層同步的廣度優先搜尋
+
+    每一層以整個前緣陣列為單位，用 NumPy 一次展開所有鄰居並篩選未訪問節點；
+    前緣很小時改為逐點展開，避免長鏈等深而窄的圖被每層的固定開銷拖慢。
+
+    時間複雜度: O(V + E)（加上每層去重的排序成本）
+
+    Args:
+        graph: CSR 圖
+        source: 起點編號，或多個起點（皆為第 0 層）
+
+    Returns:
+        np.ndarray: 長度為 V 的層數陣列，不可達節點為 -1
+    """
+    depth = np.full(graph.num_nodes, -1, dtype=np.int64)
+    frontier = np.unique(np.asarray(source, dtype=np.int64))
+    depth[frontier] = 0
+    level = 0
+    indptr = graph.indptr
+    indices = graph.indices
+
+    while len(frontier):
+        level += 1
+        if len(frontier) < _SMALL_FRONTIER:
+            # 前緣很小時（例如長鏈），逐點展開比每層的向量化開銷便宜
+            next_frontier = []
+            for u in frontier.tolist():
+                for v in indices[indptr[u] : indptr[u + 1]].tolist():
+                    if depth[v] < 0:
+                        depth[v] = level
+                        next_frontier.append(v)
+            frontier = np.asarray(next_frontier, dtype=np.int64)
+        else:
+            candidates = gather_neighbors(graph, frontier)
+            candidates = candidates[depth[candidates] < 0]
+            frontier = np.unique(candidates)
+            depth[frontier] = level
+
+    return depth
+
+
+__all__ = ["bfs", "dfs", "bfs_levels", "gather_neighbors"]
@@ -1,5 +1,11 @@
 from .genetic import GeneticAlgorithm
 from .gradient_descent import GradientDescent
 from .simulated_annealing import SimulatedAnnealing
+from .sweep import HyperparameterSweep
 
-__all__ = ["GeneticAlgorithm", "SimulatedAnnealing", "GradientDescent"]
+__all__ = [
+    "GeneticAlgorithm",
+    "SimulatedAnnealing",
+    "GradientDescent",
+    "HyperparameterSweep",
+]
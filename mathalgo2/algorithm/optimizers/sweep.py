@@ -0,0 +1,295 @@
+import itertools
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from mathalgo2.algorithm import OpAlgo
+
+# 工作進程中的最佳化工廠，由 _init_worker 設置，避免每個任務重複序列化目標函數
+_worker_factory = None
+
+
+def _init_worker(
+    objective_func: Callable, bounds: List[Tuple[float, float]], quiet: bool
+):
+    """工作進程初始化：建立最佳化工廠並視需要降低日誌級別"""
+    global _worker_factory
+    if quiet:
+        OpAlgo.logger_manager.set_level("WARNING")
+    _worker_factory = OpAlgo.OptimizationFactory(objective_func, bounds, test_mode=True)
+
+
+def _run_trial(task: Tuple[str, int, Dict[str, Any], int, int]) -> Dict[str, Any]:
+    """在工作進程中執行單一組態與種子的最佳化
+
+    Args:
+        task: (算法名稱, 組態編號, 超參數, 隨機種子, 迭代預算)
+
+    Returns:
+        Dict[str, Any]: 單次試驗的結果紀錄
+    """
+    algorithm, config_id, params, seed, budget = task
+    np.random.seed(seed)
+    start = time.perf_counter()
+    optimizer = _worker_factory.create_optimizer(algorithm, **params)
+    _, best_fitness = optimizer.optimize(max_iter=budget)
+    return {
+        "config_id": config_id,
+        "seed": seed,
+        "budget": budget,
+        **params,
+        "best_fitness": float(best_fitness),
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+class HyperparameterSweep:
+    """最佳化算法的超參數掃描器
+
+    以 OptimizationFactory 建立最佳化器，對參數網格或隨機搜尋空間中的每組
+    組態、每個隨機種子各執行一次最佳化。試驗分派到進程池並行執行，
+    結果以欄式檔案保存，並可使用 successive halving 提前淘汰表現差的組態。
+
+    搜尋空間的取值規則:
+    - list 或其他序列: 從中均勻抽選
+    - (low, high) 二元 tuple: 均勻抽樣，兩端皆為整數時抽整數
+    - callable: 以 np.random.Generator 呼叫並使用其回傳值
+
+    Attributes:
+        objective_func (Callable): 目標函數，需可被 pickle 以傳送至工作進程
+        bounds (List[Tuple[float, float]]): 每個維度的取值範圍
+        algorithm (str): 已註冊於 OptimizationFactory 的算法名稱
+        seeds (List[int]): 每組組態重複執行使用的隨機種子
+        workers (int): 進程數，0 表示在目前進程中依序執行
+        max_iter (int): 每次試驗的最大迭代次數
+        results (pd.DataFrame): 最近一次掃描的所有試驗結果
+    """
+
+    def __init__(
+        self,
+        objective_func: Callable,
+        bounds: List[Tuple[float, float]],
+        algorithm: str,
+        grid: Optional[Dict[str, Sequence[Any]]] = None,
+        space: Optional[Dict[str, Any]] = None,
+        n_samples: int = 20,
+        seeds: Iterable[int] = (0,),
+        workers: Optional[int] = None,
+        max_iter: int = 1000,
+        random_state: Optional[int] = None,
+        quiet: bool = True,
+    ):
+        """初始化超參數掃描器
+
+        Args:
+            objective_func: 目標函數
+            bounds: 解的範圍限制
+            algorithm: 算法名稱，例如 "gradient"、"annealing"、"genetic"
+            grid: 參數網格，取所有組合
+            space: 隨機搜尋空間，與 grid 擇一使用
+            n_samples: 隨機搜尋時抽樣的組態數
+            seeds: 每組組態使用的隨機種子
+            workers: 進程數，None 表示使用所有 CPU 核心，0 表示不使用進程池
+            max_iter: 每次試驗的最大迭代次數
+            random_state: 隨機搜尋抽樣使用的種子
+            quiet: 是否在掃描期間將最佳化器日誌降為 WARNING
+
+        Raises:
+            ValueError: grid 與 space 同時或皆未提供，或算法未註冊時
+        """
+        if (grid is None) == (space is None):
+            raise ValueError("grid 與 space 必須且只能提供其中一個")
+        if algorithm not in OpAlgo.OptimizationFactory._algorithms:
+            raise ValueError(f"不支援的算法: {algorithm}")
+
+        self.objective_func = objective_func
+        self.bounds = bounds
+        self.algorithm = algorithm
+        self.grid = grid
+        self.space = space
+        self.n_samples = n_samples
+        self.seeds = list(seeds)
+        self.workers = os.cpu_count() if workers is None else workers
+        self.max_iter = max_iter
+        self.random_state = random_state
+        self.quiet = quiet
+        self.results = pd.DataFrame()
+        self._configs = []
+        self.logger = OpAlgo.logger_manager
+
+    def configurations(self) -> List[Dict[str, Any]]:
+        """展開網格或抽樣搜尋空間，返回所有待評估的組態
+
+        Returns:
+            List[Dict[str, Any]]: 組態列表，索引即為 config_id
+        """
+        if self.grid is not None:
+            names = list(self.grid)
+            return [
+                dict(zip(names, values))
+                for values in itertools.product(*(self.grid[n] for n in names))
+            ]
+
+        rng = np.random.default_rng(self.random_state)
+        configs = []
+        for _ in range(self.n_samples):
+            config = {}
+            for name, spec in self.space.items():
+                if callable(spec):
+                    config[name] = spec(rng)
+                elif isinstance(spec, tuple) and len(spec) == 2:
+                    low, high = spec
+                    if isinstance(low, int) and isinstance(high, int):
+                        config[name] = int(rng.integers(low, high + 1))
+                    else:
+                        config[name] = float(rng.uniform(low, high))
+                else:
+                    config[name] = spec[int(rng.integers(len(spec)))]
+            configs.append(config)
+        return configs
+
+    def run(
+        self,
+        output: Optional[Union[str, Path]] = None,
+        successive_halving: bool = False,
+        min_iter: int = 10,
+        eta: int = 3,
+    ) -> pd.DataFrame:
+        """執行掃描
+
+        啟用 successive halving 時，所有組態先以 min_iter 的預算執行，每一輪
+        僅保留平均適應度最好的 1/eta 組態，並把預算乘以 eta，直到預算達到
+        max_iter。
+
+        Args:
+            output: 結果檔案路徑，依副檔名選擇 .parquet、.feather、.npz 或 .csv
+            successive_halving: 是否啟用 successive halving 提前淘汰
+            min_iter: successive halving 第一輪的迭代預算
+            eta: 每輪的淘汰比例與預算成長倍數
+
+        Returns:
+            pd.DataFrame: 所有試驗的結果，每列為一次 (組態, 種子, 預算) 試驗
+        """
+        configs = self._configs = self.configurations()
+        self.logger.info(
+            f"開始超參數掃描: 算法 {self.algorithm}，組態數 {len(configs)}，"
+            f"種子數 {len(self.seeds)}，進程數 {self.workers}"
+        )
+
+        if successive_halving:
+            if eta < 2:
+                raise ValueError("eta 必須至少為 2")
+            budgets = []
+            budget = min(min_iter, self.max_iter)
+            while budget < self.max_iter:
+                budgets.append(budget)
+                budget *= eta
+            budgets.append(self.max_iter)
+        else:
+            budgets = [self.max_iter]
+
+        frames = []
+        active = list(range(len(configs)))
+        with self._executor() as executor:
+            for rung, budget in enumerate(budgets):
+                tasks = [
+                    (self.algorithm, config_id, configs[config_id], seed, budget)
+                    for config_id in active
+                    for seed in self.seeds
+                ]
+                records = list(self._map(executor, tasks))
+                frame = pd.DataFrame.from_records(records)
+                frame.insert(1, "rung", rung)
+                frames.append(frame)
+
+                self.results = pd.concat(frames, ignore_index=True)
+                if output is not None:
+                    self._write(self.results, output)
+
+                scores = frame.groupby("config_id")["best_fitness"].mean()
+                self.logger.info(
+                    f"第 {rung} 輪完成: 預算 {budget}，組態數 {len(active)}，"
+                    f"最佳平均適應度 {scores.min()}"
+                )
+                if rung + 1 < len(budgets):
+                    keep = max(1, math.ceil(len(active) / eta))
+                    active = scores.nsmallest(keep).index.tolist()
+
+        return self.results
+
+    def best(self) -> Dict[str, Any]:
+        """返回最終預算下平均適應度最好的組態
+
+        Returns:
+            Dict[str, Any]: 該組態的超參數
+
+        Raises:
+            RuntimeError: 尚未執行掃描時
+        """
+        if self.results.empty:
+            raise RuntimeError("尚未執行掃描")
+        final = self.results[self.results["rung"] == self.results["rung"].max()]
+        config_id = final.groupby("config_id")["best_fitness"].mean().idxmin()
+        return self._configs[config_id]
+
+    def _executor(self):
+        """建立進程池；workers 為 0 時改在目前進程中初始化並執行"""
+        if self.workers == 0:
+            return _InProcessExecutor(self.objective_func, self.bounds, self.quiet)
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(self.objective_func, self.bounds, self.quiet),
+        )
+
+    def _map(self, executor, tasks: List[Tuple]) -> Iterable[Dict[str, Any]]:
+        """分派試驗，依進程數計算 chunksize 以降低排程開銷"""
+        chunksize = max(1, len(tasks) // (max(self.workers, 1) * 4))
+        return executor.map(_run_trial, tasks, chunksize=chunksize)
+
+    @staticmethod
+    def _write(results: pd.DataFrame, output: Union[str, Path]):
+        """依副檔名寫出結果檔案"""
+        path = Path(output)
+        suffix = path.suffix.lower()
+        if suffix == ".parquet":
+            results.to_parquet(path, index=False)
+        elif suffix == ".feather":
+            results.to_feather(path)
+        elif suffix == ".npz":
+            np.savez(path, **{col: results[col].to_numpy() for col in results.columns})
+        elif suffix == ".csv":
+            results.to_csv(path, index=False)
+        else:
+            raise ValueError(f"不支援的輸出格式: {suffix}")
+
+
+class _InProcessExecutor:
+    """與 ProcessPoolExecutor 介面相容的同進程執行器，供除錯與不可 pickle 的目標函數使用"""
+
+    def __init__(
+        self, objective_func: Callable, bounds: List[Tuple[float, float]], quiet: bool
+    ):
+        self.quiet = quiet
+        self.previous_level = OpAlgo.logger_manager.level
+        _init_worker(objective_func, bounds, quiet)
+
+    def map(self, func: Callable, tasks: Iterable, chunksize: int = 1):
+        return map(func, tasks)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self.quiet:
+            OpAlgo.logger_manager.set_level(self.previous_level)
+        return False
+
+
+__all__ = ["HyperparameterSweep"]
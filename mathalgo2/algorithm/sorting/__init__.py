@@ -0,0 +1,25 @@
+"""
+排序核心模組，提供不含日誌與視覺化的高效排序實作
+"""
+
+from .comparison import introsort, merge_sort
+from .external import ExternalSort, external_sort
+from .numeric import argsort, counting_sort, radix_sort
+from .parallel import parallel_sort
+from .selection import TopK, nlargest, nsmallest, partial_sort, select
+
+__all__ = [
+    "introsort",
+    "merge_sort",
+    "radix_sort",
+    "counting_sort",
+    "argsort",
+    "ExternalSort",
+    "external_sort",
+    "parallel_sort",
+    "select",
+    "partial_sort",
+    "nsmallest",
+    "nlargest",
+    "TopK",
+]
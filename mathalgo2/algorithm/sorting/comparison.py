@@ -0,0 +1,282 @@
+from typing import Any, Callable, List, Optional, Sequence
+
+# 子數組長度不超過此值時改用插入排序
+_INSERTION_CUTOFF = 16
+# 子數組長度不小於此值時以 ninther（三組三數中值的中值）選擇基準值
+_NINTHER_CUTOFF = 128
+# 合併排序先以插入排序建立的初始段長度
+_MERGE_RUN = 32
+
+
+def _insertion_sort(keys: List[Any], items: Optional[List[Any]], lo: int, hi: int):
+    """對 keys[lo:hi] 做插入排序，items 不為 None 時同步移動"""
+    for i in range(lo + 1, hi):
+        key = keys[i]
+        j = i - 1
+        if not key < keys[j]:
+            continue
+        if items is None:
+            while j >= lo and key < keys[j]:
+                keys[j + 1] = keys[j]
+                j -= 1
+            keys[j + 1] = key
+        else:
+            item = items[i]
+            while j >= lo and key < keys[j]:
+                keys[j + 1] = keys[j]
+                items[j + 1] = items[j]
+                j -= 1
+            keys[j + 1] = key
+            items[j + 1] = item
+
+
+def _median3(keys: List[Any], a: int, b: int, c: int) -> int:
+    """keys[a]、keys[b]、keys[c] 中值所在的索引"""
+    if keys[a] < keys[b]:
+        if keys[b] < keys[c]:
+            return b
+        return c if keys[a] < keys[c] else a
+    if keys[a] < keys[c]:
+        return a
+    return c if keys[b] < keys[c] else b
+
+
+def _choose_pivot(keys: List[Any], lo: int, hi: int) -> int:
+    """選擇基準值索引: 小數組取三數中值，大數組取 ninther"""
+    mid = (lo + hi) // 2
+    last = hi - 1
+    if hi - lo < _NINTHER_CUTOFF:
+        return _median3(keys, lo, mid, last)
+    step = (hi - lo) // 8
+    return _median3(
+        keys,
+        _median3(keys, lo, lo + step, lo + 2 * step),
+        _median3(keys, mid - step, mid, mid + step),
+        _median3(keys, last - 2 * step, last - step, last),
+    )
+
+
+def _partition(keys: List[Any], items: Optional[List[Any]], lo: int, hi: int) -> int:
+    """Hoare 分區，返回 j 使 keys[lo:j+1] <= pivot <= keys[j+1:hi]
+
+    基準值先換到 lo，保證 lo <= j < hi - 1，兩側都不為空。
+    """
+    p = _choose_pivot(keys, lo, hi)
+    keys[lo], keys[p] = keys[p], keys[lo]
+    if items is not None:
+        items[lo], items[p] = items[p], items[lo]
+    pivot = keys[lo]
+    i, j = lo - 1, hi
+    while True:
+        i += 1
+        while keys[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < keys[j]:
+            j -= 1
+        if i >= j:
+            return j
+        keys[i], keys[j] = keys[j], keys[i]
+        if items is not None:
+            items[i], items[j] = items[j], items[i]
+
+
+def _sift_down(
+    keys: List[Any], items: Optional[List[Any]], lo: int, root: int, size: int
+):
+    """堆積排序的下沉操作，堆積位於 keys[lo:lo+size]"""
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            return
+        if child + 1 < size and keys[lo + child] < keys[lo + child + 1]:
+            child += 1
+        if not keys[lo + root] < keys[lo + child]:
+            return
+        a, b = lo + root, lo + child
+        keys[a], keys[b] = keys[b], keys[a]
+        if items is not None:
+            items[a], items[b] = items[b], items[a]
+        root = child
+
+
+def _heapsort(keys: List[Any], items: Optional[List[Any]], lo: int, hi: int):
+    """對 keys[lo:hi] 做堆積排序，作為內省排序遞迴過深時的後備"""
+    size = hi - lo
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(keys, items, lo, root, size)
+    for end in range(size - 1, 0, -1):
+        keys[lo], keys[lo + end] = keys[lo + end], keys[lo]
+        if items is not None:
+            items[lo], items[lo + end] = items[lo + end], items[lo]
+        _sift_down(keys, items, lo, 0, end)
+
+
+def _introsort(
+    keys: List[Any], items: Optional[List[Any]], lo: int, hi: int, depth: int
+):
+    """內省排序主迴圈: 只遞迴較小的一側，較大的一側留在迴圈中處理"""
+    while hi - lo > _INSERTION_CUTOFF:
+        if depth == 0:
+            _heapsort(keys, items, lo, hi)
+            return
+        depth -= 1
+        split = _partition(keys, items, lo, hi) + 1
+        if split - lo < hi - split:
+            _introsort(keys, items, lo, split, depth)
+            lo = split
+        else:
+            _introsort(keys, items, split, hi, depth)
+            hi = split
+    _insertion_sort(keys, items, lo, hi)
+
+
+def _decorate(arr: Sequence[Any], key: Optional[Callable]):
+    """複製輸入並計算鍵值；無 key 時直接排序元素本身"""
+    items = list(arr)
+    if key is None:
+        return items, None
+    return [key(item) for item in items], items
+
+
+def introsort(
+    arr: Sequence[Any], key: Optional[Callable] = None, reverse: bool = False
+) -> List[Any]:
+    """內省排序 (Introsort)，返回新的已排序列表
+
+    快速排序搭配三數中值/ninther 選擇基準值與 Hoare 分區，子數組小於
+    _INSERTION_CUTOFF 時改用插入排序，遞迴深度超過 2·log2(n) 時改用堆積排序，
+    因此最壞情況仍為 O(n log n)，已排序或大量重複的輸入也不會退化。
+    每個元素的 key 只計算一次。
+
+    時間複雜度: O(n log n)
+    空間複雜度: O(log n)，使用 key 時另需 O(n) 保存鍵值
+    穩定性: 不穩定
+
+    Args:
+        arr: 待排序的序列，不會被修改
+        key: 計算比較鍵值的函數
+        reverse: 是否降序排序
+
+    Returns:
+        List[Any]: 排序後的新列表
+    """
+    keys, items = _decorate(arr, key)
+    n = len(keys)
+    _introsort(keys, items, 0, n, 2 * n.bit_length())
+    result = keys if items is None else items
+    if reverse:
+        result.reverse()
+    return result
+
+
+def _merge(
+    src: List[Any],
+    dst: List[Any],
+    src_items: Optional[List[Any]],
+    dst_items: Optional[List[Any]],
+    lo: int,
+    mid: int,
+    hi: int,
+):
+    """把 src[lo:mid] 與 src[mid:hi] 穩定地合併到 dst[lo:hi]"""
+    if mid >= hi or not src[mid] < src[mid - 1]:
+        # 兩段已經有序，直接整段複製
+        dst[lo:hi] = src[lo:hi]
+        if src_items is not None:
+            dst_items[lo:hi] = src_items[lo:hi]
+        return
+    if src[hi - 1] < src[lo]:
+        # 右段整段嚴格小於左段，交換兩段即可，不影響穩定性
+        dst[lo : lo + hi - mid] = src[mid:hi]
+        dst[lo + hi - mid : hi] = src[lo:mid]
+        if src_items is not None:
+            dst_items[lo : lo + hi - mid] = src_items[mid:hi]
+            dst_items[lo + hi - mid : hi] = src_items[lo:mid]
+        return
+
+    i, j, k = lo, mid, lo
+    while i < mid and j < hi:
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            if src_items is not None:
+                dst_items[k] = src_items[j]
+            j += 1
+        else:
+            dst[k] = src[i]
+            if src_items is not None:
+                dst_items[k] = src_items[i]
+            i += 1
+        k += 1
+
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+        if src_items is not None:
+            dst_items[k:hi] = src_items[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
+        if src_items is not None:
+            dst_items[k:hi] = src_items[j:hi]
+
+
+def merge_sort(
+    arr: Sequence[Any], key: Optional[Callable] = None, reverse: bool = False
+) -> List[Any]:
+    """由下而上的合併排序，返回新的已排序列表
+
+    先以插入排序把長度 _MERGE_RUN 的區段排好，再以倍增的寬度逐輪合併；
+    所有合併在輸入與一個預先配置的緩衝區之間來回進行，不做遞迴與切片複製。
+    相鄰兩段已有序或整段顛倒時直接整段複製，因此接近有序或逆序的輸入
+    接近線性時間。
+    降序時先反轉輸入、升序排序後再反轉，保持相等元素的原始順序。
+
+    時間複雜度: O(n log n)
+    空間複雜度: O(n)
+    穩定性: 穩定
+
+    Args:
+        arr: 待排序的序列，不會被修改
+        key: 計算比較鍵值的函數
+        reverse: 是否降序排序
+
+    Returns:
+        List[Any]: 排序後的新列表
+    """
+    keys, items = _decorate(arr, key)
+    if reverse:
+        keys.reverse()
+        if items is not None:
+            items.reverse()
+    n = len(keys)
+
+    for lo in range(0, n, _MERGE_RUN):
+        hi = min(lo + _MERGE_RUN, n)
+        run = keys[lo:hi]
+        if all(b < a for a, b in zip(run, run[1:])):
+            # 嚴格遞減的區段直接反轉
+            keys[lo:hi] = run[::-1]
+            if items is not None:
+                items[lo:hi] = items[lo:hi][::-1]
+        else:
+            _insertion_sort(keys, items, lo, hi)
+
+    src, dst = keys, [None] * n
+    src_items = items
+    dst_items = None if items is None else [None] * n
+    width = _MERGE_RUN
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            _merge(src, dst, src_items, dst_items, lo, mid, hi)
+        src, dst = dst, src
+        src_items, dst_items = dst_items, src_items
+        width *= 2
+
+    result = src if items is None else src_items
+    if reverse:
+        result.reverse()
+    return result
+
+
+__all__ = ["introsort", "merge_sort"]
@@ -0,0 +1,283 @@
+import heapq
+import os
+import pickle
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Union
+
+PathLike = Union[str, Path]
+
+# 溢寫檔中每個 pickle 區塊的記錄數
+_BLOCK_SIZE = 4096
+
+
+def _write_run(records: Iterable[Any], run_path: str):
+    """把已排序的記錄以 pickle 區塊寫入暫存檔"""
+    with open(run_path, "wb") as f:
+        block = []
+        for record in records:
+            block.append(record)
+            if len(block) >= _BLOCK_SIZE:
+                pickle.dump(block, f, pickle.HIGHEST_PROTOCOL)
+                block = []
+        if block:
+            pickle.dump(block, f, pickle.HIGHEST_PROTOCOL)
+
+
+def _read_run(run_path: str) -> Iterator[Any]:
+    """逐區塊讀回 _write_run 寫出的記錄"""
+    with open(run_path, "rb") as f:
+        while True:
+            try:
+                block = pickle.load(f)
+            except EOFError:
+                return
+            yield from block
+
+
+def _sort_records(
+    records: List[Any], run_path: str, key: Optional[Callable], reverse: bool
+) -> str:
+    """排序一段記錄並溢寫，返回暫存檔路徑（可在工作進程中執行）"""
+    records.sort(key=key, reverse=reverse)
+    _write_run(records, run_path)
+    return run_path
+
+
+def _sort_line_range(
+    path: str,
+    start: int,
+    end: int,
+    run_path: str,
+    key: Optional[Callable],
+    reverse: bool,
+    encoding: str,
+) -> str:
+    """讀取檔案 [start, end) 位元組範圍內的行，排序後寫成文字暫存檔
+
+    工作進程自行讀取輸入檔，主進程只傳遞位移，行資料不經過 pickle。
+    行只以 \n 分隔: str.splitlines 也會在 \r、\x0c、\u2028 等字元處斷行，
+    因此先以位元組切分再逐行解碼。
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        chunks = f.read(end - start).split(b"\n")
+    # 以 \n 結尾時最後一項為空；否則為沒有換行符號的最後一行，補上換行
+    if not chunks[-1]:
+        chunks.pop()
+    lines = [chunk.decode(encoding) + "\n" for chunk in chunks]
+    lines.sort(key=key, reverse=reverse)
+    with open(run_path, "w", encoding=encoding, newline="") as f:
+        f.writelines(lines)
+    return run_path
+
+
+def _read_lines(run_path: str, encoding: str) -> Iterator[str]:
+    """逐行讀回文字暫存檔，同樣只在 \n 處斷行"""
+    with open(run_path, "rb") as f:
+        for line in f:
+            yield line.decode(encoding)
+
+
+def _line_ranges(path: PathLike, run_bytes: int) -> List[range]:
+    """把檔案切成約 run_bytes 大小、且在換行處斷開的位元組範圍"""
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            f.seek(start + run_bytes)
+            f.readline()
+            end = min(f.tell(), size)
+            ranges.append(range(start, end))
+            start = end
+    return ranges
+
+
+class ExternalSort:
+    """外部（磁碟）合併排序，處理大於記憶體的資料
+
+    流程:
+    1. 分塊讀入輸入，每塊在記憶體中排序成一個「段」(run) 並溢寫到暫存檔
+    2. 段數超過 max_fan_in 時，先把相鄰的段分組合併成較長的段
+    3. 以 heapq.merge 做 k 路合併，串流輸出到生成器或檔案
+
+    workers > 0 時段的排序分派給進程池；同時在途的段數限制為 2·workers，
+    因此記憶體用量約為 (2·workers + 1) 個段。合併時 heapq.merge 對相等元素
+    優先取較早的段，因此整體排序是穩定的。
+
+    Attributes:
+        run_size (int): sort() 每段的記錄數
+        run_bytes (int): sort_file() 每段的位元組數
+        key (Callable): 計算比較鍵值的函數，workers > 0 時必須可被 pickle
+        reverse (bool): 是否降序排序
+        workers (int): 排序段的進程數，0 表示在目前進程中排序
+        max_fan_in (int): 單次合併同時開啟的段數上限
+        temp_dir (str): 暫存目錄的上層目錄，None 表示系統預設
+    """
+
+    def __init__(
+        self,
+        run_size: int = 1_000_000,
+        run_bytes: int = 256 << 20,
+        key: Optional[Callable[[Any], Any]] = None,
+        reverse: bool = False,
+        workers: Optional[int] = 0,
+        max_fan_in: int = 128,
+        temp_dir: Optional[PathLike] = None,
+    ):
+        """
+        Raises:
+            ValueError: 當 run_size、run_bytes 不是正數或 max_fan_in 小於 2 時
+        """
+        if run_size <= 0 or run_bytes <= 0:
+            raise ValueError("run_size 與 run_bytes 必須是正數")
+        if max_fan_in < 2:
+            raise ValueError("max_fan_in 至少為 2")
+        self.run_size = run_size
+        self.run_bytes = run_bytes
+        self.key = key
+        self.reverse = reverse
+        self.workers = os.cpu_count() if workers is None else workers
+        self.max_fan_in = max_fan_in
+        self.temp_dir = temp_dir
+
+    def sort(self, iterable: Iterable[Any]) -> Iterator[Any]:
+        """排序任意可迭代物件，以生成器串流返回結果
+
+        記錄以 pickle 區塊溢寫，因此必須可被 pickle。暫存檔在生成器
+        耗盡或被關閉時刪除。
+
+        Args:
+            iterable: 輸入記錄，可以是檔案或其他生成器
+
+        Yields:
+            排序後的記錄
+        """
+        workdir = tempfile.mkdtemp(prefix="extsort-", dir=self.temp_dir)
+        try:
+            runs = self._spill(self._record_tasks(iterable, workdir))
+            runs = self._reduce_runs(runs, workdir, _read_run, _write_run)
+            yield from self._merge([_read_run(run) for run in runs])
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    def sort_file(self, src: PathLike, dst: PathLike, encoding: str = "utf-8") -> int:
+        """逐行排序文字檔（例如日誌），結果寫入 dst
+
+        輸入依 run_bytes 切成在換行處斷開的位元組範圍，由工作進程自行讀取並
+        排序，溢寫為文字暫存檔，最後合併寫出。key 作用於包含換行符號的行。
+
+        Args:
+            src: 輸入檔路徑
+            dst: 輸出檔路徑，可與 src 相同
+            encoding: 文字編碼
+
+        Returns:
+            int: 段的數目
+        """
+        workdir = tempfile.mkdtemp(prefix="extsort-", dir=self.temp_dir)
+        try:
+            tasks = (
+                (
+                    _sort_line_range,
+                    str(src),
+                    part.start,
+                    part.stop,
+                    os.path.join(workdir, f"run-{i}"),
+                    self.key,
+                    self.reverse,
+                    encoding,
+                )
+                for i, part in enumerate(_line_ranges(src, self.run_bytes))
+            )
+            runs = self._spill(tasks)
+            num_runs = len(runs)
+
+            def read(run: str) -> Iterator[str]:
+                return _read_lines(run, encoding)
+
+            def write(lines: Iterable[str], run: str):
+                with open(run, "w", encoding=encoding, newline="") as f:
+                    f.writelines(lines)
+
+            runs = self._reduce_runs(runs, workdir, read, write)
+            output = os.path.join(workdir, "output")
+            write(self._merge([read(run) for run in runs]), output)
+            shutil.move(output, dst)
+            return num_runs
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    def _record_tasks(self, iterable: Iterable[Any], workdir: str) -> Iterator[tuple]:
+        """把輸入切成每段 run_size 筆記錄的排序任務"""
+        iterator = iter(iterable)
+        index = 0
+        while True:
+            records = []
+            for record in iterator:
+                records.append(record)
+                if len(records) >= self.run_size:
+                    break
+            if not records:
+                return
+            run_path = os.path.join(workdir, f"run-{index}")
+            yield (_sort_records, records, run_path, self.key, self.reverse)
+            index += 1
+
+    def _spill(self, tasks: Iterable[tuple]) -> List[str]:
+        """執行排序任務，返回依輸入順序排列的段檔案路徑"""
+        if self.workers == 0:
+            return [func(*args) for func, *args in tasks]
+
+        runs = []
+        pending = []
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for func, *args in tasks:
+                pending.append(executor.submit(func, *args))
+                # 限制在途的段數，避免輸入讀取速度超過排序速度時耗盡記憶體
+                if len(pending) >= 2 * self.workers:
+                    runs.append(pending.pop(0).result())
+            runs.extend(future.result() for future in pending)
+        return runs
+
+    def _merge(self, iterators: List[Iterator[Any]]) -> Iterator[Any]:
+        """k 路堆積合併"""
+        return heapq.merge(*iterators, key=self.key, reverse=self.reverse)
+
+    def _reduce_runs(
+        self,
+        runs: List[str],
+        workdir: str,
+        read: Callable[[str], Iterator[Any]],
+        write: Callable[[Iterable[Any], str], None],
+    ) -> List[str]:
+        """段數超過 max_fan_in 時，把相鄰的段分組合併，直到可以一次合併完成"""
+        level = 0
+        while len(runs) > self.max_fan_in:
+            merged = []
+            for i in range(0, len(runs), self.max_fan_in):
+                group = runs[i : i + self.max_fan_in]
+                run_path = os.path.join(workdir, f"merge-{level}-{i}")
+                write(self._merge([read(run) for run in group]), run_path)
+                for run in group:
+                    os.remove(run)
+                merged.append(run_path)
+            runs = merged
+            level += 1
+        return runs
+
+
+def external_sort(
+    iterable: Iterable[Any],
+    key: Optional[Callable[[Any], Any]] = None,
+    reverse: bool = False,
+    **kwargs,
+) -> Iterator[Any]:
+    """以預設參數執行 ExternalSort.sort 的便捷函數"""
+    return ExternalSort(key=key, reverse=reverse, **kwargs).sort(iterable)
+
+
+__all__ = ["ExternalSort", "external_sort"]
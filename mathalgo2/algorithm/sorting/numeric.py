@@ -0,0 +1,209 @@
+from typing import Sequence, Union
+
+import numpy as np
+
+ArrayLike = Union[Sequence, np.ndarray]
+
+# 每輪 LSD 基數排序處理的位元數
+_RADIX_BITS = 16
+# 計數排序允許的最大值域，超過時應改用基數排序
+_COUNTING_MAX_RANGE = 1 << 26
+
+_SIGN_BIT = np.uint64(1 << 63)
+
+
+def _as_numeric(values: ArrayLike) -> np.ndarray:
+    """轉換為一維數值陣列（只轉換一次，已是陣列時不複製）
+
+    Raises:
+        TypeError: 輸入不是同質的整數、布林或浮點數時
+    """
+    arr = np.asarray(values)
+    if arr.dtype.kind not in "biuf":
+        raise TypeError(f"需要同質的整數或浮點數輸入，實際為 {arr.dtype}")
+    if arr.ndim != 1:
+        raise ValueError("只支援一維輸入")
+    return arr
+
+
+def _encode(arr: np.ndarray) -> np.ndarray:
+    """把數值映射為保持大小順序的 uint64 鍵值
+
+    - 無號整數: 直接擴展為 uint64
+    - 有號整數: 翻轉符號位元，使負數排在正數之前
+    - 浮點數: 正數翻轉符號位元，負數翻轉所有位元 (IEEE 754 的位元技巧)；
+      所有 NaN（含符號位元為 1 的 -nan）先換成標準的正 NaN，與 np.sort
+      一樣排在最後
+    """
+    kind = arr.dtype.kind
+    if kind in "bu":
+        return arr.astype(np.uint64)
+    if kind == "i":
+        return arr.astype(np.int64).view(np.uint64) ^ _SIGN_BIT
+    floats = arr.astype(np.float64)  # astype 會複製，可以原地修改
+    floats[np.isnan(floats)] = np.nan
+    bits = floats.view(np.uint64)
+    negative = (bits >> np.uint64(63)).astype(bool)
+    return np.where(negative, ~bits, bits ^ _SIGN_BIT)
+
+
+def _decode(keys: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """_encode 的逆映射"""
+    kind = dtype.kind
+    if kind in "bu":
+        return keys.astype(dtype)
+    if kind == "i":
+        return (keys ^ _SIGN_BIT).view(np.int64).astype(dtype)
+    negative = ~(keys >> np.uint64(63)).astype(bool)
+    bits = np.where(negative, ~keys, keys ^ _SIGN_BIT)
+    return bits.view(np.float64).astype(dtype)
+
+
+def _radix_passes(keys: np.ndarray, with_order: bool = True):
+    """LSD 基數排序 uint64 鍵值
+
+    先減去最小值縮小鍵值範圍，只對實際用到的位元做 16 位元一輪的穩定排序；
+    每輪的穩定排序由 np.argsort(kind="stable") 對 uint16 數位完成，
+    NumPy 對 16 位元整數使用計數式的基數排序，為線性時間。
+
+    Args:
+        keys: uint64 鍵值
+        with_order: True 時返回穩定升序的排列，False 時只返回排序後的鍵值
+
+    Returns:
+        np.ndarray: 排列或排序後的鍵值
+    """
+    n = len(keys)
+    order = np.arange(n, dtype=np.int64) if with_order else None
+    if n < 2 or keys.min() == keys.max():
+        return order if with_order else keys.copy()
+    low = keys.min()
+    shifted = keys - low
+    for shift in range(0, int(keys.max() - low).bit_length(), _RADIX_BITS):
+        digits = (shifted >> np.uint64(shift)).astype(np.uint16)
+        step = np.argsort(digits, kind="stable")
+        shifted = shifted[step]
+        if with_order:
+            order = order[step]
+    return order if with_order else shifted + low
+
+
+def _numpy_order(arr: np.ndarray) -> np.ndarray:
+    """np.argsort 的穩定升序排列"""
+    return np.argsort(arr, kind="stable").astype(np.int64, copy=False)
+
+
+def _radix_order(arr: np.ndarray) -> np.ndarray:
+    """基數排序的穩定升序排列"""
+    return _radix_passes(_encode(arr))
+
+
+def _reversed_stable(order_of, arr: np.ndarray) -> np.ndarray:
+    """穩定降序的排列: 反轉輸入做升序穩定排序後再反轉並換回原索引"""
+    n = len(arr)
+    order = order_of(arr[::-1])
+    return (n - 1 - order)[::-1]
+
+
+def radix_sort(values: ArrayLike, reverse: bool = False) -> np.ndarray:
+    """向量化的 LSD 基數排序
+
+    輸入轉換為保持順序的 64 位元鍵值後，每輪以 16 位元為一個數位做穩定排序，
+    最多 4 輪；鍵值範圍較小時自動減少輪數。浮點數以 IEEE 754 位元技巧
+    轉換，-0.0 排在 0.0 之前，NaN（不論符號位元）排在最後，降序時排在最前。
+
+    時間複雜度: O(n · b/16)，b 為鍵值範圍的位元數
+    空間複雜度: O(n)
+
+    Args:
+        values: 同質的整數或浮點數序列
+        reverse: 是否降序排序
+
+    Returns:
+        np.ndarray: 排序後的新陣列，dtype 與輸入相同
+
+    Raises:
+        TypeError: 輸入不是數值時
+    """
+    arr = _as_numeric(values)
+    keys = _encode(arr)
+    if reverse:
+        keys = ~keys
+    keys = _radix_passes(keys, with_order=False)
+    if reverse:
+        keys = ~keys
+    return _decode(keys, arr.dtype)
+
+
+def counting_sort(values: ArrayLike, reverse: bool = False) -> np.ndarray:
+    """計數排序，適用於值域遠小於 2^64 的整數
+
+    以 np.bincount 統計每個值的次數，再以 np.repeat 展開。
+
+    時間複雜度: O(n + k)，k 為最大值與最小值之差
+    空間複雜度: O(k)
+
+    Args:
+        values: 整數序列
+        reverse: 是否降序排序
+
+    Returns:
+        np.ndarray: 排序後的新陣列
+
+    Raises:
+        TypeError: 輸入不是整數時
+        ValueError: 值域超過 _COUNTING_MAX_RANGE 時
+    """
+    if len(values) == 0:
+        # np.asarray([]) 為 float64，空輸入在型別檢查前直接返回
+        empty = np.asarray(values)
+        return empty.copy() if empty.dtype.kind in "biu" else empty.astype(np.int64)
+    arr = _as_numeric(values)
+    if arr.dtype.kind not in "biu":
+        raise TypeError("計數排序只支援整數輸入")
+    low, high = int(arr.min()), int(arr.max())
+    if high - low >= _COUNTING_MAX_RANGE:
+        raise ValueError(f"值域 {high - low + 1} 過大，請改用 radix_sort")
+    # 有號整數先擴展為 int64 再減去最小值，避免 int8 等窄型別溢位；
+    # 無號整數減去最小值不會下溢，先減再轉換以支援超過 int64 的 uint64
+    if arr.dtype.kind == "u":
+        offsets = (arr - arr.min()).astype(np.int64)
+    else:
+        offsets = arr.astype(np.int64) - low
+    counts = np.bincount(offsets, minlength=high - low + 1)
+    result = np.repeat(np.arange(low, high + 1).astype(arr.dtype), counts)
+    return result[::-1].copy() if reverse else result
+
+
+def argsort(
+    values: ArrayLike, reverse: bool = False, method: str = "numpy"
+) -> np.ndarray:
+    """穩定的間接排序，返回使輸入有序的索引排列
+
+    降序時相等元素仍保持原始順序。
+
+    Args:
+        values: 同質的整數或浮點數序列
+        reverse: 是否降序排序
+        method: "numpy" 使用 np.argsort(kind="stable")，"radix" 使用 LSD 基數排序
+
+    Returns:
+        np.ndarray: int64 的索引排列
+
+    Raises:
+        TypeError: 輸入不是數值時
+        ValueError: method 不支援時
+    """
+    arr = _as_numeric(values)
+    if method == "numpy":
+        order_of = _numpy_order
+    elif method == "radix":
+        order_of = _radix_order
+    else:
+        raise ValueError(f"不支持的方法: {method}")
+    if reverse:
+        return _reversed_stable(order_of, arr)
+    return order_of(arr)
+
+
+__all__ = ["radix_sort", "counting_sort", "argsort"]
@@ -0,0 +1,143 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from mathalgo2.algorithm._shared import ArrayHandle, SharedArrays
+from mathalgo2.algorithm.sorting.numeric import ArrayLike, _as_numeric
+
+# 工作進程連接的共享陣列，由 _init_worker 設置
+_worker_shared: Optional[SharedArrays] = None
+
+# 元素數低於此值時直接以 np.sort 排序，省去建立進程池與共享記憶體的開銷
+_PARALLEL_MIN_SIZE = 1 << 20
+# 每個區塊為每個桶提供的樣本數，樣本越多桶的大小越平均
+_OVERSAMPLE = 16
+
+
+def _init_worker(handles: Dict[str, ArrayHandle]):
+    """工作進程初始化：連接共享的輸入與輸出陣列"""
+    global _worker_shared
+    _worker_shared = SharedArrays.attach(handles)
+
+
+def _sort_block(
+    arrays: Dict[str, np.ndarray], start: int, end: int, num_samples: int
+) -> np.ndarray:
+    """原地排序 data[start:end]，返回等距取出的樣本"""
+    block = arrays["data"][start:end]
+    block.sort()
+    if len(block) == 0:
+        return block[:0].copy()
+    positions = np.linspace(0, len(block) - 1, num_samples).astype(np.int64)
+    return block[positions].copy()
+
+
+def _fill_bucket(
+    arrays: Dict[str, np.ndarray], pieces: List[Tuple[int, int]], out_start: int
+):
+    """把各區塊中屬於同一個桶的片段複製到 output 的連續區間並排序"""
+    data = arrays["data"]
+    size = sum(end - start for start, end in pieces)
+    out = arrays["output"][out_start : out_start + size]
+    offset = 0
+    for start, end in pieces:
+        out[offset : offset + end - start] = data[start:end]
+        offset += end - start
+    out.sort()
+
+
+def _sort_block_task(start: int, end: int, num_samples: int) -> np.ndarray:
+    """工作進程: 排序一個區塊"""
+    return _sort_block(_worker_shared.arrays, start, end, num_samples)
+
+
+def _fill_bucket_task(pieces: List[Tuple[int, int]], out_start: int):
+    """工作進程: 組合並排序一個桶"""
+    _fill_bucket(_worker_shared.arrays, pieces, out_start)
+
+
+def parallel_sort(
+    values: ArrayLike, workers: Optional[int] = None, reverse: bool = False
+) -> np.ndarray:
+    """以共享記憶體與進程池執行的樣本排序 (sample sort / PSRS)
+
+    輸入複製一次到共享記憶體後，工作進程只收到區間位移與分割點，
+    資料本身不經過 pickle：
+
+    1. 輸入切成 workers 個區塊，各進程原地排序自己的區塊並返回等距樣本
+    2. 主進程從全部樣本中選出 workers - 1 個分割點，並以二分搜尋找出
+       每個區塊中落在各個桶的範圍
+    3. 各進程把所有區塊中屬於同一桶的片段複製到輸出陣列的對應區間並排序，
+       桶之間已經有序，因此不需要再合併
+
+    Args:
+        values: 同質的整數或浮點數序列
+        workers: 進程數，None 表示使用所有 CPU 核心，0 表示直接使用 np.sort
+        reverse: 是否降序排序
+
+    Returns:
+        np.ndarray: 排序後的新陣列
+
+    Raises:
+        TypeError: 輸入不是數值時
+    """
+    arr = _as_numeric(values)
+    workers = os.cpu_count() if workers is None else workers
+    n = len(arr)
+    if workers <= 1 or n < _PARALLEL_MIN_SIZE:
+        result = np.sort(arr)
+        return result[::-1].copy() if reverse else result
+
+    bounds = np.linspace(0, n, workers + 1).astype(np.int64).tolist()
+    blocks = list(zip(bounds[:-1], bounds[1:]))
+    num_samples = workers * _OVERSAMPLE
+
+    with SharedArrays() as shared:
+        data = shared.share("data", arr)
+        shared.create("output", (n,), arr.dtype)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(dict(shared.handles),),
+        ) as executor:
+            samples = np.sort(
+                np.concatenate(
+                    list(
+                        executor.map(
+                            _sort_block_task,
+                            bounds[:-1],
+                            bounds[1:],
+                            [num_samples] * workers,
+                        )
+                    )
+                )
+            )
+            splitters = samples[
+                np.linspace(0, len(samples), workers + 1).astype(np.int64)[1:-1]
+            ]
+
+            # cuts[i][j] 為第 i 個區塊中第 j 個桶的起點
+            cuts = [
+                [start]
+                + (np.searchsorted(data[start:end], splitters) + start).tolist()
+                + [end]
+                for start, end in blocks
+            ]
+            tasks = []
+            out_start = 0
+            for bucket in range(workers):
+                pieces = [
+                    (block_cuts[bucket], block_cuts[bucket + 1]) for block_cuts in cuts
+                ]
+                tasks.append((pieces, out_start))
+                out_start += sum(end - start for start, end in pieces)
+            list(executor.map(_fill_bucket_task, *zip(*tasks)))
+
+        output = shared.arrays["output"]
+        result = output[::-1].copy() if reverse else output.copy()
+    return result
+
+
+__all__ = ["parallel_sort"]
@@ -0,0 +1,209 @@
+import heapq
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from mathalgo2.algorithm.sorting.comparison import (
+    _INSERTION_CUTOFF,
+    _decorate,
+    _heapsort,
+    _insertion_sort,
+    _introsort,
+    _partition,
+)
+
+
+def _is_numeric_array(arr: Any, key: Optional[Callable]) -> bool:
+    """無 key 的數值 ndarray 可以直接交給 np.partition"""
+    return key is None and isinstance(arr, np.ndarray) and arr.dtype.kind in "biuf"
+
+
+def _select_range(
+    keys: List[Any], items: Optional[List[Any]], kth: int, lo: int, hi: int
+):
+    """內省選擇: 重排 keys[lo:hi] 使 keys[kth] 為第 kth 小，左側不大於、右側不小於它
+
+    每輪 Hoare 分區後只保留包含 kth 的一側，平均 O(n)；分區次數超過
+    2·log2(n) 時改以堆積排序處理剩下的範圍，最壞 O(n log n)。
+    """
+    depth = 2 * (hi - lo).bit_length()
+    while hi - lo > _INSERTION_CUTOFF:
+        if depth == 0:
+            _heapsort(keys, items, lo, hi)
+            return
+        depth -= 1
+        split = _partition(keys, items, lo, hi) + 1
+        if kth < split:
+            hi = split
+        else:
+            lo = split
+    _insertion_sort(keys, items, lo, hi)
+
+
+def _check_kth(kth: int, n: int) -> int:
+    """檢查並正規化索引（支援負索引）"""
+    if not -n <= kth < n:
+        raise IndexError(f"kth={kth} 超出長度 {n} 的範圍")
+    return kth % n
+
+
+def select(arr: Sequence[Any], kth: int, key: Optional[Callable] = None) -> Any:
+    """返回第 kth 小的元素（從 0 開始，支援負索引），不修改輸入
+
+    使用內省選擇 (introselect)，平均 O(n)，最壞 O(n log n)；
+    無 key 的數值 ndarray 直接使用 np.partition。
+
+    Args:
+        arr: 輸入序列
+        kth: 名次，0 為最小值，-1 為最大值
+        key: 計算比較鍵值的函數
+
+    Returns:
+        第 kth 小的元素
+
+    Raises:
+        IndexError: 當 kth 超出範圍時
+    """
+    n = len(arr)
+    kth = _check_kth(kth, n)
+    if _is_numeric_array(arr, key):
+        return np.partition(arr, kth)[kth]
+    keys, items = _decorate(arr, key)
+    _select_range(keys, items, kth, 0, n)
+    return keys[kth] if items is None else items[kth]
+
+
+def partial_sort(
+    arr: Sequence[Any],
+    k: int,
+    key: Optional[Callable] = None,
+    reverse: bool = False,
+) -> Union[List[Any], np.ndarray]:
+    """部分排序: 前 k 個元素為排序後的前 k 名，其餘元素順序未定義
+
+    先以內省選擇把前 k 名移到一端，只排序這 k 個元素，
+    時間複雜度 O(n + k log k)。
+
+    Args:
+        arr: 輸入序列，不會被修改
+        k: 需要排序的元素數，超過長度時等同完整排序
+        key: 計算比較鍵值的函數
+        reverse: True 時前 k 個為最大的 k 個並降序排列
+
+    Returns:
+        重排後的新列表（無 key 的數值 ndarray 輸入時返回 ndarray）
+    """
+    n = len(arr)
+    k = max(0, min(k, n))
+    # 降序時把最大的 k 個選到尾端並升序排列，最後整體反轉
+    lo, hi = (n - k, n) if reverse else (0, k)
+    pivot = lo if reverse else hi - 1
+
+    if _is_numeric_array(arr, key):
+        result = np.partition(arr, pivot) if 0 < k < n else np.array(arr)
+        result[lo:hi].sort()
+        return result[::-1].copy() if reverse else result
+
+    keys, items = _decorate(arr, key)
+    if 0 < k < n:
+        _select_range(keys, items, pivot, 0, n)
+    _introsort(keys, items, lo, hi, 2 * k.bit_length())
+    result = keys if items is None else items
+    if reverse:
+        result.reverse()
+    return result
+
+
+def nsmallest(
+    iterable: Iterable[Any], k: int, key: Optional[Callable] = None
+) -> Union[List[Any], np.ndarray]:
+    """最小的 k 個元素（升序，相等元素保持輸入順序）
+
+    一般輸入以大小為 k 的堆積單次掃描，O(n log k) 且只保留 k 個元素，
+    可用於迭代器；無 key 的數值 ndarray 使用 np.partition 並返回 ndarray。
+    """
+    if _is_numeric_array(iterable, key):
+        return partial_sort(iterable, k)[: max(k, 0)]
+    return heapq.nsmallest(k, iterable, key=key)
+
+
+def nlargest(
+    iterable: Iterable[Any], k: int, key: Optional[Callable] = None
+) -> Union[List[Any], np.ndarray]:
+    """最大的 k 個元素（降序，相等元素保持輸入順序），實作同 nsmallest"""
+    if _is_numeric_array(iterable, key):
+        return partial_sort(iterable, k, reverse=True)[: max(k, 0)]
+    return heapq.nlargest(k, iterable, key=key)
+
+
+class _Descending:
+    """反轉比較順序的包裝，讓最小堆積可以當作最大堆積使用"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: "_Descending") -> bool:
+        return other.value < self.value
+
+    def __eq__(self, other: "_Descending") -> bool:
+        return self.value == other.value
+
+
+class TopK:
+    """串流的前 k 名，只保留 k 個元素的有界堆積
+
+    堆積頂端永遠是目前第 k 名；新元素只有比它更好時才會替換，
+    每個元素 O(log k)。相等元素保留較早到達的。
+
+    Attributes:
+        k (int): 保留的元素數
+        key (Callable): 計算比較鍵值的函數，每個元素只計算一次
+        largest (bool): True 保留最大的 k 個，False 保留最小的 k 個
+        count (int): 已處理的元素數
+    """
+
+    def __init__(
+        self, k: int, key: Optional[Callable[[Any], Any]] = None, largest: bool = True
+    ):
+        """
+        Raises:
+            ValueError: 當 k 為負數時
+        """
+        if k < 0:
+            raise ValueError("k 不能為負數")
+        self.k = k
+        self.key = key
+        self.largest = largest
+        self.count = 0
+        self._heap: List[tuple] = []
+
+    def push(self, item: Any):
+        """加入一個元素"""
+        value = item if self.key is None else self.key(item)
+        # 以到達序號打破平手，保證元素本身不會被比較
+        if self.largest:
+            entry = ((value, -self.count), item)
+        else:
+            entry = (_Descending((value, self.count)), item)
+        self.count += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif self.k:
+            heapq.heappushpop(self._heap, entry)
+
+    def extend(self, iterable: Iterable[Any]):
+        """加入迭代器中的所有元素"""
+        for item in iterable:
+            self.push(item)
+
+    def result(self) -> List[Any]:
+        """目前的前 k 名，由最好到最差排列"""
+        return [item for _, item in sorted(self._heap, reverse=True)]
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+__all__ = ["select", "partial_sort", "nsmallest", "nlargest", "TopK"]
@@ -0,0 +1,11 @@
+"""
+空間搜尋模組，提供以陣列實作的 k-d 樹與向量化的近鄰搜尋
+"""
+
+from .kdtree import KDTree, brute_force_knn, knn
+
+__all__ = [
+    "KDTree",
+    "brute_force_knn",
+    "knn",
+]
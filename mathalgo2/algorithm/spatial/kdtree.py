@@ -0,0 +1,433 @@
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# 維度超過此值時 k-d 樹的剪枝幾乎失效，knn() 改用暴力搜尋
+_KDTREE_MAX_DIM = 16
+# 每批查詢的數量，限制候選距離陣列的記憶體；不超過 int16 範圍，
+# 讓批內的查詢編號可以用 16 位元的穩定基數排序分組
+_QUERY_CHUNK = 4096
+# brute_force_knn 每批工作陣列的記憶體預算（位元組）
+_BRUTE_FORCE_MEMORY = 256 << 20
+
+
+def _as_points(points: Any) -> np.ndarray:
+    """轉換為 (N, d) 的 float64 陣列，也接受 Vector_space 物件的序列
+
+    Raises:
+        ValueError: 輸入不是二維陣列時
+    """
+    if len(points) and hasattr(points[0], "vector"):
+        points = [point.vector for point in points]
+    array = np.asarray(points, dtype=np.float64)
+    if array.ndim == 1 and array.size:
+        array = array.reshape(1, -1)
+    if array.ndim != 2:
+        raise ValueError("點集必須是 (N, d) 的二維陣列")
+    return array
+
+
+def _ragged_positions(
+    starts: np.ndarray, counts: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """把多個區間 [start, start + count) 攤平，返回 (區間編號, 位置)"""
+    total = int(counts.sum())
+    owner = np.repeat(np.arange(len(counts)), counts)
+    if total == 0:
+        return owner, np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return owner, offsets + np.arange(total)
+
+
+def _merge_best(
+    best_dist: np.ndarray,
+    best_idx: np.ndarray,
+    queries: np.ndarray,
+    dist: np.ndarray,
+    idx: np.ndarray,
+):
+    """把候選 (查詢, 距離, 索引) 併入每個查詢目前的前 k 名（原地更新）"""
+    q, k = best_dist.shape
+    all_q = np.concatenate([np.repeat(np.arange(q), k), queries])
+    all_dist = np.concatenate([best_dist.ravel(), dist])
+    all_idx = np.concatenate([best_idx.ravel(), idx])
+    # 先依距離排序，再依查詢編號做穩定排序（int16 時 NumPy 使用基數排序），
+    # 比對兩個鍵做 lexsort 快得多
+    order = np.argsort(all_dist)
+    order = order[np.argsort(all_q[order].astype(np.int16), kind="stable")]
+    all_q = all_q[order]
+    # 每組的名次 = 位置 - 組起點；每個查詢至少有 k 個（原有的）項目
+    group_start = np.searchsorted(all_q, np.arange(q))
+    rank = np.arange(len(all_q)) - group_start[all_q]
+    keep = order[rank < k]
+    best_dist[...] = all_dist[keep].reshape(q, k)
+    best_idx[...] = all_idx[keep].reshape(q, k)
+
+
+class KDTree:
+    """以陣列儲存節點的 k-d 樹，支援批次 kNN 與半徑查詢
+
+    建立時每個節點沿外接盒最長的維度在中位數處切開（np.argpartition），
+    點依節點順序重排，因此每個節點對應 data 中的一段連續區間。
+    節點資訊存在平行的 NumPy 陣列中，不建立任何 Python 節點物件。
+
+    查詢以整批查詢點向量化進行：
+    1. 所有查詢同時沿樹下降到所在的葉，先以該葉的點得到初始的第 k 近距離
+    2. 以 (查詢, 節點) 配對逐層展開，配對中查詢到節點外接盒的距離
+       超過目前第 k 近距離的直接剪枝，到達葉時計算距離並合併前 k 名
+
+    Attributes:
+        data (np.ndarray): 依樹的順序重排後的點，形狀 (N, d)
+        indices (np.ndarray): data[i] 在原始輸入中的索引
+        leaf_size (int): 葉節點最多包含的點數
+        start, end (np.ndarray): 每個節點在 data 中的區間
+        split_dim (np.ndarray): 內部節點的切分維度，葉為 -1
+        split_value (np.ndarray): 內部節點的切分值
+        left, right (np.ndarray): 子節點編號，葉為 -1
+        lower, upper (np.ndarray): 每個節點的外接盒，形狀 (節點數, d)
+    """
+
+    def __init__(self, points: Any, leaf_size: int = 32):
+        """建立 k-d 樹
+
+        Args:
+            points: (N, d) 的點集，或 Vector_space 物件的序列
+            leaf_size: 葉節點最多包含的點數
+
+        Raises:
+            ValueError: 點集為空或 leaf_size 小於 1 時
+        """
+        points = _as_points(points)
+        if len(points) == 0:
+            raise ValueError("點集不能為空")
+        if leaf_size < 1:
+            raise ValueError("leaf_size 至少為 1")
+        self.leaf_size = leaf_size
+        order = np.arange(len(points))
+
+        start, end, split_dim, split_value = [0], [len(points)], [], []
+        left, right, lower, upper = [], [], [], []
+        node = 0
+        # 節點依建立順序編號；子節點在處理到時才切分
+        while node < len(start):
+            lo, hi = start[node], end[node]
+            block = points[order[lo:hi]]
+            box_min, box_max = block.min(axis=0), block.max(axis=0)
+            lower.append(box_min)
+            upper.append(box_max)
+            spread = box_max - box_min
+            if hi - lo <= leaf_size or not spread.any():
+                split_dim.append(-1)
+                split_value.append(0.0)
+                left.append(-1)
+                right.append(-1)
+            else:
+                dim = int(np.argmax(spread))
+                mid = (lo + hi) // 2
+                part = np.argpartition(block[:, dim], mid - lo)
+                order[lo:hi] = order[lo:hi][part]
+                split_dim.append(dim)
+                split_value.append(float(points[order[mid], dim]))
+                left.append(len(start))
+                right.append(len(start) + 1)
+                start += [lo, mid]
+                end += [mid, hi]
+            node += 1
+
+        self.indices = order
+        self.data = points[order]
+        self.start = np.asarray(start, dtype=np.int64)
+        self.end = np.asarray(end, dtype=np.int64)
+        self.split_dim = np.asarray(split_dim, dtype=np.int64)
+        self.split_value = np.asarray(split_value, dtype=np.float64)
+        self.left = np.asarray(left, dtype=np.int64)
+        self.right = np.asarray(right, dtype=np.int64)
+        self.lower = np.vstack(lower)
+        self.upper = np.vstack(upper)
+
+    @classmethod
+    def from_vectors(cls, vectors: Sequence[Any], leaf_size: int = 32) -> "KDTree":
+        """由 Vector_space 物件的序列建立"""
+        return cls(vectors, leaf_size=leaf_size)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def dimension(self) -> int:
+        """點的維度"""
+        return self.data.shape[1]
+
+    def _check_queries(self, queries: Any) -> np.ndarray:
+        """轉換並檢查查詢點的維度"""
+        queries = _as_points(queries)
+        if queries.shape[1] != self.dimension:
+            raise ValueError(f"查詢點維度 {queries.shape[1]} 與樹的維度 {self.dimension} 不符")
+        return queries
+
+    def _home_leaves(self, queries: np.ndarray) -> np.ndarray:
+        """所有查詢同時沿切分值下降，返回各自所在的葉節點"""
+        nodes = np.zeros(len(queries), dtype=np.int64)
+        active = np.flatnonzero(self.split_dim[nodes] >= 0)
+        while len(active):
+            current = nodes[active]
+            dims = self.split_dim[current]
+            go_left = queries[active, dims] < self.split_value[current]
+            nodes[active] = np.where(go_left, self.left[current], self.right[current])
+            active = active[self.split_dim[nodes[active]] >= 0]
+        return nodes
+
+    def _box_distance(self, queries: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+        """查詢點到節點外接盒的平方距離"""
+        gap = np.maximum(self.lower[nodes] - queries, 0.0)
+        gap = np.maximum(gap, queries - self.upper[nodes])
+        return np.einsum("ij,ij->i", gap, gap)
+
+    def _leaf_candidates(
+        self, queries: np.ndarray, pair_query: np.ndarray, pair_node: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """展開 (查詢, 葉) 配對為 (查詢, data 位置, 平方距離)"""
+        owner, positions = _ragged_positions(
+            self.start[pair_node], self.end[pair_node] - self.start[pair_node]
+        )
+        owner = pair_query[owner]
+        diff = self.data[positions] - queries[owner]
+        return owner, positions, np.einsum("ij,ij->i", diff, diff)
+
+    def _knn_chunk(self, queries: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """一批查詢的 kNN，返回 (平方距離, data 位置)"""
+        q = len(queries)
+        best_dist = np.full((q, k), np.inf)
+        best_pos = np.full((q, k), -1, dtype=np.int64)
+
+        home = self._home_leaves(queries)
+        owner, positions, dist = self._leaf_candidates(queries, np.arange(q), home)
+        _merge_best(best_dist, best_pos, owner, dist, positions)
+
+        pair_query = np.arange(q)
+        pair_node = np.zeros(q, dtype=np.int64)
+        while len(pair_query):
+            bound = best_dist[pair_query, -1]
+            keep = self._box_distance(queries[pair_query], pair_node) < bound
+            pair_query, pair_node = pair_query[keep], pair_node[keep]
+
+            is_leaf = self.split_dim[pair_node] < 0
+            leaf_query, leaf_node = pair_query[is_leaf], pair_node[is_leaf]
+            # 所在的葉已在第一步處理過
+            fresh = leaf_node != home[leaf_query]
+            leaf_query, leaf_node = leaf_query[fresh], leaf_node[fresh]
+            if len(leaf_query):
+                owner, positions, dist = self._leaf_candidates(
+                    queries, leaf_query, leaf_node
+                )
+                better = dist < best_dist[owner, -1]
+                _merge_best(
+                    best_dist, best_pos, owner[better], dist[better], positions[better]
+                )
+
+            inner_query, inner_node = pair_query[~is_leaf], pair_node[~is_leaf]
+            pair_query = np.concatenate([inner_query, inner_query])
+            pair_node = np.concatenate([self.left[inner_node], self.right[inner_node]])
+
+        return best_dist, best_pos
+
+    def query(
+        self, queries: Any, k: int = 1, return_distance: bool = True
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """批次 k 近鄰查詢（歐氏距離）
+
+        Args:
+            queries: (Q, d) 的查詢點
+            k: 近鄰數，超過點數時取全部點
+            return_distance: 是否同時返回距離
+
+        Returns:
+            (distances, indices): 兩者形狀皆為 (Q, k)，依距離由近到遠，
+            indices 為原始輸入中的索引；return_distance=False 時只返回 indices
+
+        Raises:
+            ValueError: k 小於 1 或維度不符時
+        """
+        if k < 1:
+            raise ValueError("k 至少為 1")
+        queries = self._check_queries(queries)
+        k = min(k, len(self.data))
+        distances = np.empty((len(queries), k))
+        indices = np.empty((len(queries), k), dtype=np.int64)
+        for lo in range(0, len(queries), _QUERY_CHUNK):
+            chunk = slice(lo, lo + _QUERY_CHUNK)
+            dist, pos = self._knn_chunk(queries[chunk], k)
+            distances[chunk] = np.sqrt(dist)
+            indices[chunk] = self.indices[pos]
+        return (distances, indices) if return_distance else indices
+
+    def query_radius(
+        self, queries: Any, radius: float, return_distance: bool = False
+    ) -> Union[List[np.ndarray], Tuple[List[np.ndarray], List[np.ndarray]]]:
+        """批次半徑查詢: 每個查詢點距離不超過 radius 的所有點
+
+        Args:
+            queries: (Q, d) 的查詢點
+            radius: 查詢半徑
+            return_distance: 是否同時返回距離
+
+        Returns:
+            每個查詢一個索引陣列（依距離由近到遠）；return_distance=True 時
+            返回 (indices, distances)
+
+        Raises:
+            ValueError: 半徑為負或維度不符時
+        """
+        if radius < 0:
+            raise ValueError("radius 不能為負數")
+        queries = self._check_queries(queries)
+        limit = radius * radius
+        all_query, all_pos, all_dist = [], [], []
+
+        for lo in range(0, len(queries), _QUERY_CHUNK):
+            chunk = queries[lo : lo + _QUERY_CHUNK]
+            pair_query = np.arange(len(chunk))
+            pair_node = np.zeros(len(chunk), dtype=np.int64)
+            while len(pair_query):
+                keep = self._box_distance(chunk[pair_query], pair_node) <= limit
+                pair_query, pair_node = pair_query[keep], pair_node[keep]
+                is_leaf = self.split_dim[pair_node] < 0
+                if is_leaf.any():
+                    owner, positions, dist = self._leaf_candidates(
+                        chunk, pair_query[is_leaf], pair_node[is_leaf]
+                    )
+                    inside = dist <= limit
+                    all_query.append(owner[inside] + lo)
+                    all_pos.append(positions[inside])
+                    all_dist.append(dist[inside])
+                inner_query, inner_node = pair_query[~is_leaf], pair_node[~is_leaf]
+                pair_query = np.concatenate([inner_query, inner_query])
+                pair_node = np.concatenate(
+                    [self.left[inner_node], self.right[inner_node]]
+                )
+
+        owner = np.concatenate(all_query) if all_query else np.empty(0, np.int64)
+        positions = np.concatenate(all_pos) if all_pos else np.empty(0, np.int64)
+        dist = np.concatenate(all_dist) if all_dist else np.empty(0)
+        order = np.lexsort((dist, owner))
+        splits = np.searchsorted(owner[order], np.arange(1, len(queries)))
+        indices = np.split(self.indices[positions[order]], splits)
+        if return_distance:
+            return indices, np.split(np.sqrt(dist[order]), splits)
+        return indices
+
+
+def _brute_force_chunk(num_points: int, memory_bytes: int, candidates: int = 0) -> int:
+    """在記憶體預算內每批可處理的查詢數
+
+    每批同時存在兩個 (批次, N) 的 8 位元組陣列: 距離矩陣與 argpartition
+    返回的索引，另加重新計算精確距離時 (批次, k, d) 的差值陣列，
+    因此每個查詢約需 8·(2N + k·d) 位元組；candidates 為 k·d。
+    """
+    per_query = 8 * (2 * max(num_points, 1) + candidates)
+    return max(1, memory_bytes // per_query)
+
+
+def brute_force_knn(
+    points: Any,
+    queries: Any,
+    k: int = 1,
+    chunk_size: Optional[int] = None,
+    memory_bytes: int = _BRUTE_FORCE_MEMORY,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """向量化的暴力 k 近鄰，適合高維度或小型點集
+
+    以 |x|² + |y|² - 2x·y 分批計算距離矩陣（矩陣乘法，原地累加），
+    再以 np.argpartition 取出前 k 名。展開式在座標遠離原點時會因相消
+    而失去精度，因此先把點集與查詢點平移到點集的平均值，並對選出的
+    k 個候選以座標差重新計算精確距離後再排序。
+
+    每批的峰值記憶體約為 chunk_size × (2N + k·d) × 8 位元組（float64
+    距離矩陣、int64 索引與候選的座標差），另加 O(Q·k) 的輸出；未指定
+    chunk_size 時由 memory_bytes 推算，因此點集很大時每批的查詢數會
+    自動減少（至少一個）。
+
+    Args:
+        points: (N, d) 的點集
+        queries: (Q, d) 的查詢點
+        k: 近鄰數，超過點數時取全部點
+        chunk_size: 每批的查詢數，None 表示依 memory_bytes 決定
+        memory_bytes: 每批工作陣列的記憶體預算（位元組）
+
+    Returns:
+        (distances, indices): 形狀皆為 (Q, k)，依距離由近到遠
+
+    Raises:
+        ValueError: k 小於 1、chunk_size 小於 1 或維度不符時
+    """
+    points = _as_points(points)
+    queries = _as_points(queries)
+    if k < 1:
+        raise ValueError("k 至少為 1")
+    if queries.shape[1] != points.shape[1]:
+        raise ValueError("查詢點與點集的維度不符")
+    k = min(k, len(points))
+    if chunk_size is None:
+        chunk_size = _brute_force_chunk(len(points), memory_bytes, k * points.shape[1])
+    elif chunk_size < 1:
+        raise ValueError("chunk_size 至少為 1")
+    # 平移到點集的平均值，讓展開式中的各項量級接近距離本身
+    center = points.mean(axis=0)
+    centered = points - center
+    point_norms = np.einsum("ij,ij->i", centered, centered)
+    distances = np.empty((len(queries), k))
+    indices = np.empty((len(queries), k), dtype=np.int64)
+
+    for lo in range(0, len(queries), chunk_size):
+        chunk = queries[lo : lo + chunk_size]
+        # 原地運算，避免產生額外的 (批次, N) 暫存陣列
+        shifted = chunk - center
+        dist = shifted @ centered.T
+        dist *= -2.0
+        dist += point_norms[None, :]
+        dist += np.einsum("ij,ij->i", shifted, shifted)[:, None]
+        if k < len(points):
+            nearest = np.argpartition(dist, k - 1, axis=1)[:, :k]
+        else:
+            nearest = np.broadcast_to(np.arange(len(points)), dist.shape).copy()
+        del dist
+        # 候選的精確平方距離: 直接由原始座標差計算
+        diff = points[nearest] - chunk[:, None, :]
+        nearest_dist = np.einsum("ijk,ijk->ij", diff, diff)
+        del diff
+        order = np.argsort(nearest_dist, axis=1, kind="stable")
+        indices[lo : lo + chunk_size] = np.take_along_axis(nearest, order, axis=1)
+        distances[lo : lo + chunk_size] = np.sqrt(
+            np.take_along_axis(nearest_dist, order, axis=1)
+        )
+    return distances, indices
+
+
+def knn(
+    points: Any, queries: Any, k: int = 1, method: str = "auto"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """批次 k 近鄰的便捷函數
+
+    Args:
+        points: (N, d) 的點集
+        queries: (Q, d) 的查詢點
+        k: 近鄰數
+        method: "kdtree"、"brute" 或 "auto"（維度超過 16 時用暴力搜尋）
+
+    Returns:
+        (distances, indices)
+
+    Raises:
+        ValueError: method 不支援時
+    """
+    points = _as_points(points)
+    if method == "auto":
+        method = "brute" if points.shape[1] > _KDTREE_MAX_DIM else "kdtree"
+    if method == "kdtree":
+        return KDTree(points).query(queries, k)
+    if method == "brute":
+        return brute_force_knn(points, queries, k)
+    raise ValueError(f"不支持的方法: {method}")
+
+
+__all__ = ["KDTree", "brute_force_knn", "knn"]
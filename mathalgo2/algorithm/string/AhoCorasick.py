@@ -0,0 +1,245 @@
+from array import array
+from bisect import bisect_left
+from typing import Dict, Generator, Hashable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from mathalgo2.algorithm.string._buffer import (
+    Pattern,
+    Text,
+    binary_pattern,
+    is_binary,
+    open_text,
+)
+
+# 稠密轉移表的項目數上限（int32，約 16 MB）；超過時改用稀疏字典樹
+_DENSE_MAX_ENTRIES = 1 << 22
+
+# 掃描時產生 (結束位置, 模式編號)，結束後返回最後的狀態
+Scan = Generator[Tuple[int, int], None, int]
+
+
+class AhoCorasick:
+    def __init__(self, patterns: Sequence[Pattern]):
+        """初始化 Aho-Corasick 自動機，所有模式只建立一次
+
+        模式的字元先壓縮為連續的編號 1..σ（0 代表不在任何模式中的字元）。
+        字典樹以 CSR 形式的 int32 陣列儲存: 狀態 s 的子節點為
+        child_code / child_state[child_start[s]:child_start[s + 1]]，
+        依字元編號排序，以二分搜尋查找；找不到時沿失敗連結回退，
+        記憶體為 O(狀態數)，與字母表大小無關。
+
+        狀態數 × (σ + 1) 不超過 _DENSE_MAX_ENTRIES 時（例如位元組模式），
+        另外展開為稠密的 DFA 轉移表，每個字元只需一次查表。轉移表的項目
+        為預先乘上列寬的目標狀態位移；目標狀態有輸出時儲存其位元補數
+        (~offset)，掃描時以正負號判斷是否需要輸出。
+
+        Args:
+            patterns: 模式字串的序列，模式編號為其索引；也可以全為 bytes-like，
+                此時搜尋的文本必須是二進位緩衝區。str 模式搜尋二進位文本時
+                以 UTF-8 編碼比對（規則同 KMP 與 RabinKarp）
+
+        Raises:
+            ValueError: 沒有模式或包含空模式時
+            TypeError: str 與二進位模式混用時
+        """
+        if not patterns:
+            raise ValueError("Patterns cannot be empty")
+        if any(len(pattern) == 0 for pattern in patterns):
+            raise ValueError("Pattern cannot be empty")
+        kinds = {isinstance(pattern, str) for pattern in patterns}
+        if len(kinds) > 1:
+            raise TypeError("模式必須全為 str 或全為二進位")
+
+        self.binary = not kinds.pop()
+        self.patterns = [
+            binary_pattern(pattern) if self.binary else pattern for pattern in patterns
+        ]
+        self.pattern_lengths = array("i", (len(p) for p in self.patterns))
+
+        # 建立字典樹，字元以壓縮後的編號表示
+        char_map: Dict[Hashable, int] = {}
+        children: List[Dict[int, int]] = [{}]
+        own: List[List[int]] = [[]]
+        for pattern_id, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                code = char_map.setdefault(char, len(char_map) + 1)
+                nxt = children[state].get(code)
+                if nxt is None:
+                    nxt = len(children)
+                    children[state][code] = nxt
+                    children.append({})
+                    own.append([])
+                state = nxt
+            own[state].append(pattern_id)
+
+        # 廣度優先計算失敗連結與輸出連結
+        num_states = len(children)
+        fail = array("i", bytes(4 * num_states))
+        output_link = array("i", [-1]) * num_states
+        queue = list(children[0].values())
+        for state in queue:
+            for code, child in children[state].items():
+                fail_state = fail[state]
+                while fail_state and code not in children[fail_state]:
+                    fail_state = fail[fail_state]
+                fail_state = children[fail_state].get(code, 0) if state else 0
+                fail[child] = fail_state
+                output_link[child] = (
+                    fail_state if own[fail_state] else output_link[fail_state]
+                )
+                queue.append(child)
+
+        # CSR 形式的子節點陣列，每個狀態的子節點依字元編號排序
+        child_start = array("i", [0])
+        child_code = array("i")
+        child_state = array("i")
+        for edges in children:
+            for code, child in sorted(edges.items()):
+                child_code.append(code)
+                child_state.append(child)
+            child_start.append(len(child_code))
+
+        width = len(char_map) + 1
+        root = array("i", bytes(4 * width))
+        for code, child in children[0].items():
+            root[code] = child
+
+        self._char_map = char_map
+        self._width = width
+        self._child_start = child_start
+        self._child_code = child_code
+        self._child_state = child_state
+        self._fail = fail
+        self._root = root
+        self._output_link = output_link
+        self._terminal = bytearray(
+            bool(ids) or link >= 0 for ids, link in zip(own, output_link)
+        )
+        self._output_start = array("i", np.cumsum([0] + [len(ids) for ids in own]))
+        self._output_ids = array("i", (pid for ids in own for pid in ids))
+        self.num_states = num_states
+        self.alphabet_size = len(char_map)
+        self.dense = num_states * width <= _DENSE_MAX_ENTRIES
+        self._goto = self._dense_table(queue, children) if self.dense else None
+        self._binary = None  # str 模式的 UTF-8 版本自動機，第一次需要時建立
+
+    def _dense_table(self, order: List[int], children: List[Dict[int, int]]) -> array:
+        """依廣度優先順序展開稠密 DFA: 每列 = 失敗狀態的列，再覆寫自己的子節點
+
+        直接以 int32 建立，不經過 int64 的暫存陣列。
+        """
+        width = self._width
+        table = np.zeros((self.num_states, width), dtype=np.int32)
+        table[0] = self._root
+        for state in order:
+            table[state] = table[self._fail[state]]
+            for code, child in children[state].items():
+                table[state, code] = child
+        has_output = np.frombuffer(bytes(self._terminal), dtype=np.bool_)[table]
+        table *= width
+        np.invert(table, out=table, where=has_output)
+        return array("i", table.tobytes())
+
+    def _outputs(self, state: int) -> Iterator[int]:
+        """狀態及其輸出連結鏈上所有的模式編號（由長到短）"""
+        while state >= 0:
+            yield from self._output_ids[
+                self._output_start[state] : self._output_start[state + 1]
+            ]
+            state = self._output_link[state]
+
+    def _scan(self, buffer: Sequence, state: int = 0) -> Scan:
+        """從指定狀態開始掃描已開啟的文本
+
+        Yields:
+            tuple[int, int]: (結束位置, 模式編號)，位置相對於 buffer
+
+        Returns:
+            int: 掃描結束時的狀態，供串流搜尋接續下一個區塊
+        """
+        char_map = self._char_map
+        if self.dense:
+            goto = self._goto
+            width = self._width
+            offset = state * width
+            for end, char in enumerate(buffer):
+                offset = goto[offset + char_map.get(char, 0)]
+                if offset < 0:
+                    offset = ~offset
+                    for pattern_id in self._outputs(offset // width):
+                        yield end, pattern_id
+            return offset // width
+
+        child_start = self._child_start
+        child_code = self._child_code
+        child_state = self._child_state
+        fail = self._fail
+        root = self._root
+        terminal = self._terminal
+        for end, char in enumerate(buffer):
+            code = char_map.get(char, 0)
+            if not code:
+                state = 0
+                continue
+            # 沿失敗連結回退，直到找到該字元的子節點或回到根節點
+            while state:
+                lo, hi = child_start[state], child_start[state + 1]
+                i = bisect_left(child_code, code, lo, hi)
+                if i < hi and child_code[i] == code:
+                    state = child_state[i]
+                    break
+                state = fail[state]
+            else:
+                state = root[code]
+            if terminal[state]:
+                for pattern_id in self._outputs(state):
+                    yield end, pattern_id
+        return state
+
+    def _prepared(self, text: Text) -> "AhoCorasick":
+        """返回與文本型別相符的自動機
+
+        str 模式搜尋二進位文本時，使用以 UTF-8 編碼的模式建立的自動機，
+        模式編號不變，位置以位元組計。
+
+        Raises:
+            TypeError: 以二進位模式搜尋 str 文本時
+        """
+        if not is_binary(text):
+            if self.binary:
+                raise TypeError("二進位模式只能搜尋二進位文本")
+            return self
+        if self.binary:
+            return self
+        if self._binary is None:
+            self._binary = AhoCorasick([binary_pattern(p) for p in self.patterns])
+        return self._binary
+
+    def finditer(self, text: Text) -> Iterator[Tuple[int, int]]:
+        """單次掃描文本，依結束位置的順序產生所有匹配
+
+        Args:
+            text: 要被搜尋的文本，str、bytes、bytearray、memoryview 或 mmap；
+                二進位文本不會被複製，位置以位元組計
+
+        Yields:
+            tuple[int, int]: (起始位置, 模式編號)
+        """
+        automaton = self._prepared(text)
+        lengths = automaton.pattern_lengths
+        with open_text(text) as buffer:
+            for end, pattern_id in automaton._scan(buffer):
+                yield end - lengths[pattern_id] + 1, pattern_id
+
+    def search(self, text: Text) -> list[Tuple[int, int]]:
+        """在文本中搜尋所有模式
+
+        Args:
+            text: 要被搜尋的文本
+
+        Returns:
+            list[tuple[int, int]]: 所有匹配的 (起始位置, 模式編號) 列表
+        """
+        return list(self.finditer(text))
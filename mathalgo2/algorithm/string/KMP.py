@@ -1,73 +1,114 @@
+from array import array
+from typing import Iterator, Sequence, Tuple
+
+from mathalgo2.algorithm.string._buffer import (
+    Pattern,
+    Text,
+    binary_pattern,
+    is_binary,
+    open_text,
+)
+
+
+def compute_lps(pattern: Sequence) -> array:
+    """計算最長相同前後綴數組（Longest Proper Prefix which is also Suffix）
+
+    Returns:
+        array: LPS 數組，typecode 為 "i"
+    """
+    M = len(pattern)
+    lps = array("i", [0]) * M
+    length = 0  # 前一個最長相同前後綴的長度
+    i = 1
+
+    while i < M:
+        if pattern[i] == pattern[length]:
+            length += 1
+            lps[i] = length
+            i += 1
+        else:
+            if length != 0:
+                length = lps[length - 1]
+            else:
+                lps[i] = 0
+                i += 1
+
+    return lps
+
+
 class KMP:
-    def __init__(self, pattern: str):
-        """初始化 KMP 算法
+    def __init__(self, pattern: Pattern):
+        """初始化 KMP 算法，LPS 數組只在此計算一次
 
         Args:
-            pattern: 要搜尋的模式字串
+            pattern: 要搜尋的模式，str 或 bytes-like；str 模式搜尋二進位文本時
+                以 UTF-8 編碼比對
         """
         if not pattern:
             raise ValueError("Pattern cannot be empty")
 
+        if not isinstance(pattern, str):
+            pattern = binary_pattern(pattern)
         self.pattern = pattern
         self.pattern_length = len(pattern)
+        self.lps = compute_lps(pattern)
+        self._binary = None  # str 模式的 UTF-8 版本及其 LPS，第一次需要時建立
 
     def compute_lps(self) -> list[int]:
-        """計算最長相同前後綴數組（Longest Proper Prefix which is also Suffix）
+        """返回模式的 LPS 數組（已在初始化時計算）
 
         Returns:
             list[int]: LPS 數組
         """
-        lps = [0] * self.pattern_length
-        length = 0  # 前一個最長相同前後綴的長度
-        i = 1
-
-        while i < self.pattern_length:
-            if self.pattern[i] == self.pattern[length]:
-                length += 1
-                lps[i] = length
-                i += 1
-            else:
-                if length != 0:
-                    length = lps[length - 1]
-                else:
-                    lps[i] = 0
-                    i += 1
-
-        return lps
-
-    def search(self, text: str) -> list[int]:
-        """在文本中搜尋模式字串
+        return self.lps.tolist()
 
-        Args:
-            text: 要被搜尋的文本
+    def _prepared(self, text: Text) -> Tuple[Sequence, array]:
+        """返回與文本型別相符的模式及其 LPS 數組
 
-        Returns:
-            list[int]: 所有匹配的起始位置列表
+        Raises:
+            TypeError: 以二進位模式搜尋 str 文本時
         """
-        matches = []
-        N = len(text)
-        M = self.pattern_length
+        if not is_binary(text):
+            if not isinstance(self.pattern, str):
+                raise TypeError("二進位模式只能搜尋二進位文本")
+            return self.pattern, self.lps
+        if not isinstance(self.pattern, str):
+            return self.pattern, self.lps
+        if self._binary is None:
+            encoded = binary_pattern(self.pattern)
+            self._binary = (encoded, compute_lps(encoded))
+        return self._binary
 
-        if M > N:
-            return matches
+    def finditer(self, text: Text) -> Iterator[int]:
+        """逐一產生匹配的起始位置，不建立完整的列表
 
-        lps = self.compute_lps()
+        Args:
+            text: 要被搜尋的文本，str、bytes、bytearray、memoryview 或 mmap；
+                二進位文本不會被複製，位置以位元組計
 
-        i = 0  # text 的索引
-        j = 0  # pattern 的索引
+        Yields:
+            int: 匹配的起始位置
+        """
+        pattern, lps = self._prepared(text)
+        M = len(pattern)
+        with open_text(text) as buffer:
+            j = 0  # 已匹配的模式長度
+            for i, char in enumerate(buffer):
+                while j and pattern[j] != char:
+                    j = lps[j - 1]
+                if pattern[j] == char:
+                    j += 1
+                    if j == M:
+                        yield i - M + 1
+                        j = lps[j - 1]
 
-        while i < N:
-            if self.pattern[j] == text[i]:
-                i += 1
-                j += 1
+    def search(self, text: Text) -> list[int]:
+        """在文本中搜尋模式字串
 
-                if j == M:
-                    matches.append(i - j)
-                    j = lps[j - 1]
-            else:
-                if j != 0:
-                    j = lps[j - 1]
-                else:
-                    i += 1
+        Args:
+            text: 要被搜尋的文本，型別同 finditer
 
-        return matches
+        Returns:
+            list[int]: 所有匹配的起始位置列表
+        """
+        return list(self.finditer(text))
@@ -1,57 +1,214 @@
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from mathalgo2.algorithm.string._buffer import (
+    Pattern,
+    Text,
+    binary_pattern,
+    code_points,
+    is_binary,
+    open_text,
+)
+
+# 61 位元的梅森質數 2^61 - 1；碰撞機率約為 M / q，驗證幾乎只發生在真正的匹配上
+MERSENNE_61 = (1 << 61) - 1
+
+
+def _hash(text: Sequence, d: int, q: int) -> int:
+    """計算字串或位元組的多項式雜湊值"""
+    value = 0
+    for code in code_points(text):
+        value = (value * d + code) % q
+    return value
+
+
 class RabinKarp:
-    def __init__(self, pattern: str):
+    def __init__(self, pattern: Pattern):
         """初始化 Rabin-Karp 算法
 
+        模式的雜湊值與滾動所需的 d^M mod q 只在此計算一次。
+
         Args:
-            pattern: 要搜尋的模式字串
+            pattern: 要搜尋的模式，str 或 bytes-like；str 模式搜尋二進位文本時
+                以 UTF-8 編碼比對
         """
         if not pattern:
             raise ValueError("Pattern cannot be empty")
 
+        if not isinstance(pattern, str):
+            pattern = binary_pattern(pattern)
         self.pattern = pattern
         self.pattern_length = len(pattern)
         self.d = 256  # 字符集大小
-        self.q = 101  # 一個質數
+        self.q = MERSENNE_61  # 一個大質數
+        self.dm = pow(self.d, self.pattern_length, self.q)  # 移出窗口的字元的權重
+        self.pattern_hash = _hash(pattern, self.d, self.q)
+        self._binary = None  # str 模式的 UTF-8 版本及其雜湊常數，第一次需要時建立
+
+    def _prepared(self, text: Text) -> Tuple[Sequence, int, int]:
+        """返回與文本型別相符的 (模式, 模式雜湊值, d^M mod q)
+
+        Raises:
+            TypeError: 以二進位模式搜尋 str 文本時
+        """
+        native = (self.pattern, self.pattern_hash, self.dm)
+        if not is_binary(text):
+            if not isinstance(self.pattern, str):
+                raise TypeError("二進位模式只能搜尋二進位文本")
+            return native
+        if not isinstance(self.pattern, str):
+            return native
+        if self._binary is None:
+            encoded = binary_pattern(self.pattern)
+            self._binary = (
+                encoded,
+                _hash(encoded, self.d, self.q),
+                pow(self.d, len(encoded), self.q),
+            )
+        return self._binary
 
-    def search(self, text: str) -> list[int]:
+    def finditer(self, text: Text) -> Iterator[int]:
+        """逐一產生匹配的起始位置，不建立完整的列表
+
+        Args:
+            text: 要被搜尋的文本，str、bytes、bytearray、memoryview 或 mmap；
+                二進位文本不會被複製，位置以位元組計
+
+        Yields:
+            int: 匹配的起始位置
+        """
+        pattern, pattern_hash, dm = self._prepared(text)
+        d, q = self.d, self.q
+        M = len(pattern)
+        with open_text(text) as buffer:
+            N = len(buffer)
+            if M > N:
+                return
+            text_hash = _hash(buffer[:M], d, q)
+
+            # 滑動窗口: 同時迭代移出與移入窗口的字元
+            outgoing = code_points(buffer)
+            incoming = code_points(buffer[M:])
+            for i, (old, new) in enumerate(zip(outgoing, incoming)):
+                # 雜湊值相同時，進行字符比對
+                if text_hash == pattern_hash and buffer[i : i + M] == pattern:
+                    yield i
+                # 計算下一個窗口的雜湊值（Python 的 % 總是返回非負數）
+                text_hash = (text_hash * d - old * dm + new) % q
+
+            if text_hash == pattern_hash and buffer[N - M :] == pattern:
+                yield N - M
+
+    def search(self, text: Text) -> list[int]:
         """在文本中搜尋模式字串
 
         Args:
-            text: 要被搜尋的文本
+            text: 要被搜尋的文本，型別同 finditer
 
         Returns:
             list[int]: 所有匹配的起始位置列表
         """
-        matches = []
-        N = len(text)
-        M = self.pattern_length
+        return list(self.finditer(text))
 
-        if M > N:
-            return matches
 
-        # 計算模式字串的雜湊值
-        pattern_hash = 0
-        text_hash = 0
-        h = pow(self.d, M - 1) % self.q
+class MultiRabinKarp:
+    def __init__(self, patterns: Sequence[Pattern]):
+        """初始化多模式 Rabin-Karp 算法
 
-        # 計算第一個窗口的雜湊值
-        for i in range(M):
-            pattern_hash = (self.d * pattern_hash + ord(self.pattern[i])) % self.q
-            text_hash = (self.d * text_hash + ord(text[i])) % self.q
+        模式依長度分組，每組以 雜湊值 -> 模式編號 的字典儲存，
+        因此每種長度只需一次滾動掃描即可同時比對該組的所有模式。
 
-        # 滑動窗口
-        for i in range(N - M + 1):
-            if pattern_hash == text_hash:
-                # 雜湊值相同時，進行字符比對
-                if text[i : i + M] == self.pattern:
-                    matches.append(i)
+        Args:
+            patterns: 模式的序列，模式編號為其索引；必須全為 str 或全為 bytes-like
+
+        Raises:
+            ValueError: 沒有模式或包含空模式時
+            TypeError: str 與二進位模式混用時
+        """
+        if not patterns:
+            raise ValueError("Patterns cannot be empty")
+        if any(not pattern for pattern in patterns):
+            raise ValueError("Pattern cannot be empty")
+        kinds = {isinstance(pattern, str) for pattern in patterns}
+        if len(kinds) > 1:
+            raise TypeError("模式必須全為 str 或全為二進位")
+
+        self._is_str = kinds.pop()
+        self.patterns = [
+            pattern if self._is_str else binary_pattern(pattern) for pattern in patterns
+        ]
+        self.d = 256
+        self.q = MERSENNE_61
+        # 長度 -> (d^M mod q, 雜湊值 -> 模式編號列表)
+        self.groups = self._build_groups(self.patterns)
+        self._binary = None  # str 模式的 UTF-8 版本及其分組，第一次需要時建立
+
+    def _build_groups(
+        self, patterns: List[Sequence]
+    ) -> Dict[int, Tuple[int, Dict[int, List[int]]]]:
+        """把模式依長度分組並計算雜湊值"""
+        groups: Dict[int, Tuple[int, Dict[int, List[int]]]] = {}
+        for pattern_id, pattern in enumerate(patterns):
+            M = len(pattern)
+            if M not in groups:
+                groups[M] = (pow(self.d, M, self.q), {})
+            table = groups[M][1]
+            table.setdefault(_hash(pattern, self.d, self.q), []).append(pattern_id)
+        return groups
+
+    def _prepared(self, text: Text) -> Tuple[List[Sequence], Dict]:
+        """返回與文本型別相符的 (模式列表, 分組)
+
+        Raises:
+            TypeError: 以二進位模式搜尋 str 文本時
+        """
+        if not is_binary(text):
+            if not self._is_str:
+                raise TypeError("二進位模式只能搜尋二進位文本")
+            return self.patterns, self.groups
+        if not self._is_str:
+            return self.patterns, self.groups
+        if self._binary is None:
+            encoded = [binary_pattern(pattern) for pattern in self.patterns]
+            self._binary = (encoded, self._build_groups(encoded))
+        return self._binary
+
+    def search(self, text: Text) -> list[Tuple[int, int]]:
+        """在文本中搜尋所有模式
+
+        Args:
+            text: 要被搜尋的文本，str 或二進位緩衝區（不會被複製）
+
+        Returns:
+            list[tuple[int, int]]: 依位置排序的 (起始位置, 模式編號) 列表
+        """
+        matches = []
+        d, q = self.d, self.q
+        patterns, groups = self._prepared(text)
+
+        with open_text(text) as buffer:
+            N = len(buffer)
+
+            def verify(i: int, M: int, candidates: List[int]):
+                """雜湊值相同時逐一比對候選模式"""
+                window = buffer[i : i + M]
+                matches.extend(
+                    (i, pattern_id)
+                    for pattern_id in candidates
+                    if patterns[pattern_id] == window
+                )
 
-            # 計算下一個窗口的雜湊值
-            if i < N - M:
-                text_hash = (
-                    self.d * (text_hash - ord(text[i]) * h) + ord(text[i + M])
-                ) % self.q
-                if text_hash < 0:
-                    text_hash += self.q
+            for M, (dm, table) in groups.items():
+                if M > N:
+                    continue
+                text_hash = _hash(buffer[:M], d, q)
+                outgoing = code_points(buffer)
+                incoming = code_points(buffer[M:])
+                for i, (old, new) in enumerate(zip(outgoing, incoming)):
+                    if text_hash in table:
+                        verify(i, M, table[text_hash])
+                    text_hash = (text_hash * d - old * dm + new) % q
+                if text_hash in table:
+                    verify(N - M, M, table[text_hash])
 
+        matches.sort()
         return matches
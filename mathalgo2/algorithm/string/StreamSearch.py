@@ -0,0 +1,152 @@
+from typing import IO, Iterable, Iterator, Optional, Sequence, Tuple
+
+from mathalgo2.algorithm.string._buffer import Pattern, Text, is_binary, open_text
+from mathalgo2.algorithm.string.AhoCorasick import AhoCorasick
+from mathalgo2.algorithm.string.KMP import KMP
+
+
+def read_chunks(source: IO, chunk_size: int = 1 << 20) -> Iterator[Text]:
+    """以固定大小逐塊讀取檔案物件，socket 可先以 sock.makefile("rb") 包裝
+
+    Args:
+        source: 具有 read(size) 方法的檔案物件（二進位或文字模式）
+        chunk_size: 每塊的大小（位元組或字元數）
+
+    Yields:
+        每次 read 得到的非空區塊
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size 必須是正數")
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+class _Stream:
+    """串流比對的共用狀態: 已處理的長度與第一個區塊決定的文本型別"""
+
+    def __init__(self):
+        self.offset = 0  # 已處理的字元（或位元組）總數
+        self._binary: Optional[bool] = None
+
+    def _check_kind(self, chunk: Text):
+        """所有區塊必須同為 str 或同為二進位，位置才有一致的單位
+
+        Raises:
+            TypeError: 區塊型別與先前的區塊不同時
+        """
+        binary = is_binary(chunk)
+        if self._binary is None:
+            self._binary = binary
+        elif self._binary != binary:
+            raise TypeError("串流中的區塊必須全為 str 或全為二進位")
+
+    def reset(self):
+        """回到串流起點"""
+        self.offset = 0
+        self._binary = None
+
+
+class KMPStream(_Stream):
+    def __init__(self, pattern: Pattern):
+        """以 KMP 自動機做跨區塊的串流搜尋
+
+        只保存目前已匹配的模式長度，記憶體為 O(M)，與輸入大小無關；
+        跨越區塊邊界的匹配同樣會被找到，位置為整個串流中的絕對位置。
+
+        Args:
+            pattern: 要搜尋的模式，型別規則同 KMP
+        """
+        super().__init__()
+        self.kmp = KMP(pattern)
+        self.state = 0  # 已匹配的模式長度
+
+    def feed(self, chunk: Text) -> list[int]:
+        """處理下一個區塊
+
+        Args:
+            chunk: str 或二進位緩衝區，型別必須與先前的區塊相同
+
+        Returns:
+            list[int]: 在此區塊中結束的匹配的絕對起始位置
+        """
+        self._check_kind(chunk)
+        pattern, lps = self.kmp._prepared(chunk)
+        M = len(pattern)
+        base = self.offset - M + 1
+        matches = []
+        j = self.state
+        with open_text(chunk) as buffer:
+            for i, char in enumerate(buffer):
+                while j and pattern[j] != char:
+                    j = lps[j - 1]
+                if pattern[j] == char:
+                    j += 1
+                    if j == M:
+                        matches.append(base + i)
+                        j = lps[j - 1]
+            self.offset += len(buffer)
+        self.state = j
+        return matches
+
+    def finditer(self, chunks: Iterable[Text]) -> Iterator[int]:
+        """依序處理所有區塊，逐一產生匹配的絕對起始位置"""
+        for chunk in chunks:
+            yield from self.feed(chunk)
+
+    def reset(self):
+        """回到串流起點"""
+        super().reset()
+        self.state = 0
+
+
+class AhoCorasickStream(_Stream):
+    def __init__(self, patterns: Sequence[Pattern]):
+        """以 Aho-Corasick 自動機做跨區塊的多模式串流搜尋
+
+        只保存自動機的目前狀態，記憶體為 O(模式總長)，與輸入大小無關。
+
+        Args:
+            patterns: 模式的序列，型別規則同 AhoCorasick
+        """
+        super().__init__()
+        self.automaton = AhoCorasick(patterns)
+        self.state = 0  # 自動機的目前狀態
+
+    def feed(self, chunk: Text) -> list[Tuple[int, int]]:
+        """處理下一個區塊
+
+        Args:
+            chunk: str 或二進位緩衝區，型別必須與先前的區塊相同
+
+        Returns:
+            list[tuple[int, int]]: 在此區塊中結束的匹配的 (絕對起始位置, 模式編號)
+        """
+        self._check_kind(chunk)
+        automaton = self.automaton._prepared(chunk)
+        lengths = automaton.pattern_lengths
+        base = self.offset + 1
+        with open_text(chunk) as buffer:
+
+            def scan() -> Iterator[Tuple[int, int]]:
+                """掃描區塊，結束時保存自動機的狀態"""
+                self.state = yield from automaton._scan(buffer, self.state)
+
+            matches = [
+                (base + end - lengths[pattern_id], pattern_id)
+                for end, pattern_id in scan()
+            ]
+            self.offset += len(buffer)
+        return matches
+
+    def finditer(self, chunks: Iterable[Text]) -> Iterator[Tuple[int, int]]:
+        """依序處理所有區塊，逐一產生 (絕對起始位置, 模式編號)"""
+        for chunk in chunks:
+            yield from self.feed(chunk)
+
+    def reset(self):
+        """回到串流起點"""
+        super().reset()
+        self.state = 0
@@ -0,0 +1,200 @@
+from pathlib import Path
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from mathalgo2.algorithm.string._buffer import Pattern, binary_pattern
+
+PathLike = Union[str, Path]
+
+
+def _codes(text: Union[str, bytes]) -> np.ndarray:
+    """文本的整數碼位陣列: str 為 UTF-32 碼位，bytes 為位元組值"""
+    if isinstance(text, str):
+        return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+    return np.frombuffer(text, dtype=np.uint8)
+
+
+def _dense_ranks(keys: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """依排列 order 排序後的鍵值給定從 1 開始的稠密名次（相等的鍵名次相同）"""
+    sorted_keys = keys[order]
+    boundaries = np.empty(len(keys), dtype=np.int64)
+    boundaries[0] = 1
+    np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=boundaries[1:])
+    ranks = np.empty(len(keys), dtype=np.int64)
+    ranks[order] = np.cumsum(boundaries)
+    return ranks
+
+
+def build_suffix_array(codes: np.ndarray) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """以倍增法 (prefix doubling) 建立後綴數組
+
+    第 k 輪時每個後綴的名次代表其長度 2^k 的前綴，以
+    (rank[i], rank[i + 2^k]) 組成的 int64 鍵值排序後得到長度 2^(k+1) 的名次；
+    所有名次都不同時停止。輪數為 log2(最長重複子字串長度) + 1，
+    每輪一次 np.argsort，總時間 O(n log n · 輪數)。
+
+    Args:
+        codes: 文本的整數碼位
+
+    Returns:
+        (sa, levels): 後綴數組與每輪的名次（levels[k] 代表長度 2^k 的前綴），
+        供 LCP 計算使用
+    """
+    n = len(codes)
+    if n == 0:
+        return np.empty(0, dtype=np.int64), []
+    order = np.argsort(codes, kind="stable")
+    rank = _dense_ranks(codes, order)
+    levels = [rank.astype(np.int32 if n < 2**31 else np.int64)]
+    step = 1
+    while rank[order[-1]] < n:
+        # 超出文本的部分以 0 表示，比任何字元都小
+        second = np.zeros(n, dtype=np.int64)
+        second[: n - step] = rank[step:]
+        keys = rank * (n + 1) + second
+        order = np.argsort(keys)
+        rank = _dense_ranks(keys, order)
+        levels.append(rank.astype(levels[0].dtype))
+        step *= 2
+    return order.astype(np.int64), levels
+
+
+def lcp_from_levels(sa: np.ndarray, levels: List[np.ndarray]) -> np.ndarray:
+    """由倍增法各輪的名次向量化計算 LCP 數組
+
+    lcp[i] 為 sa[i - 1] 與 sa[i] 兩個後綴的最長共同前綴長度（lcp[0] = 0）。
+    對所有相鄰的後綴同時做二進位提升：由最長的 2^k 開始，若兩個後綴
+    從目前位置起長度 2^k 的前綴名次相同，就把共同前綴長度加上 2^k。
+    最後一輪的名次全部不同，因此 LCP 小於 2^(輪數-1)，只需檢查前面各輪。
+
+    Returns:
+        np.ndarray: int64 的 LCP 數組
+    """
+    n = len(sa)
+    lcp = np.zeros(n, dtype=np.int64)
+    if n < 2:
+        return lcp
+    left, right = sa[:-1], sa[1:]
+    common = np.zeros(n - 1, dtype=np.int64)
+    for k in range(len(levels) - 2, -1, -1):
+        a, b = left + common, right + common
+        valid = (a < n) & (b < n)
+        rank = levels[k]
+        same = valid & (rank[np.minimum(a, n - 1)] == rank[np.minimum(b, n - 1)])
+        common[same] += 1 << k
+    lcp[1:] = common
+    return lcp
+
+
+class SuffixArray:
+    def __init__(self, text: Union[str, bytes]):
+        """為固定的文本建立後綴數組與 LCP 數組，之後可以反覆查詢
+
+        Args:
+            text: 要建立索引的文本，str 或 bytes-like（位置以位元組計）
+        """
+        if not isinstance(text, str):
+            text = binary_pattern(text)
+        self.text = text
+        self.n = len(text)
+        self.sa, levels = build_suffix_array(_codes(text))
+        self.lcp = lcp_from_levels(self.sa, levels)
+
+    @classmethod
+    def _from_arrays(
+        cls, text: Union[str, bytes], sa: np.ndarray, lcp: np.ndarray
+    ) -> "SuffixArray":
+        """由已計算的陣列建立，不重新排序"""
+        index = cls.__new__(cls)
+        index.text = text
+        index.n = len(text)
+        index.sa = sa
+        index.lcp = lcp
+        return index
+
+    def _pattern(self, pattern: Pattern) -> Union[str, bytes]:
+        """轉換為與文本同型別的模式
+
+        Raises:
+            TypeError: 以二進位模式查詢 str 文本時
+        """
+        if isinstance(self.text, str):
+            if not isinstance(pattern, str):
+                raise TypeError("二進位模式只能查詢二進位文本")
+            return pattern
+        return binary_pattern(pattern)
+
+    def _range(self, pattern: Pattern) -> Tuple[int, int]:
+        """以模式為前綴的後綴在 sa 中的區間 [lo, hi)，兩次二分搜尋 O(m log n)"""
+        pattern = self._pattern(pattern)
+        m = len(pattern)
+        # memoryview 的索引直接得到 Python int，比 NumPy 純量快
+        text, sa = self.text, memoryview(self.sa)
+
+        lo, hi = 0, self.n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = sa[mid]
+            if text[start : start + m] < pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        first = lo
+
+        hi = self.n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = sa[mid]
+            if text[start : start + m] == pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        return first, lo
+
+    def count(self, pattern: Pattern) -> int:
+        """模式在文本中出現的次數（包含重疊）"""
+        lo, hi = self._range(pattern)
+        return hi - lo
+
+    def locate(self, pattern: Pattern) -> np.ndarray:
+        """模式所有出現的起始位置（升序）"""
+        lo, hi = self._range(pattern)
+        return np.sort(self.sa[lo:hi])
+
+    def contains(self, pattern: Pattern) -> bool:
+        """模式是否出現在文本中"""
+        return self.count(pattern) > 0
+
+    def longest_repeated_substring(self) -> Union[str, bytes]:
+        """出現至少兩次（可重疊）的最長子字串，沒有時返回空字串"""
+        if self.n < 2 or self.lcp.max() == 0:
+            return self.text[:0]
+        i = int(np.argmax(self.lcp))
+        start = int(self.sa[i])
+        return self.text[start : start + int(self.lcp[i])]
+
+    def distinct_substrings(self) -> int:
+        """不同的非空子字串數目: n(n+1)/2 - sum(lcp)"""
+        return self.n * (self.n + 1) // 2 - int(self.lcp.sum())
+
+    def save(self, path: PathLike):
+        """將文本、後綴數組與 LCP 數組存為 .npz 檔案"""
+        np.savez(
+            path,
+            codes=_codes(self.text),
+            is_str=np.bool_(isinstance(self.text, str)),
+            sa=self.sa,
+            lcp=self.lcp,
+        )
+
+    @classmethod
+    def load(cls, path: PathLike) -> "SuffixArray":
+        """從 save() 產生的檔案載入索引，不重新建立"""
+        with np.load(path, allow_pickle=False) as data:
+            codes = data["codes"]
+            if bool(data["is_str"]):
+                text = codes.astype("<u4").tobytes().decode("utf-32-le")
+            else:
+                text = codes.tobytes()
+            return cls._from_arrays(text, data["sa"], data["lcp"])
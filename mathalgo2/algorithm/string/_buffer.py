@@ -0,0 +1,56 @@
+"""字串演算法共用的輸入處理：讓 str 與二進位緩衝區使用同一套比對程式
+
+str 以字元比對；bytes、bytearray、memoryview 與 mmap 一律包成位元組格式
+的 memoryview，索引得到 int、切片不複製資料，因此可以直接搜尋大型的
+記憶體映射檔案。
+"""
+
+import mmap
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Union
+
+BINARY_TYPES = (bytes, bytearray, memoryview, mmap.mmap)
+
+Text = Union[str, bytes, bytearray, memoryview, mmap.mmap]
+Pattern = Union[str, bytes, bytearray, memoryview]
+
+
+def is_binary(data: Text) -> bool:
+    """是否為二進位緩衝區"""
+    return isinstance(data, BINARY_TYPES)
+
+
+@contextmanager
+def open_text(text: Text) -> Iterator[Union[str, memoryview]]:
+    """把文本轉為可索引的形式，離開時釋放建立的 memoryview
+
+    釋放 memoryview 後呼叫端才能關閉 mmap，否則 mmap.close() 會引發
+    BufferError。
+
+    Raises:
+        TypeError: 文本不是 str 或支援緩衝區協定的二進位型別時
+    """
+    if isinstance(text, str):
+        yield text
+        return
+    if not is_binary(text):
+        raise TypeError(f"不支援的文本型別: {type(text).__name__}")
+    view = memoryview(text)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    try:
+        yield view
+    finally:
+        view.release()
+
+
+def binary_pattern(pattern: Pattern) -> bytes:
+    """二進位文本使用的模式: str 以 UTF-8 編碼，其他轉為 bytes"""
+    if isinstance(pattern, str):
+        return pattern.encode("utf-8")
+    return bytes(pattern)
+
+
+def code_points(text: Union[str, memoryview]) -> Iterable[int]:
+    """逐一產生文本的整數碼位（str 為 ord，位元組直接是 int）"""
+    return map(ord, text) if isinstance(text, str) else text
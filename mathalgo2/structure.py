@@ -2,7 +2,7 @@
 import os
 from collections import deque
 from pathlib import Path
-from typing import Any, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Union
 
 from mathalgo2.Logger import Logger
 
@@ -779,15 +779,18 @@ class Graph:
     # 圖類別
 
     實現基本的圖操作，包含新增節點、新增邊、刪除節點、刪除邊等功能。
-    使用相鄰列表(adjacency list)表示法儲存圖結構。
+    使用相鄰集合表示法儲存有向加權圖：每個節點的出鄰居存放在
+    以鄰居為鍵、權重為值的字典中（保持插入順序），並另外維護入鄰居集合，
+    因此新增、刪除、查詢邊都是 O(1)，刪除節點是 O(度數)。
 
     ## 屬性
-    * `graph`: 儲存圖的相鄰列表字典，鍵為節點，值為相鄰節點列表
+    * `graph`: 儲存圖的相鄰字典，鍵為節點，值為 {相鄰節點: 權重}
     """
 
     def __init__(self):
         """初始化空圖"""
         self.graph = {}
+        self._predecessors = {}
         logger_manager.info("圖結構初始化成功")
 
     def add_vertex(self, vertex: Any) -> None:
@@ -798,16 +801,20 @@ def add_vertex(self, vertex: Any) -> None:
         * `vertex`: 要新增的節點值
         """
         if vertex not in self.graph:
-            self.graph[vertex] = []
+            self.graph[vertex] = {}
+            self._predecessors[vertex] = set()
             logger_manager.info(f"新增節點: {vertex}")
 
-    def add_edge(self, vertex1: Any, vertex2: Any) -> None:
+    def add_edge(self, vertex1: Any, vertex2: Any, weight: float = 1.0) -> None:
         """
         # 新增邊
 
+        邊已存在時更新其權重。
+
         ## 參數
         * `vertex1`: 第一個節點
         * `vertex2`: 第二個節點
+        * `weight`: 邊的權重
         """
         if vertex1 not in self.graph:
             self.add_vertex(vertex1)
@@ -815,21 +822,25 @@ def add_edge(self, vertex1: Any, vertex2: Any) -> None:
             self.add_vertex(vertex2)
 
         if vertex2 not in self.graph[vertex1]:
-            self.graph[vertex1].append(vertex2)
+            self._predecessors[vertex2].add(vertex1)
             logger_manager.info(f"新增邊: {vertex1} -> {vertex2}")
+        self.graph[vertex1][vertex2] = weight
 
     def remove_vertex(self, vertex: Any) -> None:
         """
         # 刪除節點
 
+        只需走訪該節點的入鄰居與出鄰居，時間複雜度為 O(度數)。
+
         ## 參數
         * `vertex`: 要刪除的節點
         """
         if vertex in self.graph:
-            del self.graph[vertex]
-            for v in self.graph:
-                if vertex in self.graph[v]:
-                    self.graph[v].remove(vertex)
+            for predecessor in self._predecessors.pop(vertex):
+                del self.graph[predecessor][vertex]
+            for successor in self.graph.pop(vertex):
+                if successor != vertex:
+                    self._predecessors[successor].discard(vertex)
             logger_manager.info(f"刪除節點: {vertex}")
 
     def remove_edge(self, vertex1: Any, vertex2: Any) -> None:
@@ -841,9 +852,69 @@ def remove_edge(self, vertex1: Any, vertex2: Any) -> None:
         * `vertex2`: 第二個節點
         """
         if vertex1 in self.graph and vertex2 in self.graph[vertex1]:
-            self.graph[vertex1].remove(vertex2)
+            del self.graph[vertex1][vertex2]
+            self._predecessors[vertex2].discard(vertex1)
             logger_manager.info(f"刪除邊: {vertex1} -> {vertex2}")
 
+    def has_edge(self, vertex1: Any, vertex2: Any) -> bool:
+        """
+        # 判斷邊是否存在
+
+        ## 參數
+        * `vertex1`: 第一個節點
+        * `vertex2`: 第二個節點
+        """
+        return vertex1 in self.graph and vertex2 in self.graph[vertex1]
+
+    def weight(self, vertex1: Any, vertex2: Any) -> float:
+        """
+        # 取得邊的權重
+
+        ## 參數
+        * `vertex1`: 第一個節點
+        * `vertex2`: 第二個節點
+
+        ## 異常
+        * `KeyError`: 邊不存在時
+        """
+        return self.graph[vertex1][vertex2]
+
+    def successors(self, vertex: Any) -> Dict[Any, float]:
+        """
+        # 取得出鄰居
+
+        ## 返回
+        * `{相鄰節點: 權重}` 字典（唯讀使用）
+        """
+        return self.graph[vertex]
+
+    def predecessors(self, vertex: Any) -> Set[Any]:
+        """
+        # 取得入鄰居
+
+        ## 返回
+        * 有邊指向 `vertex` 的節點集合（唯讀使用）
+        """
+        return self._predecessors[vertex]
+
+    def to_csr(self):
+        """
+        # 轉換為 CSR 表示
+
+        供 mathalgo2.algorithm.graph 中的連通分量、拓撲排序等演算法使用。
+
+        ## 返回
+        * `CSRGraph`: 以整數編號表示的有向加權圖，節點標籤為原本的節點值
+        """
+        from mathalgo2.algorithm.graph.csr import CSRGraph
+
+        weights = {
+            (u, v): w
+            for u, neighbors in self.graph.items()
+            for v, w in neighbors.items()
+        }
+        return CSRGraph.from_dict(self.graph, weights)
+
     def visualize(self) -> None:
         """
         視覺化圖結構
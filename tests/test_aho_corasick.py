@@ -0,0 +1,117 @@
+import mmap
+import random
+
+import pytest
+
+from mathalgo2.algorithm.string import AhoCorasick as ac_module
+from mathalgo2.algorithm.string.AhoCorasick import AhoCorasick
+
+
+def brute_force(text, patterns):
+    """逐一比對每個模式的參考答案"""
+    return sorted(
+        (i, pattern_id)
+        for pattern_id, pattern in enumerate(patterns)
+        for i in range(len(text) - len(pattern) + 1)
+        if text[i : i + len(pattern)] == pattern
+    )
+
+
+class TestAhoCorasick:
+    def test_initialization(self):
+        """測試初始化與壓縮後的字母表"""
+        ac = AhoCorasick(["he", "she", "his", "hers"])
+        assert ac.patterns == ["he", "she", "his", "hers"]
+        assert ac.alphabet_size == 5
+        assert ac.num_states == 10
+
+        with pytest.raises(ValueError):
+            AhoCorasick([])
+        with pytest.raises(ValueError):
+            AhoCorasick(["ok", ""])
+
+    def test_classic_example(self):
+        """測試經典範例: 輸出連結與重疊匹配"""
+        ac = AhoCorasick(["he", "she", "his", "hers"])
+        assert ac.search("ushers") == [(1, 1), (2, 0), (2, 3)]
+
+    def test_nested_and_duplicate_patterns(self):
+        """測試互為子字串與重複的模式"""
+        ac = AhoCorasick(["a", "aa", "aaa", "aa"])
+        assert sorted(ac.search("aaa")) == brute_force("aaa", ["a", "aa", "aaa", "aa"])
+
+    def test_no_match(self):
+        """測試無匹配與空文本"""
+        ac = AhoCorasick(["xyz", "abc"])
+        assert ac.search("this is a test string") == []
+        assert ac.search("") == []
+
+    def test_finditer_is_lazy(self):
+        """測試 finditer 逐一產生匹配"""
+        ac = AhoCorasick(["ab"])
+        matches = ac.finditer("ab" * 1000)
+        assert next(matches) == (0, 0)
+        assert next(matches) == (2, 0)
+
+    def test_unicode_and_bytes(self):
+        """測試 Unicode 字元與 bytes 輸入"""
+        ac = AhoCorasick(["測試", "字串"])
+        assert ac.search("這是一個測試字串") == [(4, 0), (6, 1)]
+        ac = AhoCorasick([b"\x00\xff", b"GET"])
+        assert ac.search(b"GET /\x00\xff") == [(0, 1), (5, 0)]
+
+    def test_binary_buffers_and_type_check(self):
+        """測試 mmap 等二進位緩衝區，以及模式與文本型別不符"""
+        ac = AhoCorasick([b"ERR", bytearray(b"WARN")])
+        data = bytearray(b"..ERR..WARN")
+        assert ac.search(memoryview(data)) == [(2, 0), (7, 1)]
+        with mmap.mmap(-1, len(data)) as mapped:
+            mapped.write(bytes(data))
+            assert ac.search(mapped) == [(2, 0), (7, 1)]
+        with pytest.raises(TypeError):
+            ac.search("..ERR")
+
+    def test_str_patterns_on_binary_text(self):
+        """測試 str 模式以 UTF-8 編碼搜尋二進位文本，位置以位元組計"""
+        ac = AhoCorasick(["測試", "ok"])
+        data = "ok 測試 ok".encode("utf-8")
+        assert ac.search(data) == [(0, 1), (3, 0), (10, 1)]
+        with mmap.mmap(-1, len(data)) as mapped:
+            mapped.write(data)
+            assert ac.search(mapped) == [(0, 1), (3, 0), (10, 1)]
+        # str 文本仍以字元計
+        assert ac.search("ok 測試 ok") == [(0, 1), (3, 0), (6, 1)]
+        with pytest.raises(TypeError):
+            AhoCorasick(["ERR", b"WARN"])
+
+    @pytest.mark.parametrize("dense", [True, False])
+    def test_random_against_brute_force(self, dense, monkeypatch):
+        """測試隨機模式與文本的結果與逐一比對一致（稠密 DFA 與稀疏字典樹）"""
+        if not dense:
+            monkeypatch.setattr(ac_module, "_DENSE_MAX_ENTRIES", 0)
+        assert AhoCorasick(["ab"]).dense == dense
+        rng = random.Random(7)
+        for _ in range(200):
+            patterns = [
+                "".join(rng.choice("abc") for _ in range(rng.randint(1, 5)))
+                for _ in range(rng.randint(1, 10))
+            ]
+            text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 80)))
+            assert sorted(AhoCorasick(patterns).search(text)) == brute_force(
+                text, patterns
+            )
+
+    def test_large_alphabet_uses_sparse_trie(self):
+        """測試大字母表不展開稠密轉移表，記憶體只與狀態數成正比"""
+        rng = random.Random(11)
+        patterns = [
+            "".join(chr(rng.randint(0x4E00, 0x9FFF)) for _ in range(10))
+            for _ in range(2000)
+        ]
+        ac = AhoCorasick(patterns)
+        assert not ac.dense and ac.alphabet_size > 5000
+        assert len(ac._child_code) == ac.num_states - 1
+        text = "前" + patterns[5] + patterns[1999][:9] + patterns[1999]
+        assert ac.search(text) == [(1, 5), (20, 1999)]
+        # 位元組模式的字母表最多 256 個符號，展開為稠密 DFA
+        assert AhoCorasick([b"GET", b"POST"]).dense
@@ -0,0 +1,794 @@
+import numpy as np
+import pytest
+
+from mathalgo2.algorithm.graph import (
+    CSRGraph,
+    DynamicSSSP,
+    LandmarkIndex,
+    astar,
+    betweenness_centrality,
+    bfs,
+    bfs_levels,
+    closeness_centrality,
+    connected_components,
+    degree_centrality,
+    delta_stepping,
+    dfs,
+    dijkstra,
+    distance_matrix,
+    floyd_warshall,
+    johnson,
+    load_binary,
+    load_graph,
+    minimum_spanning_tree,
+    multi_source_dijkstra,
+    pagerank,
+    parallel,
+    parallel_bfs,
+    read_edge_list,
+    read_matrix_market,
+    save_binary,
+    strongly_connected_components,
+    topological_sort,
+    write_edge_list,
+    write_matrix_market,
+)
+from mathalgo2.algorithm.graph.paths import (
+    bidirectional_dijkstra,
+    reconstruct_path,
+    shortest_path,
+)
+from mathalgo2.algorithm.GraphAlgo import GraphAlgo
+from mathalgo2.structure import Graph
+
+
+@pytest.fixture
+def simple_graph():
+    """創建一個簡單的測試圖"""
+    graph = {"A": ["B", "C"], "B": ["A", "D"], "C": ["A", "D"], "D": ["B", "C"]}
+    weights = {("A", "B"): 1.0, ("A", "C"): 2.0, ("B", "D"): 3.0, ("C", "D"): 1.0}
+    return graph, weights
+
+
+class TestCSRGraph:
+    def test_from_dict(self, simple_graph):
+        """測試從鄰接表建立 CSR 圖"""
+        graph, weights = simple_graph
+        csr = CSRGraph.from_dict(graph, weights)
+        assert csr.num_nodes == 4
+        assert csr.num_edges == 8
+        assert csr.labels == ["A", "B", "C", "D"]
+        b = csr.node_id("B")
+        assert csr.to_labels(csr.neighbors(b)) == ["A", "D"]
+        # 權重以 (v, u) 反向查詢
+        assert csr.edge_weights(b).tolist() == [1.0, 3.0]
+
+    def test_from_edges(self):
+        """測試從整數邊列表建立 CSR 圖"""
+        csr = CSRGraph.from_edges([2, 0, 0, 1], [0, 1, 2, 2], [5.0, 1.0, 2.0, 3.0])
+        assert csr.indptr.tolist() == [0, 2, 3, 4]
+        assert csr.indices.tolist() == [1, 2, 2, 0]
+        assert csr.weights.tolist() == [1.0, 2.0, 3.0, 5.0]
+        assert csr.labels is None
+        assert csr.in_degree().tolist() == [1, 1, 2]
+
+    def test_from_labelled_edges(self):
+        """測試標籤邊列表與無向圖"""
+        csr = CSRGraph.from_edges(["x", "y"], ["y", "z"], directed=False)
+        assert csr.labels == ["x", "y", "z"]
+        assert csr.num_edges == 4
+        assert sorted(csr.to_labels(csr.neighbors(csr.node_id("y")))) == ["x", "z"]
+
+    def test_reverse_and_round_trip(self, simple_graph):
+        """測試反向圖與轉回鄰接表"""
+        graph, weights = simple_graph
+        csr = CSRGraph.from_dict({"A": ["B"], "B": ["C"], "C": []})
+        rev = csr.reverse()
+        assert rev.to_labels(rev.neighbors(rev.node_id("C"))) == ["B"]
+        assert rev.reverse() is csr
+
+        back, back_weights = CSRGraph.from_dict(graph, weights).to_dict()
+        assert back == graph
+        assert back_weights[("D", "B")] == 3.0
+
+    def test_unknown_node(self, simple_graph):
+        """測試不存在的節點"""
+        csr = CSRGraph.from_dict(simple_graph[0])
+        with pytest.raises(KeyError):
+            csr.node_id("X")
+
+    def test_traversals_match_graph_algo(self, simple_graph):
+        """測試 CSR 上的遍歷與 GraphAlgo 結果一致"""
+        graph, weights = simple_graph
+        algo = GraphAlgo(graph, weights, animation_speed=0)
+        csr = algo.to_csr()
+        assert csr.bfs("A") == algo.bfs("A")
+        assert csr.dfs("A") == algo.dfs("A")
+
+        distances, predecessors = dijkstra(csr, csr.node_id("A"))
+        expected, _ = algo.dijkstra("A")
+        assert dict(zip(csr.labels, distances.tolist())) == expected
+        assert predecessors[csr.node_id("A")] == -1
+
+    def test_deep_chain(self):
+        """測試長鏈不受遞迴深度限制"""
+        n = 5000
+        csr = CSRGraph.from_edges(np.arange(n - 1), np.arange(1, n))
+        assert dfs(csr, 0).tolist() == list(range(n))
+        assert bfs(csr, 0).tolist() == list(range(n))
+
+    def test_bfs_levels(self):
+        """測試分層 BFS 的層數與不可達節點"""
+        csr = CSRGraph.from_edges([0, 0, 1, 2, 3, 5], [1, 2, 3, 3, 4, 0])
+        assert bfs_levels(csr, 0).tolist() == [0, 1, 1, 2, 3, -1]
+        assert bfs_levels(csr, [1, 2]).tolist() == [-1, 0, 0, 1, 2, -1]
+
+        k = 40
+        idx = np.arange(k * k).reshape(k, k)
+        src = np.concatenate([idx[:, :-1].ravel(), idx[:-1, :].ravel()])
+        dst = np.concatenate([idx[:, 1:].ravel(), idx[1:, :].ravel()])
+        grid = CSRGraph.from_edges(src, dst, directed=False)
+        depth = bfs_levels(grid, 0)
+        rows, cols = np.divmod(np.arange(k * k), k)
+        assert np.array_equal(depth, rows + cols)
+        assert depth[bfs(grid, 0)].tolist() == sorted(depth.tolist())
+
+    def test_graph_algo_deep_traversals(self):
+        """測試 GraphAlgo 的遍歷在長鏈上不會超過遞迴深度"""
+        n = 5000
+        graph = {i: [i + 1] for i in range(n - 1)}
+        graph[n - 1] = []
+        algo = GraphAlgo(graph, animation_speed=0)
+        assert algo.dfs(0) == list(range(n))
+        assert algo.bfs(0) == list(range(n))
+        levels = algo.bfs_levels(0)
+        assert levels[n - 1] == n - 1 and len(levels) == n
+
+
+class TestShortestPath:
+    @pytest.fixture
+    def random_graph(self):
+        """建立隨機有向加權圖"""
+        rng = np.random.default_rng(42)
+        n, m = 300, 1500
+        return CSRGraph.from_edges(
+            rng.integers(0, n, m), rng.integers(0, n, m), rng.random(m) * 10, n
+        )
+
+    def test_early_exit_targets(self, random_graph):
+        """測試指定目標時提前結束且距離正確"""
+        full, _ = dijkstra(random_graph, 0)
+        targets = [5, 17, 99]
+        partial, pred = dijkstra(random_graph, 0, targets=targets)
+        assert np.allclose(partial[targets], full[targets])
+
+    def test_bidirectional_matches_dijkstra(self, random_graph):
+        """測試雙向搜尋與單向結果一致"""
+        full, _ = dijkstra(random_graph, 3)
+        for target in range(0, 300, 7):
+            distance, path = bidirectional_dijkstra(random_graph, 3, target)
+            assert distance == pytest.approx(full[target])
+            if np.isfinite(distance):
+                assert path[0] == 3 and path[-1] == target
+                steps = [
+                    random_graph.edge_weights(u)[random_graph.neighbors(u) == v].min()
+                    for u, v in zip(path[:-1], path[1:])
+                ]
+                assert sum(steps) == pytest.approx(distance)
+
+    def test_unreachable(self):
+        """測試不可達的目標"""
+        csr = CSRGraph.from_edges([0], [1], num_nodes=3)
+        for bidirectional in (False, True):
+            distance, path = shortest_path(csr, 0, 2, bidirectional=bidirectional)
+            assert distance == float("inf")
+            assert len(path) == 0
+        assert reconstruct_path(dijkstra(csr, 0)[1], 0, 1).tolist() == [0, 1]
+
+    def test_graph_algo_fast_path(self, simple_graph):
+        """測試 GraphAlgo 的非視覺化最短路徑"""
+        graph, weights = simple_graph
+        algo = GraphAlgo(graph, weights, animation_speed=0)
+        for bidirectional in (False, True):
+            path, distance = algo.fast_shortest_path("A", "D", bidirectional)
+            assert distance == 3.0
+            assert path[0] == "A" and path[-1] == "D"
+        assert algo.colors == {}
+        assert algo.get_shortest_path("A", "D")[1] == 3.0
+        with pytest.raises(KeyError):
+            algo.fast_shortest_path("A", "X")
+
+
+class TestAllPairs:
+    @pytest.fixture
+    def random_graph(self):
+        """建立隨機有向加權圖"""
+        rng = np.random.default_rng(7)
+        n, m = 60, 300
+        return CSRGraph.from_edges(
+            rng.integers(0, n, m), rng.integers(0, n, m), rng.random(m) * 5, n
+        )
+
+    def test_distance_matrix(self, random_graph):
+        """測試進程池計算的距離表與逐一 Dijkstra 一致"""
+        sources = [0, 5, 9, 13, 21]
+        targets = [1, 2, 3, 40, 59]
+        expected = np.array([dijkstra(random_graph, s)[0][targets] for s in sources])
+        serial = distance_matrix(random_graph, sources, targets, workers=0)
+        parallel = distance_matrix(random_graph, sources, targets, workers=2)
+        assert np.array_equal(serial, expected)
+        assert np.array_equal(parallel, expected)
+
+    def test_multi_source(self, random_graph):
+        """測試多源 Dijkstra"""
+        sources = [0, 30]
+        dist, nearest = multi_source_dijkstra(random_graph, sources)
+        a, b = dijkstra(random_graph, 0)[0], dijkstra(random_graph, 30)[0]
+        assert np.allclose(dist, np.minimum(a, b))
+        reachable = np.isfinite(dist)
+        assert set(nearest[reachable].tolist()) <= {0, 30}
+        assert np.all(nearest[~reachable] == -1)
+
+    def test_floyd_warshall_and_johnson(self, random_graph):
+        """測試 Floyd–Warshall 與 Johnson 的全點對結果"""
+        expected = distance_matrix(random_graph, range(60), workers=0)
+        assert np.allclose(floyd_warshall(random_graph), expected)
+        assert np.allclose(johnson(random_graph), expected)
+
+    def test_negative_edges(self):
+        """測試負權重邊與負權重環"""
+        csr = CSRGraph.from_edges([0, 0, 1], [1, 2, 2], [4.0, 1.0, -5.0])
+        expected = floyd_warshall(csr)
+        assert expected[0, 2] == -1.0
+        assert np.allclose(johnson(csr), expected)
+
+        cycle = CSRGraph.from_edges([0, 1], [1, 0], [1.0, -2.0])
+        with pytest.raises(ValueError):
+            floyd_warshall(cycle)
+        with pytest.raises(ValueError):
+            johnson(cycle)
+
+    def test_graph_algo_distance_table(self, simple_graph):
+        """測試 GraphAlgo 的批次距離表"""
+        graph, weights = simple_graph
+        algo = GraphAlgo(graph, weights, animation_speed=0)
+        table = algo.distance_table(["A", "D"], ["B", "C"], workers=0)
+        assert table.tolist() == [[1.0, 2.0], [3.0, 1.0]]
+
+
+class TestAStar:
+    @pytest.fixture
+    def grid_graph(self):
+        """建立 30x30 的無向網格圖"""
+        k = 30
+        idx = np.arange(k * k).reshape(k, k)
+        src = np.concatenate([idx[:, :-1].ravel(), idx[:-1, :].ravel()])
+        dst = np.concatenate([idx[:, 1:].ravel(), idx[1:, :].ravel()])
+        rng = np.random.default_rng(3)
+        weights = rng.random(len(src)) + 1.0
+        return CSRGraph.from_edges(src, dst, weights, directed=False)
+
+    def test_alt_matches_dijkstra(self, grid_graph):
+        """測試 ALT 下界正確且擴展較少節點"""
+        index = LandmarkIndex.build(grid_graph, num_landmarks=4, seed=0)
+        full, _ = dijkstra(grid_graph, 0)
+        bounds = index.bounds(899)
+        target_dist = dijkstra(grid_graph, 899)[0]
+        assert np.all(bounds <= target_dist + 1e-9)
+
+        plain, alt = {}, {}
+        distance, _ = astar(grid_graph, 0, 899, stats=plain)
+        alt_distance, path = astar(
+            grid_graph, 0, 899, heuristic=index.heuristic(899), stats=alt
+        )
+        assert distance == pytest.approx(full[899])
+        assert alt_distance == pytest.approx(full[899])
+        assert path[0] == 0 and path[-1] == 899
+        assert alt["settled"] < plain["settled"]
+
+    def test_save_and_load(self, grid_graph, tmp_path):
+        """測試索引的保存與載入"""
+        index = LandmarkIndex.build(
+            grid_graph, num_landmarks=3, method="random", seed=1
+        )
+        path = tmp_path / "alt.npz"
+        index.save(path)
+        loaded = LandmarkIndex.load(path)
+        loaded.check_graph(grid_graph)
+        assert np.array_equal(loaded.landmarks, index.landmarks)
+        assert loaded.bound(5, 800) == index.bound(5, 800)
+        with pytest.raises(ValueError):
+            loaded.check_graph(CSRGraph.from_edges([0], [1]))
+
+    def test_graph_algo_astar(self, simple_graph):
+        """測試 GraphAlgo 的 A* 介面"""
+        graph, weights = simple_graph
+        algo = GraphAlgo(graph, weights, animation_speed=0)
+        path, distance = algo.astar("A", "D")
+        assert distance == 3.0
+        assert path[0] == "A" and path[-1] == "D"
+
+        index = LandmarkIndex.build(algo.to_csr(), num_landmarks=2, seed=0)
+        assert algo.astar("A", "D", heuristic=index)[1] == 3.0
+        assert algo.astar("A", "D", heuristic=lambda n, t: 0.5)[1] == 3.0
+        with pytest.raises(KeyError):
+            algo.astar("A", "X")
+
+
+class TestAnalytics:
+    @pytest.fixture
+    def random_graph(self):
+        """建立隨機有向加權圖（含多個分量）"""
+        rng = np.random.default_rng(11)
+        n, m = 200, 260
+        return CSRGraph.from_edges(
+            rng.integers(0, n, m), rng.integers(0, n, m), rng.random(m) * 10, n
+        )
+
+    def test_components_match_scipy(self, random_graph):
+        """測試連通分量與強連通分量與 scipy 結果一致"""
+        csgraph = pytest.importorskip("scipy.sparse.csgraph")
+        sparse = pytest.importorskip("scipy.sparse")
+        n = random_graph.num_nodes
+        matrix = sparse.csr_matrix(
+            (random_graph.weights, random_graph.indices, random_graph.indptr),
+            shape=(n, n),
+        )
+
+        def same_partition(a, b):
+            pairs = set(zip(a.tolist(), b.tolist()))
+            return len(pairs) == len(set(a.tolist())) == len(set(b.tolist()))
+
+        weak = connected_components(random_graph)
+        count, expected = csgraph.connected_components(matrix, connection="weak")
+        assert weak.max() + 1 == count
+        assert same_partition(weak, expected)
+
+        strong = strongly_connected_components(random_graph)
+        count, expected = csgraph.connected_components(matrix, connection="strong")
+        assert strong.max() + 1 == count
+        assert same_partition(strong, expected)
+        # 縮點後的邊只會從編號大的分量指向編號小的分量
+        src = strong[random_graph.sources()]
+        dst = strong[random_graph.indices]
+        assert np.all(src >= dst)
+
+    def test_topological_sort(self):
+        """測試拓撲排序與環的偵測"""
+        rng = np.random.default_rng(5)
+        n = 300
+        src = rng.integers(0, n, 1500)
+        dst = rng.integers(0, n, 1500)
+        # 只保留 src < dst 的邊以確保無環
+        src, dst = np.minimum(src, dst), np.maximum(src, dst)
+        keep = src != dst
+        dag = CSRGraph.from_edges(src[keep], dst[keep], num_nodes=n)
+        order = topological_sort(dag)
+        position = np.empty(n, dtype=np.int64)
+        position[order] = np.arange(n)
+        assert sorted(order.tolist()) == list(range(n))
+        assert np.all(position[src[keep]] < position[dst[keep]])
+
+        with pytest.raises(ValueError):
+            topological_sort(CSRGraph.from_edges([0, 1, 2], [1, 2, 0]))
+
+    def test_minimum_spanning_tree(self, random_graph):
+        """測試 Kruskal 與 Prim 的總權重與 scipy 一致"""
+        csgraph = pytest.importorskip("scipy.sparse.csgraph")
+        sparse = pytest.importorskip("scipy.sparse")
+        src, dst = random_graph.sources(), random_graph.indices
+        weights = random_graph.weights
+        n = random_graph.num_nodes
+        # scipy 以較小權重合併平行與反向邊
+        dense = np.full((n, n), np.inf)
+        np.minimum.at(dense, (src, dst), weights)
+        np.minimum.at(dense, (dst, src), weights)
+        np.fill_diagonal(dense, np.inf)
+        dense[np.isinf(dense)] = 0
+        expected = csgraph.minimum_spanning_tree(sparse.csr_matrix(dense)).sum()
+
+        forests = connected_components(random_graph).max() + 1
+        for method in ("kruskal", "prim"):
+            tree_src, tree_dst, tree_weights = minimum_spanning_tree(
+                random_graph, method
+            )
+            assert len(tree_src) == n - forests
+            assert tree_weights.sum() == pytest.approx(expected)
+            tree = CSRGraph.from_edges(tree_src, tree_dst, num_nodes=n)
+            assert connected_components(tree).max() + 1 == forests
+
+        with pytest.raises(ValueError):
+            minimum_spanning_tree(random_graph, "boruvka")
+
+    def test_graph_algo_analytics(self, simple_graph):
+        """測試 GraphAlgo 與 structure.Graph 的分析介面"""
+        graph, weights = simple_graph
+        algo = GraphAlgo(graph, weights, animation_speed=0)
+        assert algo.connected_components() == [["A", "B", "C", "D"]]
+        assert algo.strongly_connected_components() == [["A", "B", "C", "D"]]
+        edges, total = algo.minimum_spanning_tree()
+        assert total == 4.0 and len(edges) == 3
+        assert algo.minimum_spanning_tree("prim")[1] == 4.0
+        with pytest.raises(ValueError):
+            algo.topological_sort()
+
+        dag = Graph()
+        for u, v in [("shirt", "tie"), ("tie", "jacket"), ("pants", "shoes")]:
+            dag.add_edge(u, v)
+        dag.add_edge("pants", "belt")
+        algo = GraphAlgo(dag.graph, animation_speed=0)
+        order = algo.topological_sort()
+        assert order.index("shirt") < order.index("tie") < order.index("jacket")
+        assert order.index("pants") < order.index("shoes")
+        assert len(algo.connected_components()) == 2
+        assert len(algo.strongly_connected_components()) == 6
+        csr = dag.to_csr()
+        assert csr.num_nodes == 6 and csr.num_edges == 4
+
+
+class TestCentrality:
+    @pytest.fixture
+    def random_graph(self):
+        """建立隨機有向圖，權重為 1 到 3 的整數"""
+        rng = np.random.default_rng(1)
+        n, m = 60, 240
+        src, dst = rng.integers(0, n, m), rng.integers(0, n, m)
+        keep = src != dst
+        # 去除平行邊，與 networkx 的 DiGraph 一致
+        _, unique = np.unique(src[keep] * n + dst[keep], return_index=True)
+        src, dst = src[keep][unique], dst[keep][unique]
+        weights = rng.integers(1, 4, len(src)).astype(float)
+        return CSRGraph.from_edges(src, dst, weights, n)
+
+    def _to_networkx(self, graph):
+        nx = pytest.importorskip("networkx")
+        G = nx.DiGraph()
+        G.add_nodes_from(range(graph.num_nodes))
+        for u, v, w in zip(
+            graph.sources().tolist(), graph.indices.tolist(), graph.weights.tolist()
+        ):
+            G.add_edge(u, v, weight=w)
+        return nx, G
+
+    def _as_array(self, values, n):
+        return np.array([values[i] for i in range(n)])
+
+    def test_pagerank(self, random_graph):
+        """測試 PageRank 與個人化 PageRank 與 networkx 一致"""
+        nx, G = self._to_networkx(random_graph)
+        n = random_graph.num_nodes
+        ranks = pagerank(random_graph, tol=1e-13, max_iter=500)
+        assert ranks.sum() == pytest.approx(1.0)
+        expected = self._as_array(nx.pagerank(G, tol=1e-12), n)
+        assert np.allclose(ranks, expected, atol=1e-8)
+
+        weights = {i: float(i % 3) for i in range(n)}
+        ranks = pagerank(
+            random_graph,
+            personalization=list(weights.values()),
+            tol=1e-13,
+            max_iter=500,
+        )
+        expected = nx.pagerank(G, personalization=weights, tol=1e-12)
+        assert np.allclose(ranks, self._as_array(expected, n), atol=1e-8)
+
+        with pytest.raises(ValueError):
+            pagerank(random_graph, personalization=np.zeros(n))
+        with pytest.raises(RuntimeError):
+            pagerank(random_graph, max_iter=2)
+
+    def test_degree_and_closeness(self, random_graph):
+        """測試度中心性與接近中心性與 networkx 一致"""
+        nx, G = self._to_networkx(random_graph)
+        n = random_graph.num_nodes
+        assert np.allclose(
+            degree_centrality(random_graph, "in"),
+            self._as_array(nx.in_degree_centrality(G), n),
+        )
+        expected = nx.closeness_centrality(G, distance="weight")
+        assert np.allclose(
+            closeness_centrality(random_graph), self._as_array(expected, n)
+        )
+        expected = self._as_array(nx.closeness_centrality(G), n)
+        closeness = closeness_centrality(random_graph, weighted=False)
+        assert np.allclose(closeness, expected)
+        assert np.allclose(
+            closeness_centrality(random_graph, nodes=[3, 5], weighted=False),
+            expected[[3, 5]],
+        )
+
+    def test_betweenness(self, random_graph):
+        """測試介數中心性（有權、無權、並行與抽樣）"""
+        nx, G = self._to_networkx(random_graph)
+        n = random_graph.num_nodes
+        expected = nx.betweenness_centrality(G, weight="weight")
+        assert np.allclose(
+            betweenness_centrality(random_graph), self._as_array(expected, n)
+        )
+        expected = self._as_array(nx.betweenness_centrality(G), n)
+        assert np.allclose(
+            betweenness_centrality(random_graph, weighted=False), expected
+        )
+        assert np.allclose(
+            betweenness_centrality(random_graph, weighted=False, workers=2), expected
+        )
+
+        src, dst = random_graph.sources(), random_graph.indices
+        pairs = np.unique(np.minimum(src, dst) * n + np.maximum(src, dst))
+        undirected = CSRGraph.from_edges(
+            pairs // n, pairs % n, num_nodes=n, directed=False
+        )
+        expected = nx.betweenness_centrality(G.to_undirected())
+        assert np.allclose(
+            betweenness_centrality(undirected), self._as_array(expected, n)
+        )
+
+        sampled = betweenness_centrality(random_graph, k=20, seed=0, weighted=False)
+        assert sampled.shape == (n,) and np.all(sampled >= 0)
+
+    def test_graph_algo_centrality(self, simple_graph):
+        """測試 GraphAlgo 的 PageRank 與中心性介面"""
+        graph, weights = simple_graph
+        algo = GraphAlgo(graph, weights, animation_speed=0)
+        ranks = algo.pagerank()
+        assert set(ranks) == {"A", "B", "C", "D"}
+        assert sum(ranks.values()) == pytest.approx(1.0)
+        personal = algo.pagerank(personalization={"A": 1.0})
+        assert max(personal, key=personal.get) == "A"
+
+        assert algo.centrality("degree")["A"] == pytest.approx(2 / 3)
+        assert set(algo.centrality("closeness")) == set(graph)
+        betweenness = algo.centrality("betweenness")
+        assert betweenness["A"] >= 0
+        with pytest.raises(ValueError):
+            algo.centrality("eigenvector")
+
+
+class TestDynamicSSSP:
+    def _expected(self, graph, source):
+        """以 CSR Dijkstra 重新計算作為對照"""
+        csr = graph.to_csr()
+        dist, _ = dijkstra(csr, csr.node_id(source))
+        return {
+            label: d
+            for label, d in zip(csr.to_labels(range(csr.num_nodes)), dist.tolist())
+            if np.isfinite(d)
+        }
+
+    def test_random_updates_match_recompute(self):
+        """測試隨機的插入、刪除、權重修改後距離與重新計算一致"""
+        rng = np.random.default_rng(2)
+        n = 40
+        graph = Graph()
+        for i in range(n):
+            graph.add_vertex(i)
+        for u, v in rng.integers(0, n, (120, 2)).tolist():
+            graph.add_edge(u, v, float(rng.integers(1, 10)))
+        sssp = DynamicSSSP(graph, 0)
+        assert sssp.distances == self._expected(graph, 0)
+
+        for step in range(200):
+            u, v = rng.integers(0, n, 2).tolist()
+            action = step % 4
+            if action == 0:
+                sssp.add_edge(u, v, float(rng.integers(1, 10)))
+            elif action == 1 and graph.graph.get(u):
+                sssp.remove_edge(u, next(iter(graph.graph[u])))
+            elif action == 2 and graph.graph.get(u):
+                target = next(iter(graph.graph[u]))
+                sssp.set_weight(u, target, float(rng.integers(1, 10)))
+            elif action == 3 and u != 0 and u in graph.graph and step % 20 == 3:
+                sssp.remove_vertex(u)
+            assert sssp.distances == self._expected(graph, 0)
+
+        for vertex, distance in sssp.distances.items():
+            path = sssp.path(vertex)
+            assert path[0] == 0 and path[-1] == vertex
+            assert sum(graph.weight(a, b) for a, b in zip(path, path[1:])) == distance
+
+    def test_local_repair(self):
+        """測試修改只觸及受影響的節點"""
+        n = 2000
+        graph = Graph()
+        for i in range(n - 1):
+            graph.add_edge(i, i + 1, 1.0)
+        graph.add_edge(0, n - 10, 5000.0)
+        sssp = DynamicSSSP(graph, 0)
+        assert sssp.distance(n - 1) == n - 1
+
+        sssp.add_edge(0, n - 10, 1.0)
+        assert sssp.distance(n - 1) == 10 and sssp.touched == 10
+        sssp.remove_edge(0, n - 10)
+        assert sssp.distance(n - 1) == n - 1 and sssp.touched <= 20
+        sssp.remove_edge(n - 3, n - 2)
+        assert sssp.distance(n - 1) == float("inf") and sssp.path(n - 1) == []
+
+        with pytest.raises(ValueError):
+            sssp.add_edge(1, 2, -1.0)
+        with pytest.raises(ValueError):
+            sssp.remove_vertex(0)
+        with pytest.raises(KeyError):
+            sssp.set_weight(5, 3, 1.0)
+
+
+class TestGraphIO:
+    @pytest.fixture
+    def random_graph(self):
+        """建立隨機有向加權圖"""
+        rng = np.random.default_rng(4)
+        n, m = 50, 400
+        return CSRGraph.from_edges(
+            rng.integers(0, n, m), rng.integers(0, n, m), rng.random(m), n
+        )
+
+    def assert_same_graph(self, a, b):
+        assert np.array_equal(a.indptr, b.indptr)
+        assert np.array_equal(a.indices, b.indices)
+        assert np.allclose(a.weights, b.weights)
+
+    def test_edge_list(self, random_graph, tmp_path):
+        """測試邊列表的分塊讀取"""
+        path = tmp_path / "edges.csv"
+        write_edge_list(random_graph, path)
+        loaded = read_edge_list(path, num_nodes=random_graph.num_nodes, chunksize=37)
+        self.assert_same_graph(loaded, random_graph)
+
+        tsv = tmp_path / "edges.tsv"
+        tsv.write_text("# 註解\nsrc\tdst\na\tb\nb\tc\na\tc\n")
+        graph = read_edge_list(tsv, header=True, directed=False)
+        assert graph.labels == ["a", "b", "c"]
+        assert graph.num_edges == 6 and not graph.directed
+        assert np.all(graph.weights == 1.0)
+
+        txt = tmp_path / "edges.txt"
+        txt.write_text("0 1 2.5\n1  2 0.5\n")
+        graph = read_edge_list(txt, weighted=False)
+        assert graph.num_nodes == 3 and np.all(graph.weights == 1.0)
+
+    def test_matrix_market(self, random_graph, tmp_path):
+        """測試 Matrix Market 的讀寫與對稱矩陣"""
+        path = tmp_path / "graph.mtx"
+        write_matrix_market(random_graph, path)
+        self.assert_same_graph(read_matrix_market(path, chunksize=64), random_graph)
+
+        sym = tmp_path / "sym.mtx"
+        sym.write_text(
+            "%%MatrixMarket matrix coordinate pattern symmetric\n"
+            "% 下三角\n3 3 3\n2 1\n3 2\n3 3\n"
+        )
+        graph = load_graph(sym)
+        assert not graph.directed
+        assert graph.to_dict()[0] == {0: [1], 1: [0, 2], 2: [1, 2]}
+
+        bad = tmp_path / "bad.mtx"
+        bad.write_text("%%MatrixMarket matrix array real general\n2 2\n")
+        with pytest.raises(ValueError):
+            read_matrix_market(bad)
+
+    def test_binary_format(self, random_graph, tmp_path):
+        """測試二進位格式的保存與記憶體映射載入"""
+        path = tmp_path / "graph.csrg"
+        save_binary(random_graph, path)
+        loaded = load_graph(path)
+        assert isinstance(loaded.indices.base, np.memmap)
+        self.assert_same_graph(loaded, random_graph)
+        self.assert_same_graph(load_binary(path, mmap=False), random_graph)
+        assert np.array_equal(dijkstra(loaded, 0)[0], dijkstra(random_graph, 0)[0])
+
+        labelled = CSRGraph.from_edges(["甲", "乙"], ["乙", "丙"], directed=False)
+        save_binary(labelled, path)
+        loaded = load_binary(path)
+        assert loaded.labels == ["甲", "乙", "丙"] and not loaded.directed
+
+        # tuple 標籤（網格座標、巢狀 tuple）載入後仍是 tuple，可以繼續查詢
+        grid = {(0, 0): [(0, 1)], (0, 1): [(1, 1)], (1, 1): [((1, 1), "出口")]}
+        grid[((1, 1), "出口")] = []
+        save_binary(CSRGraph.from_dict(grid), path)
+        loaded = load_binary(path)
+        assert loaded.labels == list(grid)
+        assert loaded.node_id((0, 1)) == 1
+        assert loaded.to_labels(loaded.neighbors(2)) == [((1, 1), "出口")]
+        with pytest.raises(ValueError):
+            save_binary(CSRGraph.from_dict({frozenset([1]): []}), path)
+
+        (tmp_path / "bad.csrg").write_bytes(b"not a graph")
+        with pytest.raises(ValueError):
+            load_binary(tmp_path / "bad.csrg")
+
+    def test_graph_algo_from_file(self, simple_graph, tmp_path):
+        """測試 GraphAlgo 從檔案載入"""
+        graph, weights = simple_graph
+        original = GraphAlgo(graph, weights, animation_speed=0)
+        path = tmp_path / "simple.csrg"
+        save_binary(original.to_csr(), path)
+        algo = GraphAlgo.from_file(path)
+        assert algo.graph == graph
+        assert algo.get_shortest_path("A", "D") == original.get_shortest_path("A", "D")
+
+    def test_graph_algo_csr_backed(self, tmp_path):
+        """測試以 CSR 為主要儲存時，演算法不會建立字典視圖"""
+        rng = np.random.default_rng(11)
+        n, m = 300, 1500
+        csr = CSRGraph.from_edges(
+            rng.integers(0, n, m), rng.integers(0, n, m), rng.random(m) + 0.1, n
+        )
+        algo = GraphAlgo.from_csr(csr, animation_speed=0)
+        reference = GraphAlgo(*csr.to_dict(), animation_speed=0)
+        start = 0
+        order = algo.bfs(start)
+        assert order == reference.bfs(start)
+        end = order[-1]
+        assert algo.dfs(start) == reference.dfs(start)
+        distances, predecessors = algo.dijkstra(start)
+        ref_distances, _ = reference.dijkstra(start)
+        assert distances == pytest.approx(ref_distances)
+        assert predecessors[start] is None
+        path, distance = algo.get_shortest_path(start, end)
+        assert distance == pytest.approx(reference.get_shortest_path(start, end)[1])
+        assert path[0] == start and path[-1] == end
+        astar_path, astar_distance = algo.astar(
+            start, end, LandmarkIndex.build(csr, num_landmarks=4, seed=0)
+        )
+        assert astar_distance == pytest.approx(distance)
+        assert algo.astar(start, end, lambda node, target: 0.0)[1] == pytest.approx(
+            distance
+        )
+        with pytest.raises(KeyError):
+            algo.bfs(n + 5)
+        assert algo._graph is None and algo.to_csr(refresh=True) is csr
+
+        # 第一次存取時才建立字典視圖，之後沿用字典的實作
+        assert algo.graph == reference.graph
+        assert algo.weights == reference.weights
+        assert algo.bfs(start) == reference.bfs(start)
+
+
+class TestParallel:
+    @pytest.fixture
+    def random_graph(self):
+        """建立隨機有向加權圖"""
+        rng = np.random.default_rng(8)
+        n, m = 3000, 15000
+        return CSRGraph.from_edges(
+            rng.integers(0, n, m), rng.integers(0, n, m), rng.random(m) * 4, n
+        )
+
+    @pytest.fixture
+    def small_threshold(self, monkeypatch):
+        """降低並行門檻，讓小圖也會分派給工作進程"""
+        monkeypatch.setattr(parallel, "_PARALLEL_MIN_EDGES", 1)
+
+    def test_parallel_bfs_serial(self, random_graph):
+        """測試方向最佳化 BFS 與逐層 BFS 一致"""
+        expected = bfs_levels(random_graph, 0)
+        assert np.array_equal(parallel_bfs(random_graph, 0, workers=0), expected)
+        # 較小的 alpha 讓搜尋更早切換為由下而上
+        assert np.array_equal(
+            parallel_bfs(random_graph, 0, workers=0, alpha=1e6, beta=1e-6), expected
+        )
+
+    def test_delta_stepping_serial(self, random_graph):
+        """測試 Δ-stepping 與 Dijkstra 一致"""
+        expected, _ = dijkstra(random_graph, 0)
+        for delta in (None, 0.1, 100.0):
+            dist = delta_stepping(random_graph, 0, delta=delta, workers=0)
+            assert np.allclose(dist, expected)
+        with pytest.raises(ValueError):
+            delta_stepping(random_graph, 0, delta=0.0, workers=0)
+
+    def test_multi_process(self, random_graph, small_threshold):
+        """測試多進程模式的結果與單進程一致"""
+        assert np.array_equal(
+            parallel_bfs(random_graph, 5, workers=2), bfs_levels(random_graph, 5)
+        )
+        assert np.allclose(
+            delta_stepping(random_graph, 5, workers=2), dijkstra(random_graph, 5)[0]
+        )
+
+    def test_graph_algo_parallel(self, simple_graph):
+        """測試 GraphAlgo 的並行介面"""
+        graph, weights = simple_graph
+        algo = GraphAlgo(graph, weights, animation_speed=0)
+        assert algo.bfs_levels("A", workers=1) == algo.bfs_levels("A")
+        expected, _ = algo.dijkstra("A")
+        assert algo.delta_stepping("A", workers=0) == expected
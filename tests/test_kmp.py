@@ -0,0 +1,64 @@
+import mmap
+from array import array
+
+import pytest
+
+from mathalgo2.algorithm.string.KMP import KMP, compute_lps
+
+
+class TestKMP:
+    def test_initialization(self):
+        """測試初始化時計算並快取 LPS 數組"""
+        kmp = KMP("ABABCABAB")
+        assert kmp.pattern_length == 9
+        assert isinstance(kmp.lps, array) and kmp.lps.typecode == "i"
+        assert kmp.lps.tolist() == [0, 0, 1, 2, 0, 1, 2, 3, 4]
+        assert kmp.compute_lps() == kmp.lps.tolist()
+        assert compute_lps("AAAA").tolist() == [0, 1, 2, 3]
+
+        with pytest.raises(ValueError):
+            KMP("")
+
+    def test_search(self):
+        """測試基本與重疊的匹配"""
+        assert KMP("ABABC").search("ABABDABACDABABCABAB") == [10]
+        assert KMP("aa").search("aaaa") == [0, 1, 2]
+        assert KMP("xyz").search("short") == []
+        assert KMP("longer pattern").search("short") == []
+
+    def test_finditer_is_lazy(self):
+        """測試 finditer 逐一產生匹配"""
+        matches = KMP("ab").finditer("ab" * 100000)
+        assert next(matches) == 0
+        assert next(matches) == 2
+
+    @pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+    def test_binary_text(self, wrap):
+        """測試 bytes、bytearray 與 memoryview 文本"""
+        text = wrap(b"\x00GET /\x00GET /\xff")
+        assert KMP(b"GET").search(text) == [1, 7]
+        assert KMP("GET /").search(text) == [1, 7]
+        assert KMP(memoryview(b"\xff")).search(text) == [12]
+
+    def test_str_pattern_on_binary_text_uses_utf8(self):
+        """測試 str 模式搜尋二進位文本時以 UTF-8 編碼，位置以位元組計"""
+        kmp = KMP("測試")
+        assert kmp.search("這是測試") == [2]
+        assert kmp.search("這是測試".encode("utf-8")) == [6]
+
+    def test_binary_pattern_on_str_text(self):
+        """測試二進位模式不能搜尋 str 文本"""
+        with pytest.raises(TypeError):
+            KMP(b"abc").search("abc")
+        with pytest.raises(TypeError):
+            KMP("abc").search(123)
+
+    def test_mmap(self, tmp_path):
+        """測試直接搜尋記憶體映射檔案，搜尋後可以正常關閉"""
+        path = tmp_path / "payload.bin"
+        path.write_bytes(b"header" + b"\x00" * 10000 + b"needle" + b"\x01" * 10)
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            assert KMP(b"needle").search(mapped) == [10006]
+            assert list(KMP("header").finditer(mapped)) == [0]
+            mapped.close()
@@ -2,6 +2,7 @@
 import pytest
 
 from mathalgo2.algorithm.OpAlgo import BaseOptimizer, OptimizationFactory
+from mathalgo2.algorithm.optimizers.sweep import HyperparameterSweep
 
 
 def simple_objective(x):
@@ -116,3 +117,77 @@ def test_optimization_with_custom_params(self, factory_instance):
         assert isinstance(optimizer, BaseOptimizer)
         assert hasattr(optimizer, "population_size")
         assert optimizer.population_size == 50
+
+
+class TestHyperparameterSweep:
+    bounds = [(-5, 5), (-5, 5)]
+
+    def test_grid_configurations(self):
+        """測試參數網格展開"""
+        sweep = HyperparameterSweep(
+            simple_objective,
+            self.bounds,
+            "annealing",
+            grid={"initial_temp": [1.0, 10.0], "cooling_rate": [0.9, 0.95, 0.99]},
+        )
+        configs = sweep.configurations()
+        assert len(configs) == 6
+        assert {"initial_temp": 10.0, "cooling_rate": 0.99} in configs
+
+    def test_random_space(self):
+        """測試隨機搜尋空間抽樣"""
+        sweep = HyperparameterSweep(
+            simple_objective,
+            self.bounds,
+            "genetic",
+            space={"population_size": (10, 100)},
+            n_samples=5,
+            random_state=0,
+        )
+        configs = sweep.configurations()
+        assert len(configs) == 5
+        assert all(10 <= c["population_size"] <= 100 for c in configs)
+        assert configs == sweep.configurations()
+
+    def test_invalid_arguments(self):
+        """測試無效的參數"""
+        with pytest.raises(ValueError):
+            HyperparameterSweep(simple_objective, self.bounds, "annealing")
+        with pytest.raises(ValueError):
+            HyperparameterSweep(
+                simple_objective, self.bounds, "invalid", grid={"x": [1]}
+            )
+
+    def test_run_in_process(self, tmp_path):
+        """測試同進程執行與結果輸出"""
+        output = tmp_path / "sweep.npz"
+        sweep = HyperparameterSweep(
+            simple_objective,
+            self.bounds,
+            "gradient",
+            grid={"learning_rate": [0.01, 0.1]},
+            seeds=[0, 1],
+            workers=0,
+            max_iter=20,
+        )
+        results = sweep.run(output=output)
+        assert len(results) == 4
+        assert set(results["seed"]) == {0, 1}
+        assert sweep.best()["learning_rate"] in (0.01, 0.1)
+        saved = np.load(output)
+        assert len(saved["best_fitness"]) == 4
+
+    def test_successive_halving(self):
+        """測試 successive halving 逐輪淘汰組態"""
+        sweep = HyperparameterSweep(
+            simple_objective,
+            self.bounds,
+            "gradient",
+            grid={"learning_rate": [0.001, 0.01, 0.05, 0.1, 0.2, 0.3]},
+            workers=2,
+            max_iter=27,
+        )
+        results = sweep.run(successive_halving=True, min_iter=3, eta=3)
+        per_rung = results.groupby("rung")["config_id"].nunique().tolist()
+        assert per_rung == [6, 2, 1]
+        assert results["budget"].max() == 27
@@ -1,6 +1,8 @@
+import mmap
+
 import pytest
 
-from mathalgo2.algorithm.string.RabinKarp import RabinKarp
+from mathalgo2.algorithm.string.RabinKarp import MultiRabinKarp, RabinKarp
 
 
 class TestRabinKarp:
@@ -11,7 +13,7 @@ def test_initialization(self):
         assert rk.pattern == "test"
         assert rk.pattern_length == 4
         assert rk.d == 256
-        assert rk.q == 101
+        assert rk.q == (1 << 61) - 1
 
         # 空模式字串
         with pytest.raises(ValueError):
@@ -106,3 +108,71 @@ def test_unicode_characters(self):
         text = "Hello 😊 World"
         matches = rk.search(text)
         assert matches == [6]
+
+    def test_precomputed_constants(self):
+        """測試雜湊常數只在初始化時計算"""
+        rk = RabinKarp("abc")
+        assert rk.dm == pow(256, 3, rk.q)
+        assert rk.pattern_hash == (ord("a") * 256 * 256 + ord("b") * 256 + ord("c"))
+
+    def test_many_distinct_windows(self):
+        """測試大量不同窗口（小模數下必然碰撞）時結果仍正確"""
+        rk = RabinKarp("ab")
+        text = "".join(chr(0x4E00 + i) for i in range(2000)) + "ab"
+        assert rk.search(text) == [2000]
+
+    def test_finditer_and_binary_text(self):
+        """測試 finditer 與二進位文本"""
+        rk = RabinKarp(b"\x00\xff")
+        assert list(rk.finditer(b"\x00\xff\x00\xff")) == [0, 2]
+        assert rk.search(bytearray(b"a\x00\xff")) == [1]
+        assert rk.search(memoryview(b"\x00\xff")) == [0]
+        assert RabinKarp("測試").search("這是測試".encode("utf-8")) == [6]
+        with pytest.raises(TypeError):
+            rk.search("text")
+
+    def test_mmap(self, tmp_path):
+        """測試直接搜尋記憶體映射檔案"""
+        path = tmp_path / "log.txt"
+        path.write_bytes(b"x" * 5000 + b"ERROR" + b"y" * 5000 + b"ERROR")
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            assert RabinKarp("ERROR").search(mapped) == [5000, 10005]
+            assert MultiRabinKarp(["ERROR", "xE"]).search(mapped) == [
+                (4999, 1),
+                (5000, 0),
+                (10005, 0),
+            ]
+            mapped.close()
+
+
+class TestMultiRabinKarp:
+    def test_initialization(self):
+        """測試依長度分組"""
+        mrk = MultiRabinKarp(["ab", "cd", "abc", "ab"])
+        assert sorted(mrk.groups) == [2, 3]
+        assert sum(len(ids) for ids in mrk.groups[2][1].values()) == 3
+
+        with pytest.raises(ValueError):
+            MultiRabinKarp([])
+        with pytest.raises(ValueError):
+            MultiRabinKarp(["ab", ""])
+        with pytest.raises(TypeError):
+            MultiRabinKarp(["ab", b"cd"])
+
+    def test_search(self):
+        """測試多模式搜尋，包含重疊與重複的模式"""
+        mrk = MultiRabinKarp(["he", "she", "his", "hers", "he"])
+        assert mrk.search("ushers") == [(1, 1), (2, 0), (2, 3), (2, 4)]
+        assert mrk.search("") == []
+
+    def test_matches_single_pattern(self):
+        """測試結果與逐一使用 RabinKarp 一致"""
+        patterns = ["aa", "ab", "aab", "b", "測試"]
+        text = "aabaab 測試 baa"
+        expected = sorted(
+            (i, pattern_id)
+            for pattern_id, pattern in enumerate(patterns)
+            for i in RabinKarp(pattern).search(text)
+        )
+        assert MultiRabinKarp(patterns).search(text) == expected
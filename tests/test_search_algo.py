@@ -1,6 +1,7 @@
+import numpy as np
 import pytest
 
-from mathalgo2.algorithm.SearchAlgo import Searching
+from mathalgo2.algorithm.SearchAlgo import Searching, SortedIndex, exponential_search
 
 
 @pytest.fixture
@@ -77,3 +78,261 @@ def test_invalid_algorithm(self, search_instance):
         """測試無效的算法名稱"""
         with pytest.raises(ValueError):
             search_instance.search("invalid", 7)
+
+
+class TestSortedIndex:
+    @pytest.fixture
+    def index(self):
+        """建立含重複鍵值的未排序索引"""
+        return SortedIndex([9, 3, 7, 3, 1, 12])
+
+    def test_sorted_keys(self, index):
+        """測試建立時排序一次並記錄原始位置"""
+        assert index.keys.tolist() == [1, 3, 3, 7, 9, 12]
+        assert index.order.tolist() == [4, 1, 3, 2, 0, 5]
+        assert len(index) == 6
+
+    def test_lookup(self, index):
+        """測試純量與批次查詢"""
+        assert index.lookup(7) == 2
+        assert index.lookup(3) == 1
+        assert index.lookup(4) is None
+        assert index.lookup([12, 5, 1, 100]).tolist() == [5, -1, 4, -1]
+        assert index.contains(np.array([3, 4])).tolist() == [True, False]
+
+    def test_bisect_and_range_count(self, index):
+        """測試插入位置與範圍計數"""
+        assert index.bisect_left(3) == 1
+        assert index.bisect_right(3) == 3
+        assert index.bisect_left([0, 13]).tolist() == [0, 6]
+        assert index.range_count(3, 9) == 3
+        assert index.range_count([0, 8], [100, 2]).tolist() == [6, 0]
+
+    def test_presorted(self):
+        """測試已排序輸入的驗證"""
+        index = SortedIndex(np.arange(10), presorted=True)
+        assert index.lookup(np.arange(10)).tolist() == list(range(10))
+        with pytest.raises(ValueError):
+            SortedIndex([1, 3, 2], presorted=True)
+
+    def test_empty_index(self):
+        """測試空索引"""
+        index = SortedIndex([])
+        assert index.lookup(1) is None
+        assert index.lookup([1, 2]).tolist() == [-1, -1]
+        assert index.range_count(0, 10) == 0
+
+    def test_matches_linear_search(self):
+        """測試批次查詢與線性搜尋一致"""
+        rng = np.random.default_rng(0)
+        arr = rng.integers(0, 1000, 500)
+        # 目標數超過門檻時會先排序目標再搜尋
+        targets = rng.integers(0, 1000, 5000)
+        index = SortedIndex(arr)
+        expected = [
+            int(np.flatnonzero(arr == t)[0]) if t in arr else -1 for t in targets
+        ]
+        assert index.lookup(targets).tolist() == expected
+
+    def test_build_index(self, search_instance):
+        """測試 Searching 建立索引"""
+        index = search_instance.build_index(presorted=True)
+        assert index.lookup(11) == search_instance.search("binary", 11)
+
+
+class TestSearchStrategies:
+    @pytest.mark.parametrize("algorithm", ["hash", "interpolation", "exponential"])
+    def test_registered_strategies(self, search_instance, algorithm):
+        """測試新註冊的搜尋策略"""
+        for i, value in enumerate(search_instance.arr):
+            assert search_instance.search(algorithm, value) == i
+        for missing in (0, 8, 16):
+            assert search_instance.search(algorithm, missing) is None
+
+    @pytest.mark.parametrize("algorithm", ["hash", "interpolation", "exponential"])
+    def test_empty_and_single(self, algorithm):
+        """測試空數組與單一元素"""
+        assert Searching([], test_mode=True).search(algorithm, 1) is None
+        assert Searching([5], test_mode=True).search(algorithm, 5) == 0
+
+    def test_hash_index(self):
+        """測試雜湊索引只建立一次並返回所有位置"""
+        search = Searching(["b", "a", "b", "c"], test_mode=True)
+        assert search.strategy_costs()["hash"]["build_seconds"] is None
+        assert search.search("hash", "b") == 0
+        assert search.find_all("b") == [0, 2]
+        costs = search.strategy_costs()["hash"]
+        assert costs["build_seconds"] >= 0 and costs["memory_bytes"] > 0
+
+        search.arr.append("d")
+        search.invalidate()
+        assert search.search("hash", "d") == 4
+
+    def test_interpolation_skewed(self):
+        """測試分布極不均勻時插值搜尋仍然正確"""
+        arr = [2**i for i in range(60)] + [2**60 + i for i in range(1000)]
+        search = Searching(arr, test_mode=True)
+        for i in (0, 30, 59, 60, 500, 1059):
+            assert search.search("interpolation", arr[i]) == i
+        assert search.search("interpolation", 3) is None
+
+    def test_requires_sorted(self):
+        """測試插值與指數搜尋需要已排序的數組"""
+        search = Searching([3, 1, 2], test_mode=True)
+        with pytest.raises(ValueError):
+            search.search("interpolation", 1)
+        with pytest.raises(ValueError):
+            search.search("exponential", 1)
+
+    def test_exponential_unbounded_source(self):
+        """測試指數搜尋用於沒有長度的來源"""
+
+        class Squares:
+            """只支援索引的無界升序來源"""
+
+            def __getitem__(self, i):
+                return i * i
+
+        assert exponential_search(Squares(), 144) == 12
+        assert exponential_search(Squares(), 145) is None
+        assert exponential_search(range(0, 100, 3), 99) == 33
+        assert exponential_search(range(0, 100, 3), 100) is None
+
+
+class TestAutoSearch:
+    def test_tiny_array(self, search_instance):
+        """測試小數組直接使用線性搜尋"""
+        assert search_instance.search("auto", 7) == 3
+        assert search_instance.auto_stats["strategy"] == "linear"
+        assert search_instance.auto_stats["settled"]
+
+    def test_sorted_uniform(self):
+        """測試已排序且均勻分布的數組切換為插值搜尋"""
+        search = Searching(list(range(0, 3000, 3)), test_mode=True)
+        # 前兩次共掃描 101 + 1000 個元素，達到一次完整掃描的成本後才切換
+        results = [search.search("auto", value) for value in (300, 2997, 0, 1)]
+        assert results == [100, 999, 0, None]
+        stats = search.auto_stats
+        assert [d["strategy"] for d in stats["decisions"]] == [
+            "linear",
+            "interpolation",
+        ]
+        assert stats["counts"] == {"linear": 2, "interpolation": 2}
+        assert stats["scanned"] == 1101
+        assert stats["build_estimate"] > 0
+        assert stats["profile"]["uniform"]
+
+    def test_stays_linear_for_cheap_queries(self):
+        """測試查詢都在前端時線性搜尋的累積成本不足以建立索引"""
+        search = Searching(list(range(1000)), test_mode=True)
+        for _ in range(100):
+            assert search.search("auto", 3) == 3
+        assert search.auto_stats["strategy"] == "linear"
+        assert not search.auto_stats["settled"]
+        assert search.auto_stats["scanned"] == 400
+
+    def test_uses_measured_build_cost(self):
+        """測試已實測排序檢查成本時以實測時間決定切換"""
+        search = Searching(list(range(1000)), test_mode=True)
+        search.search("exponential", 3)
+        search.build_costs["sorted_check"]["build_seconds"] = 0.0
+        search.search("auto", 3)
+        assert search.search("auto", 3) == 3
+        assert search.auto_stats["strategy"] == "interpolation"
+        assert search.auto_stats["build_estimate"] == 0.0
+
+    def test_numpy_array(self):
+        """測試 NumPy 陣列與 NumPy 純量也能被識別為數值並使用插值搜尋"""
+        search = Searching(np.arange(0, 3000, 3), test_mode=True)
+        assert search.search("auto", -1) is None
+        assert search.search("auto", 2997) == 999
+        assert search.auto_stats["strategy"] == "interpolation"
+
+        scalars = [np.float64(v) for v in range(0, 3000, 3)]
+        search = Searching(scalars, test_mode=True)
+        search.search("auto", -1.0)
+        assert search.search("auto", 300.0) == 100
+        assert search.auto_stats["profile"]["numeric"]
+        assert search.auto_stats["strategy"] == "interpolation"
+
+    @pytest.mark.parametrize(
+        "arr",
+        [[1] * 50 + [2] * 50, [0] + [1] * 40 + [2] * 59, [i // 7 for i in range(700)]],
+    )
+    def test_duplicates_consistent_across_switch(self, arr):
+        """測試有重複值時切換策略前後結果一致（皆為第一次出現的位置）"""
+        search = Searching(arr, test_mode=True)
+        expected = {value: arr.index(value) for value in set(arr)}
+        for value, first in expected.items():
+            assert search.search("auto", value) == first
+        # 查詢不存在的值掃描整個數組，之後切換為已排序的策略
+        assert search.search("auto", 10**6) is None
+        for _ in range(3):
+            for value, first in expected.items():
+                assert search.search("auto", value) == first
+        assert search.auto_stats["strategy"] != "linear"
+        for algorithm in ("linear", "binary", "hash", "interpolation", "exponential"):
+            for value, first in expected.items():
+                assert search.search(algorithm, value) == first, algorithm
+        assert exponential_search(arr, 1) == arr.index(1)
+
+    @pytest.mark.parametrize(
+        "arr, strategy",
+        [(list(range(1000)), "interpolation"), ([5, 3, 9, 1] * 50, "hash")],
+    )
+    def test_incompatible_targets_across_switch(self, arr, strategy):
+        """測試型別不相容的目標在切換策略前後結果一致（退回線性搜尋）"""
+        search = Searching(arr, test_mode=True)
+        targets = ["x", [1], None, 3.5]
+        expected = [search.linear_search(target) for target in targets]
+        assert search.search("auto", [1]) is None
+        assert search.auto_stats["strategy"] == "linear"
+        search.auto_stats["scanned"] = len(arr)
+        assert search.search("auto", 9 if strategy == "hash" else 999) is not None
+        assert search.auto_stats["strategy"] == strategy
+        assert [search.search("auto", target) for target in targets] == expected
+        assert search.auto_stats["fallbacks"] > 0
+
+    def test_sorted_skewed(self):
+        """測試已排序但分布不均的數組使用二分搜尋"""
+        search = Searching([i**3 for i in range(200)], test_mode=True)
+        search.search("auto", -1)
+        for _ in range(3):
+            search.search("auto", 27)
+        assert search.auto_stats["strategy"] == "binary"
+        assert search.search("auto", 27) == 3
+
+    def test_unsorted(self):
+        """測試未排序數組建立雜湊索引，不可雜湊時維持線性"""
+        arr = list(range(100, 0, -1))
+        search = Searching(arr, test_mode=True)
+        assert search.search("auto", 0) is None
+        for value in arr[:5]:
+            assert search.search("auto", value) == arr.index(value)
+        assert search.auto_stats["strategy"] == "hash"
+        assert "hash" in search.build_costs
+
+        rows = [[i, -i] for i in range(50)]
+        search = Searching(rows, test_mode=True)
+        search.auto_stats["scanned"] = len(search.arr)
+        assert search.search("auto", [3, -3]) == 3
+        assert search.auto_stats["strategy"] == "binary"
+        search = Searching(rows[::-1], test_mode=True)
+        search.auto_stats["scanned"] = len(search.arr)
+        search.arr.append({"unhashable": True})
+        assert search.search("auto", [3, -3]) == 46
+        assert search.auto_stats["strategy"] == "linear"
+
+    def test_invalidate_resets(self):
+        """測試修改數組後重新評估"""
+        search = Searching(list(range(100)), test_mode=True)
+        for _ in range(3):
+            search.search("auto", -1)
+        search.arr.reverse()
+        search.invalidate()
+        assert search.auto_stats["queries"] == 0
+        assert search.auto_stats["scanned"] == 0
+        for _ in range(3):
+            assert search.search("auto", -1) is None
+        assert search.search("auto", 5) == 94
+        assert search.auto_stats["strategy"] == "hash"
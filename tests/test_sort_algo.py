@@ -1,6 +1,26 @@
+import heapq
+import random
+
+import numpy as np
 import pytest
 
 from mathalgo2.algorithm.SortAlgo import Sorting
+from mathalgo2.algorithm.sorting import (
+    ExternalSort,
+    TopK,
+    argsort,
+    counting_sort,
+    external_sort,
+    introsort,
+    merge_sort,
+    nlargest,
+    nsmallest,
+    parallel,
+    parallel_sort,
+    partial_sort,
+    radix_sort,
+    select,
+)
 
 
 class TestSorting:
@@ -106,3 +126,313 @@ def test_reverse_sorted(self):
         assert sorting.quick_sort() == [1, 2, 3, 4, 5]
         assert sorting.insertion_sort() == [1, 2, 3, 4, 5]
         assert sorting.merge_sort() == [1, 2, 3, 4, 5]
+
+
+class TestSortingEngine:
+    @pytest.fixture
+    def datasets(self):
+        """建立隨機、已排序、逆序與大量重複的測試數據"""
+        rng = random.Random(0)
+        values = [rng.random() for _ in range(3000)]
+        return [
+            [],
+            [1],
+            values,
+            sorted(values),
+            sorted(values, reverse=True),
+            [rng.randint(0, 5) for _ in range(3000)],
+        ]
+
+    @pytest.mark.parametrize("sort", [introsort, merge_sort])
+    def test_matches_sorted(self, sort, datasets):
+        """測試排序結果與內建 sorted 一致"""
+        for data in datasets:
+            assert sort(data) == sorted(data)
+            assert sort(data, reverse=True) == sorted(data, reverse=True)
+            assert sort(data, key=lambda x: -x) == sorted(data, key=lambda x: -x)
+
+    def test_input_not_modified(self):
+        """測試輸入序列不會被修改"""
+        data = [3, 1, 2]
+        introsort(data)
+        merge_sort(data)
+        assert data == [3, 1, 2]
+
+    def test_merge_sort_stable(self):
+        """測試合併排序的穩定性（含降序）"""
+        rng = random.Random(1)
+        records = [(rng.randint(0, 9), i) for i in range(2000)]
+        for reverse in (False, True):
+            expected = sorted(records, key=lambda r: r[0], reverse=reverse)
+            assert merge_sort(records, key=lambda r: r[0], reverse=reverse) == expected
+
+    def test_large_sorted_input(self):
+        """測試已排序的大數組不會遞迴過深"""
+        data = list(range(200000))
+        assert introsort(data) == data
+        assert introsort(data[::-1]) == data
+
+    def test_sorting_class(self):
+        """測試 Sorting 的非視覺化排序介面"""
+        words = ["pear", "fig", "banana", "kiwi"]
+        sorting = Sorting(words, animation_speed=0)
+        assert sorting.sort("merge", key=len) == ["fig", "pear", "kiwi", "banana"]
+        assert sorting.sort(key=len, reverse=True)[0] == "banana"
+        with pytest.raises(ValueError):
+            sorting.sort("bogo")
+
+
+class TestNumericSort:
+    @pytest.fixture
+    def arrays(self):
+        """建立各種 dtype 的數值測試數據"""
+        rng = np.random.default_rng(0)
+        return [
+            rng.integers(-(2**63), 2**63 - 1, 2000, dtype=np.int64),
+            rng.integers(0, 2**64 - 1, 2000, dtype=np.uint64),
+            rng.integers(-300, 300, 2000).astype(np.int16),
+            rng.standard_normal(2000),
+            np.array([0.0, -np.inf, np.inf, np.nan, 1.5, -2.5, 1e-300]),
+            np.array([7, 7, 7]),
+            np.array([], dtype=np.int64),
+        ]
+
+    def test_radix_sort(self, arrays):
+        """測試基數排序與 np.sort 一致且保持 dtype"""
+        for arr in arrays:
+            expected = np.sort(arr)
+            result = radix_sort(arr)
+            assert result.dtype == arr.dtype
+            assert np.array_equal(result, expected, equal_nan=True)
+            assert np.array_equal(
+                radix_sort(arr, reverse=True), expected[::-1], equal_nan=True
+            )
+        assert radix_sort([3, -1, 2]).tolist() == [-1, 2, 3]
+
+    def test_radix_sort_negative_nan(self):
+        """測試符號位元為 1 的 NaN 也和 np.sort 一樣排在最後"""
+        data = np.array([1.0, -np.nan, 0.5, np.nan, -2.0, -0.0])
+        assert np.signbit(data[1]) and np.isnan(data[1])
+        result = radix_sort(data)
+        assert np.array_equal(result, np.sort(data), equal_nan=True)
+        assert np.isnan(result[-2:]).all() and result[0] == -2.0
+        assert np.isnan(radix_sort(data, reverse=True)[:2]).all()
+        assert np.isnan(radix_sort(data.astype(np.float32))[-2:]).all()
+
+    @pytest.mark.parametrize("method", ["numpy", "radix"])
+    def test_argsort(self, method, arrays):
+        """測試間接排序的結果與穩定性"""
+        for arr in arrays:
+            expected = np.sort(arr)
+            order = argsort(arr, method=method)
+            assert np.array_equal(arr[order], expected, equal_nan=True)
+
+        data = np.random.default_rng(1).integers(0, 5, 1000)
+        for reverse in (False, True):
+            order = argsort(data, reverse=reverse, method=method)
+            expected = sorted(range(len(data)), key=lambda i: data[i], reverse=reverse)
+            assert order.tolist() == expected
+
+    def test_counting_sort(self):
+        """測試計數排序"""
+        data = np.random.default_rng(2).integers(-50, 50, 1000)
+        assert np.array_equal(counting_sort(data), np.sort(data))
+        assert counting_sort([3, -1, 3], reverse=True).tolist() == [3, 3, -1]
+        with pytest.raises(TypeError):
+            counting_sort([1.5, 2.0])
+        with pytest.raises(ValueError):
+            counting_sort([0, 2**40])
+
+    @pytest.mark.parametrize("dtype", [np.int8, np.int16, np.uint8, np.uint64])
+    def test_counting_sort_extreme_values(self, dtype):
+        """測試窄型別的極值不會在減去最小值時溢位"""
+        info = np.iinfo(dtype)
+        low = max(int(info.min), int(info.max) - 60000)
+        data = np.array(
+            [low, info.max, 0 if low <= 0 else low + 5, low + 3, info.max], dtype=dtype
+        )
+        result = counting_sort(data)
+        assert result.dtype == dtype
+        assert np.array_equal(result, np.sort(data))
+        int8 = np.array([-128, 127, 0, 5, -3], dtype=np.int8)
+        assert counting_sort(int8).tolist() == [-128, -3, 0, 5, 127]
+
+    def test_counting_sort_empty(self):
+        """測試空輸入返回空的整數陣列"""
+        assert counting_sort([]).tolist() == []
+        assert counting_sort([]).dtype.kind == "i"
+        assert counting_sort(np.array([], dtype=np.int16)).dtype == np.int16
+
+    def test_non_numeric_input(self):
+        """測試非數值輸入"""
+        with pytest.raises(TypeError):
+            radix_sort(["a", "b"])
+        with pytest.raises(TypeError):
+            argsort([1, "b"])
+
+    def test_sorting_class(self):
+        """測試 Sorting 的數值排序介面"""
+        sorting = Sorting([5, 3, 9, 1], animation_speed=0)
+        assert sorting.argsort().tolist() == [3, 1, 0, 2]
+        assert sorting.radix_sort().tolist() == [1, 3, 5, 9]
+        assert sorting.counting_sort(reverse=True).tolist() == [9, 5, 3, 1]
+
+
+class TestExternalSort:
+    @pytest.fixture
+    def records(self):
+        """建立含大量重複鍵值的隨機記錄"""
+        rng = random.Random(3)
+        return [(rng.randint(0, 500), i) for i in range(20000)]
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_sort_iterable(self, records, workers, tmp_path):
+        """測試分段溢寫、多層合併與穩定性"""
+        sorter = ExternalSort(
+            run_size=1500, max_fan_in=4, workers=workers, temp_dir=tmp_path
+        )
+        assert list(sorter.sort(iter(records))) == sorted(records)
+        keyed = ExternalSort(run_size=1500, key=min, reverse=True, workers=workers)
+        assert list(keyed.sort(records)) == sorted(records, key=min, reverse=True)
+        # 暫存檔已清除
+        assert list(tmp_path.iterdir()) == []
+
+    def test_external_sort_function(self):
+        """測試便捷函數與空輸入"""
+        assert list(external_sort([3, 1, 2], run_size=2)) == [1, 2, 3]
+        assert list(external_sort([])) == []
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_sort_file(self, workers, tmp_path):
+        """測試逐行排序文字檔（最後一行沒有換行符號）"""
+        rng = random.Random(4)
+        lines = [f"{rng.random():.6f} 事件 {i}\n" for i in range(5000)]
+        src = tmp_path / "app.log"
+        src.write_text("".join(lines).rstrip("\n"), encoding="utf-8")
+
+        sorter = ExternalSort(run_bytes=4096, max_fan_in=8, workers=workers)
+        num_runs = sorter.sort_file(src, src)
+        assert num_runs > 8
+        assert src.read_text(encoding="utf-8") == "".join(sorted(lines))
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_sort_file_keeps_control_characters(self, workers, tmp_path):
+        """測試行內的 \\x0c、\\r 等字元不會被當成換行"""
+        src = tmp_path / "lines.txt"
+        src.write_bytes("m\x0cz\na\r\nn\u2028x\nb\x1cc\x85\n".encode("utf-8"))
+        ExternalSort(run_bytes=4, workers=workers).sort_file(src, src)
+        assert src.read_bytes().decode("utf-8") == (
+            "a\r\nb\x1cc\x85\nm\x0cz\nn\u2028x\n"
+        )
+
+        src.write_bytes(b"m\x0cz\na\nn\n")
+        ExternalSort().sort_file(src, src)
+        assert src.read_bytes() == b"a\nm\x0cz\nn\n"
+
+    def test_invalid_arguments(self):
+        """測試無效參數"""
+        with pytest.raises(ValueError):
+            ExternalSort(run_size=0)
+        with pytest.raises(ValueError):
+            ExternalSort(max_fan_in=1)
+
+
+class TestParallelSort:
+    @pytest.fixture
+    def small_threshold(self, monkeypatch):
+        """降低並行門檻，讓小數組也會分派給工作進程"""
+        monkeypatch.setattr(parallel, "_PARALLEL_MIN_SIZE", 1)
+
+    def test_serial_fallback(self):
+        """測試 workers=0 時的結果"""
+        data = np.random.default_rng(5).standard_normal(1000)
+        assert np.array_equal(parallel_sort(data, workers=0), np.sort(data))
+
+    @pytest.mark.parametrize("workers", [2, 3])
+    def test_sample_sort(self, workers, small_threshold):
+        """測試多進程樣本排序（含大量重複值與降序）"""
+        rng = np.random.default_rng(6)
+        for data in (
+            rng.integers(-(2**40), 2**40, 50000),
+            rng.integers(0, 3, 50000),
+            rng.standard_normal(50001),
+        ):
+            expected = np.sort(data)
+            assert np.array_equal(parallel_sort(data, workers=workers), expected)
+            assert np.array_equal(
+                parallel_sort(data, workers=workers, reverse=True), expected[::-1]
+            )
+
+    def test_sorting_class(self, small_threshold):
+        """測試 Sorting 的並行排序介面"""
+        sorting = Sorting([4, 2, 8, 6, 0], animation_speed=0)
+        assert sorting.parallel_sort(workers=2).tolist() == [0, 2, 4, 6, 8]
+
+
+class TestSelection:
+    @pytest.fixture
+    def data(self):
+        """建立含重複值的隨機數據"""
+        rng = random.Random(7)
+        return [rng.randint(0, 200) for _ in range(3000)]
+
+    def test_select(self, data):
+        """測試內省選擇（列表、ndarray 與 key）"""
+        expected = sorted(data)
+        for kth in (0, 1, 1500, 2999, -1):
+            assert select(data, kth) == expected[kth]
+            assert select(np.array(data), kth) == expected[kth]
+            assert select(data, kth, key=lambda x: -x) == expected[::-1][kth]
+        with pytest.raises(IndexError):
+            select(data, 3000)
+
+    def test_select_sorted_input(self):
+        """測試已排序的大數組不會退化"""
+        data = list(range(200000))
+        assert select(data, 123456) == 123456
+        assert select(data[::-1], 5) == 5
+
+    @pytest.mark.parametrize("k", [0, 1, 100, 3000, 5000])
+    def test_partial_sort(self, data, k):
+        """測試部分排序的前 k 個元素"""
+        expected = sorted(data)
+        for arr in (data, np.array(data)):
+            result = partial_sort(arr, k)
+            assert list(result[:k]) == expected[:k]
+            assert sorted(result) == expected
+            result = partial_sort(arr, k, reverse=True)
+            assert list(result[:k]) == expected[::-1][:k]
+
+    def test_nsmallest_nlargest(self, data):
+        """測試前 k 小與前 k 大"""
+        expected = sorted(data)
+        assert nsmallest(data, 10) == expected[:10]
+        assert nlargest(iter(data), 10) == expected[::-1][:10]
+        assert list(nsmallest(np.array(data), 10)) == expected[:10]
+        assert list(nlargest(np.array(data), 10)) == expected[::-1][:10]
+        # 返回型別與標註一致: 列表輸入為 list，數值 ndarray 輸入為 ndarray
+        assert isinstance(nsmallest(data, 10), list)
+        assert isinstance(nlargest(np.array(data), 10), np.ndarray)
+        assert isinstance(partial_sort(np.array(data), 10), np.ndarray)
+
+    def test_top_k_stream(self, data):
+        """測試串流前 k 名的穩定性"""
+        records = [(value, i) for i, value in enumerate(data)]
+        largest = TopK(25, key=lambda r: r[0])
+        largest.extend(iter(records))
+        assert largest.result() == heapq.nlargest(25, records, key=lambda r: r[0])
+        smallest = TopK(25, key=lambda r: r[0], largest=False)
+        smallest.extend(records)
+        assert smallest.result() == heapq.nsmallest(25, records, key=lambda r: r[0])
+        assert len(smallest) == 25 and smallest.count == len(records)
+        empty = TopK(0)
+        empty.extend(data)
+        assert empty.result() == []
+
+    def test_sorting_class(self):
+        """測試 Sorting 的選擇介面"""
+        sorting = Sorting([5, 1, 4, 2, 3], animation_speed=0)
+        assert sorting.select(2) == 3
+        assert sorting.nsmallest(2) == [1, 2]
+        assert sorting.nlargest(2) == [5, 4]
+        assert sorting.partial_sort(2)[:2] == [1, 2]
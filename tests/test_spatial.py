@@ -0,0 +1,154 @@
+import numpy as np
+import pytest
+
+from mathalgo2.algorithm.spatial import KDTree, brute_force_knn, knn
+from mathalgo2.algorithm.spatial.kdtree import _brute_force_chunk
+from mathalgo2.BaseMath import Vector_space
+
+
+@pytest.fixture
+def cloud():
+    """隨機點集與查詢點"""
+    rng = np.random.default_rng(42)
+    return rng.random((2000, 3)), rng.random((300, 3))
+
+
+def _exact_knn(points, queries, k):
+    """以完整距離矩陣計算的參考答案"""
+    dist = np.linalg.norm(queries[:, None, :] - points[None, :, :], axis=2)
+    order = np.argsort(dist, axis=1, kind="stable")[:, :k]
+    return np.take_along_axis(dist, order, axis=1), order
+
+
+class TestKDTree:
+    @pytest.mark.parametrize("leaf_size", [1, 8, 32])
+    @pytest.mark.parametrize("k", [1, 5, 16])
+    def test_query_matches_exact(self, cloud, leaf_size, k):
+        """測試 kNN 結果與完整距離矩陣一致"""
+        points, queries = cloud
+        tree = KDTree(points, leaf_size=leaf_size)
+        dist, idx = tree.query(queries, k)
+        ref_dist, ref_idx = _exact_knn(points, queries, k)
+        assert dist.shape == idx.shape == (len(queries), k)
+        assert np.allclose(dist, ref_dist)
+        assert np.array_equal(idx, ref_idx)
+
+    def test_query_returns_indices_only(self, cloud):
+        """測試 return_distance=False 只返回索引"""
+        points, queries = cloud
+        idx = KDTree(points).query(queries, 3, return_distance=False)
+        assert np.array_equal(idx, _exact_knn(points, queries, 3)[1])
+
+    def test_k_larger_than_points(self):
+        """測試 k 超過點數時返回全部點"""
+        points = np.array([[0.0, 0.0], [1.0, 0.0], [3.0, 0.0]])
+        dist, idx = KDTree(points).query([[0.9, 0.0]], k=10)
+        assert idx.tolist() == [[1, 0, 2]]
+        assert np.allclose(dist, [[0.1, 0.9, 2.1]])
+
+    def test_duplicate_points(self):
+        """測試大量重複點（無法切分的節點成為葉）"""
+        points = np.vstack([np.zeros((100, 2)), np.ones((100, 2))])
+        dist, idx = KDTree(points, leaf_size=4).query([[0.1, 0.1]], k=5)
+        assert np.all(idx < 100)
+        assert np.allclose(dist, np.hypot(0.1, 0.1))
+
+    def test_query_radius(self, cloud):
+        """測試半徑查詢返回範圍內所有點並依距離排序"""
+        points, queries = cloud
+        tree = KDTree(points, leaf_size=16)
+        indices, distances = tree.query_radius(queries, 0.1, return_distance=True)
+        assert len(indices) == len(queries)
+        full = np.linalg.norm(queries[:, None, :] - points[None, :, :], axis=2)
+        for row, idx, dist in zip(full, indices, distances):
+            assert set(idx.tolist()) == set(np.flatnonzero(row <= 0.1).tolist())
+            assert np.allclose(dist, row[idx])
+            assert np.all(np.diff(dist) >= 0)
+
+    def test_query_radius_empty(self, cloud):
+        """測試半徑內沒有點時返回空陣列"""
+        points, _ = cloud
+        indices = KDTree(points).query_radius([[5.0, 5.0, 5.0]], 0.5)
+        assert len(indices) == 1 and len(indices[0]) == 0
+
+    def test_from_vectors(self):
+        """測試由 Vector_space 建立並查詢"""
+        vectors = [Vector_space([0, 0]), Vector_space([3, 4]), Vector_space([1, 1])]
+        tree = KDTree.from_vectors(vectors)
+        assert len(tree) == 3 and tree.dimension == 2
+        dist, idx = tree.query([Vector_space([2, 3])], k=1)
+        assert idx.tolist() == [[1]]
+        assert np.isclose(dist[0, 0], np.sqrt(2))
+
+    def test_invalid_arguments(self, cloud):
+        """測試無效參數"""
+        points, _ = cloud
+        with pytest.raises(ValueError):
+            KDTree(np.empty((0, 3)))
+        with pytest.raises(ValueError):
+            KDTree(points, leaf_size=0)
+        tree = KDTree(points)
+        with pytest.raises(ValueError):
+            tree.query([[0.0, 0.0]], k=1)
+        with pytest.raises(ValueError):
+            tree.query(points[:2], k=0)
+        with pytest.raises(ValueError):
+            tree.query_radius(points[:2], -1.0)
+
+
+class TestBruteForce:
+    def test_matches_exact(self, cloud):
+        """測試暴力搜尋與完整距離矩陣一致，且分批不影響結果"""
+        points, queries = cloud
+        dist, idx = brute_force_knn(points, queries, k=7, chunk_size=64)
+        ref_dist, ref_idx = _exact_knn(points, queries, 7)
+        assert np.allclose(dist, ref_dist)
+        assert np.array_equal(idx, ref_idx)
+
+    def test_memory_budget(self, cloud):
+        """測試每批的查詢數由記憶體預算推算，結果不受影響"""
+        points, queries = cloud
+        assert _brute_force_chunk(len(points), 16 * len(points) * 10) == 10
+        assert _brute_force_chunk(100, 8 * (200 + 60) * 3, candidates=60) == 3
+        # 預算不足一個查詢時仍至少處理一個
+        assert _brute_force_chunk(10**9, 1 << 20) == 1
+        dist, idx = brute_force_knn(points, queries, k=3, memory_bytes=1)
+        ref_dist, ref_idx = _exact_knn(points, queries, 3)
+        assert np.allclose(dist, ref_dist)
+        assert np.array_equal(idx, ref_idx)
+        with pytest.raises(ValueError):
+            brute_force_knn(points, queries, chunk_size=0)
+
+    def test_offset_data(self):
+        """測試座標遠離原點時結果仍與精確計算一致"""
+        rng = np.random.default_rng(21)
+        points = rng.random((1000, 20)) + 1e6
+        queries = rng.random((200, 20)) + 1e6
+        dist, idx = brute_force_knn(points, queries, k=5)
+        ref_dist, ref_idx = _exact_knn(points, queries, 5)
+        assert np.array_equal(idx, ref_idx)
+        assert np.allclose(dist, ref_dist, rtol=0, atol=1e-9)
+        assert np.array_equal(knn(points, queries, k=5)[1], ref_idx)
+
+    def test_dimension_mismatch(self, cloud):
+        """測試維度不符"""
+        points, _ = cloud
+        with pytest.raises(ValueError):
+            brute_force_knn(points, [[0.0, 0.0]])
+
+    @pytest.mark.parametrize("method", ["auto", "kdtree", "brute"])
+    def test_knn_methods_agree(self, method):
+        """測試 knn 各方法結果一致（含自動切換到暴力搜尋的高維度）"""
+        rng = np.random.default_rng(0)
+        for dim in (2, 24):
+            points, queries = rng.random((500, dim)), rng.random((40, dim))
+            dist, idx = knn(points, queries, k=4, method=method)
+            ref_dist, ref_idx = _exact_knn(points, queries, 4)
+            assert np.allclose(dist, ref_dist)
+            assert np.array_equal(idx, ref_idx)
+
+    def test_knn_invalid_method(self, cloud):
+        """測試不支援的方法"""
+        points, queries = cloud
+        with pytest.raises(ValueError):
+            knn(points, queries, method="ball")
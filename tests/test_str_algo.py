@@ -1,6 +1,7 @@
 import pytest
 
 from mathalgo2.algorithm.StrAlgo import StrAlgo
+from mathalgo2.algorithm.string.AhoCorasick import AhoCorasick
 
 
 class TestStrAlgo:
@@ -54,3 +55,27 @@ def test_multiple_matches(self):
         assert len(kmp_matches) == 4  # 應該找到4個匹配
         assert kmp_matches == [0, 2, 4, 6]  # ABA 在 ABABABABAB 中出現的位置
         assert rk_matches == kmp_matches
+
+    def test_aho_corasick_search(self, str_algo_instance):
+        """測試 Aho-Corasick 多模式搜尋"""
+        assert str_algo_instance.aho_corasick_search() == [(10, 0)]
+        matches = str_algo_instance.aho_corasick_search(["ABAB", "CAB", "ABC"])
+        assert sorted(matches) == [(0, 0), (10, 0), (12, 2), (14, 1), (15, 0)]
+
+    def test_aho_corasick_reuses_automaton(self, str_algo_instance):
+        """測試相同的模式只建立一次自動機，也可傳入預先建立的自動機"""
+        str_algo_instance.aho_corasick_search(["ABAB", "CAB"])
+        cached = str_algo_instance._automaton[1]
+        str_algo_instance.aho_corasick_search(("ABAB", "CAB"))
+        assert str_algo_instance._automaton[1] is cached
+        str_algo_instance.aho_corasick_search(["CAB"])
+        assert str_algo_instance._automaton[1] is not cached
+
+        prebuilt = AhoCorasick(["ABC"])
+        assert str_algo_instance.aho_corasick_search(prebuilt) == [(12, 0)]
+
+    def test_build_index(self, str_algo_instance):
+        """測試建立後綴數組索引"""
+        index = str_algo_instance.build_index()
+        assert index.count("ABAB") == 3
+        assert index.locate("ABABC").tolist() == str_algo_instance.kmp_search()
@@ -0,0 +1,98 @@
+import io
+import random
+
+import pytest
+
+from mathalgo2.algorithm.string.AhoCorasick import AhoCorasick
+from mathalgo2.algorithm.string.KMP import KMP
+from mathalgo2.algorithm.string.StreamSearch import (
+    AhoCorasickStream,
+    KMPStream,
+    read_chunks,
+)
+
+
+def random_chunks(text, rng):
+    """把文本切成隨機長度（含空區塊）的片段"""
+    chunks, start = [], 0
+    while start < len(text):
+        size = rng.randint(0, 5)
+        chunks.append(text[start : start + size])
+        start += size
+    return chunks
+
+
+class TestKMPStream:
+    def test_match_across_boundary(self):
+        """測試跨越區塊邊界的匹配與絕對位置"""
+        stream = KMPStream("ABABC")
+        assert stream.feed("ABABDABACDAB") == []
+        assert stream.feed("ABCAB") == [10]
+        assert stream.offset == 17
+        assert stream.state == 2
+
+    def test_random_chunks_match_full_search(self):
+        """測試任意切分的結果與一次搜尋整個文本相同"""
+        rng = random.Random(3)
+        for _ in range(100):
+            text = "".join(rng.choice("ab") for _ in range(rng.randint(0, 60)))
+            pattern = "".join(rng.choice("ab") for _ in range(rng.randint(1, 4)))
+            stream = KMPStream(pattern)
+            chunks = random_chunks(text, rng)
+            assert list(stream.finditer(chunks)) == KMP(pattern).search(text)
+
+    def test_binary_file(self):
+        """測試以 read_chunks 讀取二進位檔案，位置以位元組計"""
+        data = b"\x00" * 1000 + "測試".encode("utf-8") + b"\xff" * 1000
+        stream = KMPStream("測試")
+        matches = list(stream.finditer(read_chunks(io.BytesIO(data), chunk_size=7)))
+        assert matches == [1000]
+
+    def test_mixed_chunk_types(self):
+        """測試區塊型別不一致時拋出錯誤，reset 後可重新開始"""
+        stream = KMPStream("ab")
+        stream.feed("xa")
+        with pytest.raises(TypeError):
+            stream.feed(b"b")
+        stream.reset()
+        assert stream.feed(b"ab") == [0]
+
+
+class TestAhoCorasickStream:
+    def test_match_across_boundary(self):
+        """測試多模式跨區塊匹配"""
+        stream = AhoCorasickStream(["he", "she", "his", "hers"])
+        assert stream.feed("us") == []
+        assert stream.feed("h") == []
+        assert stream.feed("ers") == [(1, 1), (2, 0), (2, 3)]
+
+    def test_random_chunks_match_full_search(self):
+        """測試任意切分的結果與一次搜尋整個文本相同"""
+        rng = random.Random(5)
+        for _ in range(100):
+            patterns = [
+                "".join(rng.choice("abc") for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(1, 6))
+            ]
+            text = "".join(rng.choice("abc") for _ in range(rng.randint(0, 60)))
+            stream = AhoCorasickStream(patterns)
+            matches = list(stream.finditer(random_chunks(text, rng)))
+            assert matches == AhoCorasick(patterns).search(text)
+
+    def test_text_file(self):
+        """測試以 read_chunks 讀取文字檔"""
+        source = io.StringIO("INFO ok\nERROR disk\nWARN cpu\nERROR net\n")
+        stream = AhoCorasickStream(["ERROR", "WARN"])
+        matches = list(stream.finditer(read_chunks(source, chunk_size=4)))
+        assert matches == [(8, 0), (19, 1), (28, 0)]
+
+    def test_type_mismatch(self):
+        """測試區塊型別與模式不符"""
+        with pytest.raises(TypeError):
+            AhoCorasickStream([b"ab"]).feed("ab")
+        # str 模式搜尋二進位區塊時以 UTF-8 編碼比對
+        stream = AhoCorasickStream(["測試"])
+        data = "..測試".encode("utf-8")
+        assert list(stream.finditer([data[:4], data[4:]])) == [(2, 0)]
+        with pytest.raises(ValueError):
+            list(read_chunks(io.BytesIO(b"ab"), chunk_size=0))
@@ -130,3 +130,20 @@ def test_graph_operations(self):
 
         graph.remove_vertex("B")
         assert "B" not in graph.graph
+
+    def test_weighted_adjacency_sets(self):
+        graph = Graph()
+        graph.add_edge("A", "B", 2.0)
+        graph.add_edge("C", "B")
+        graph.add_edge("B", "B")
+        graph.add_edge("A", "B", 5.0)
+
+        assert graph.weight("A", "B") == 5.0
+        assert graph.predecessors("B") == {"A", "B", "C"}
+        assert list(graph.successors("A")) == ["B"]
+
+        # 刪除節點時同時移除所有入邊與出邊
+        graph.remove_vertex("B")
+        assert graph.graph == {"A": {}, "C": {}}
+        assert not graph.has_edge("A", "B")
+        assert graph.predecessors("A") == set()
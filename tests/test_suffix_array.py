@@ -0,0 +1,82 @@
+import random
+
+import numpy as np
+import pytest
+
+from mathalgo2.algorithm.string.SuffixArray import SuffixArray
+
+
+def naive_suffix_array(text):
+    """以排序所有後綴得到的參考答案"""
+    return sorted(range(len(text)), key=lambda i: text[i:])
+
+
+def naive_lcp(text, sa):
+    """逐字比對相鄰後綴的參考 LCP"""
+    lcp = [0] * len(sa)
+    for i in range(1, len(sa)):
+        a, b = text[sa[i - 1] :], text[sa[i] :]
+        while lcp[i] < min(len(a), len(b)) and a[lcp[i]] == b[lcp[i]]:
+            lcp[i] += 1
+    return lcp
+
+
+class TestSuffixArray:
+    def test_banana(self):
+        """測試經典範例"""
+        index = SuffixArray("banana")
+        assert index.sa.tolist() == [5, 3, 1, 0, 4, 2]
+        assert index.lcp.tolist() == [0, 1, 3, 0, 0, 2]
+        assert index.count("ana") == 2
+        assert index.locate("ana").tolist() == [1, 3]
+        assert index.locate("x").tolist() == []
+        assert index.contains("nan") and not index.contains("nab")
+        assert index.longest_repeated_substring() == "ana"
+        assert index.distinct_substrings() == 15
+
+    def test_random_against_naive(self):
+        """測試隨機文本的後綴數組、LCP 與查詢"""
+        rng = random.Random(11)
+        for _ in range(100):
+            text = "".join(rng.choice("ab") for _ in range(rng.randint(1, 50)))
+            index = SuffixArray(text)
+            sa = naive_suffix_array(text)
+            assert index.sa.tolist() == sa
+            assert index.lcp.tolist() == naive_lcp(text, sa)
+            substrings = {
+                text[i:j] for i in range(len(text)) for j in range(i + 1, len(text) + 1)
+            }
+            assert index.distinct_substrings() == len(substrings)
+            pattern = "".join(rng.choice("ab") for _ in range(rng.randint(1, 4)))
+            expected = [i for i in range(len(text)) if text.startswith(pattern, i)]
+            assert index.locate(pattern).tolist() == expected
+
+    def test_edge_cases(self):
+        """測試空文本、單一字元與無重複的文本"""
+        empty = SuffixArray("")
+        assert empty.count("a") == 0
+        assert empty.longest_repeated_substring() == ""
+        assert empty.distinct_substrings() == 0
+        assert SuffixArray("aaaa").longest_repeated_substring() == "aaa"
+        assert SuffixArray("abcd").longest_repeated_substring() == ""
+
+    def test_unicode_and_bytes(self):
+        """測試 Unicode 文本與 bytes 文本（位置以位元組計）"""
+        assert SuffixArray("測試字串測試").locate("測試").tolist() == [0, 4]
+        index = SuffixArray("測試字串測試".encode("utf-8"))
+        assert index.locate("測試").tolist() == [0, 12]
+        assert index.count(b"\xe6") == 2
+        with pytest.raises(TypeError):
+            SuffixArray("abc").count(b"a")
+
+    @pytest.mark.parametrize("text", ["mississippi 測試", b"mississippi\x00\xff"])
+    def test_save_and_load(self, tmp_path, text):
+        """測試存檔後載入得到相同的索引"""
+        index = SuffixArray(text)
+        path = tmp_path / "index.npz"
+        index.save(path)
+        loaded = SuffixArray.load(path)
+        assert loaded.text == index.text
+        assert np.array_equal(loaded.sa, index.sa)
+        assert np.array_equal(loaded.lcp, index.lcp)
+        assert loaded.count("ssi") == 2